@@ -3,17 +3,31 @@ from fastapi.params import Depends
 
 from app.id.public.user_by_token import UserByToken
 from app.id.user._auth import oauth2_scheme, verify_token
+from app.id.user._revocation import token_revocations
 
 
-async def get_user_by_token(token: str = Depends(oauth2_scheme)):
-    """Dependency to get current authenticated user."""
+async def get_token_claims(token: str = Depends(oauth2_scheme)) -> dict:
+    """
+    Dependency to get the claims of a valid, unrevoked access token. Verified
+    once per request, however many dependencies need them.
+    """
     payload = verify_token(token)
-    email: str = payload.get("sub")
-    if email is None:
+    if (
+        payload.get("sub") is None
+        or payload.get("uid") is None
+        or payload.get("jti") is None
+        or token_revocations.is_revoked(
+            payload["jti"], payload["uid"], payload.get("iat", 0)
+        )
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return payload
 
-    return UserByToken(email=email, name=payload.get("name"))
+
+async def get_user_by_token(claims: dict = Depends(get_token_claims)):
+    """Dependency to get current authenticated user."""
+    return UserByToken(id=claims["uid"], email=claims["sub"], name=claims.get("name"))
@@ -0,0 +1,15 @@
+from fastapi.params import Depends
+from sqlalchemy.orm import Session
+
+from app.id.public.get_user_by_token import get_user_by_token
+from app.id.public.user_by_token import UserByToken
+from app.infra.database import get_db, get_read_db, route_read
+
+
+def get_user_read_db(
+    current_user: UserByToken = Depends(get_user_by_token),
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),
+) -> Session:
+    """Dependency to get a read session that sees the current user's own writes."""
+    return route_read(current_user.email, db, read_db)
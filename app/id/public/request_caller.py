@@ -0,0 +1,29 @@
+import hashlib
+
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.id.user._auth import verify_token
+from app.id.user._revocation import token_revocations
+
+
+def request_caller(request: Request) -> str:
+    """
+    Who sent the request, stable across token refreshes: the user id of a
+    valid bearer token. Anonymous requests share "", and invalid or revoked
+    tokens are told apart by a hash of the header.
+    """
+    authorization = request.headers.get("Authorization", "")
+    if not authorization:
+        return ""
+    scheme, _, token = authorization.partition(" ")
+    try:
+        payload = verify_token(token) if scheme.lower() == "bearer" else {}
+    except HTTPException:
+        payload = {}
+    user = payload.get("uid") or payload.get("sub")
+    if user is not None and not token_revocations.is_revoked(
+        payload.get("jti"), payload.get("uid"), payload.get("iat", 0)
+    ):
+        return f"user:{user}"
+    return f"token:{hashlib.sha256(authorization.encode()).hexdigest()}"
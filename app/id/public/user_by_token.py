@@ -2,5 +2,6 @@ from pydantic import BaseModel
 
 
 class UserByToken(BaseModel):
+    id: int
     email: str
     name: str
@@ -1,4 +1,5 @@
 import os
+import uuid
 from datetime import datetime, timedelta, timezone
 
 from fastapi import HTTPException, status
@@ -37,9 +38,14 @@ def create_access_token(data: dict):
     """Create a JWT access token."""
     to_encode = data.copy()
 
-    expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    issued_at = datetime.now(timezone.utc)
+    expire = issued_at + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    to_encode.update({"exp": expire})
+    # jti identifies the token for logout; iat (with fractions of a second)
+    # is compared against the user's revoke-all cutoff
+    to_encode.update(
+        {"exp": expire, "iat": issued_at.timestamp(), "jti": uuid.uuid4().hex}
+    )
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
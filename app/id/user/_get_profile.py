@@ -8,4 +8,6 @@ async def get_user_profile(
     current_user: UserByToken = Depends(get_user_by_token),
 ) -> UserByToken:
     """Get current user profile (protected endpoint example)."""
-    return UserByToken(email=current_user.email, name=current_user.name)
+    return UserByToken(
+        id=current_user.id, email=current_user.email, name=current_user.name
+    )
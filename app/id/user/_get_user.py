@@ -0,0 +1,48 @@
+import os
+
+from fastapi import HTTPException, Request, status
+from fastapi.params import Depends
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from app.id.public.get_user_by_token import get_user_by_token
+from app.id.public.get_user_read_db import get_user_read_db
+from app.id.public.user_by_token import UserByToken
+from app.id.user._repository import get_user_by_id
+from app.infra.response_cache import ResponseCache
+
+USER_CACHE_BYTES = int(os.getenv("USER_CACHE_BYTES", str(4 * 1024 * 1024)))
+
+# Users are not modified after registration, so every body stays at version 0
+user_cache = ResponseCache("user", USER_CACHE_BYTES)
+user_adapter = TypeAdapter(UserByToken)
+
+
+def get_user(
+    user_id: int,
+    request: Request,
+    db: Session = Depends(get_user_read_db),
+    current_user: UserByToken = Depends(get_user_by_token),
+):
+    """
+    Get the current user by id. Other ids return 404 without touching the
+    database.
+    """
+    if user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    entry = user_cache.get(user_id, 0)
+    if entry is None:
+        user = get_user_by_id(db, user_id)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+        body = user_adapter.dump_json(
+            UserByToken(id=user.id, email=user.email, name=user.name)
+        )
+        entry = user_cache.put(user_id, 0, body)
+    return user_cache.response(
+        user_id, entry, request.headers.get("accept-encoding", "")
+    )
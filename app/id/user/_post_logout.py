@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+
+from fastapi import Depends, Response, status
+from sqlalchemy.orm import Session
+
+from app.id.public.get_user_by_token import get_token_claims, get_user_by_token
+from app.id.public.user_by_token import UserByToken
+from app.id.user._revocation import revoke_all_tokens, revoke_token
+from app.infra.database import get_db
+
+
+def post_logout(
+    claims: dict = Depends(get_token_claims),
+    db: Session = Depends(get_db),
+    current_user: UserByToken = Depends(get_user_by_token),
+):
+    """Revoke the token used for this request."""
+    revoke_token(
+        db,
+        jti=claims["jti"],
+        user_id=current_user.id,
+        expires_at=datetime.fromtimestamp(claims["exp"], timezone.utc),
+    )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def post_logout_all(
+    db: Session = Depends(get_db),
+    current_user: UserByToken = Depends(get_user_by_token),
+):
+    """Revoke every token issued to the current user so far."""
+    revoke_all_tokens(db, current_user.id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
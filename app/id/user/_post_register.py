@@ -6,7 +6,8 @@ from app.id.user._auth import get_password_hash
 from app.id.user._repository import get_user_by_username
 from app.id.user._user import User
 from app.id.user._user_create import UserCreate
-from app.infra.database import get_db
+from app.infra.audit import audit_log
+from app.infra.database import get_db, mark_write
 from app.util.exceptions import DomainException
 
 
@@ -20,7 +21,9 @@ def post_register(user: UserCreate, db: Session = Depends(get_db)):
     db_user.update_password(get_password_hash(user.password))
     db.add(db_user)
     db.commit()
+    mark_write(db_user.email)
     db.refresh(db_user)
+    audit_log.record("user_registered", user_id=db_user.id, subject=db_user.email)
     return JSONResponse(
-        status_code=201, content=None, headers={"Location": f"/users/{db_user.id}"}
+        status_code=201, content=None, headers={"Location": f"/user/{db_user.id}"}
     )
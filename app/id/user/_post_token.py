@@ -1,4 +1,4 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
@@ -7,7 +7,8 @@ from app.id.user._auth import (
     authenticate_user,
     create_access_token,
 )
-from app.infra.database import get_db
+from app.infra.audit import audit_log
+from app.infra.database import get_db, get_read_db, route_read
 
 
 class TokenResponse(BaseModel):
@@ -15,17 +16,35 @@ class TokenResponse(BaseModel):
     token_type: str
 
 
+def get_login_db(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),
+) -> Session:
+    """Read session for the user lookup, on the primary right after registration."""
+    return route_read(form_data.username, db, read_db)
+
+
 async def token(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+    request: Request,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: Session = Depends(get_login_db),
 ):
     """Endpoint to authenticate user and return access token."""
     user = authenticate_user(db, form_data.username, form_data.password)
+    client = {"ip": request.client.host if request.client else None}
     if not user:
+        audit_log.record("login_failed", subject=form_data.username, data=client)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token = create_access_token(data={"sub": user.email, "name": user.name})
+    audit_log.record(
+        "login_succeeded", user_id=user.id, subject=user.email, data=client
+    )
+    access_token = create_access_token(
+        data={"sub": user.email, "name": user.name, "uid": user.id}
+    )
     return TokenResponse(access_token=access_token, token_type="bearer")
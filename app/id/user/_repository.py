@@ -1,7 +1,18 @@
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from app.id.user._user import User
+from app.infra.database import PreparedStatement
+
+# Runs on every login and registration
+_user_by_email = PreparedStatement(
+    "id_user_by_email", select(User).where(User.email == bindparam("email")).limit(1)
+)
 
 
 def get_user_by_username(db: Session, email: str):
-    return db.query(User).filter(User.email == email).first()
+    return _user_by_email.execute(db, entity=User, email=email).scalars().first()
+
+
+def get_user_by_id(db: Session, user_id: int):
+    return db.get(User, user_id)
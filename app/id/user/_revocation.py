@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import anyio.to_thread
+from sqlalchemy import Column, DateTime, Integer, String, delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.id.user._auth import ACCESS_TOKEN_EXPIRE_MINUTES
+from app.infra.database import Base, SessionLocal
+from app.infra.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+TOKEN_REVOCATION_SYNC_SECONDS = float(os.getenv("TOKEN_REVOCATION_SYNC_SECONDS", "1"))
+# How often each worker deletes expired rows; they are never read, so rarely
+TOKEN_REVOCATION_PRUNE_SECONDS = float(
+    os.getenv("TOKEN_REVOCATION_PRUNE_SECONDS", "3600")
+)
+# Readiness fails while the last successful sync is older than this, so a
+# worker that cannot see other workers' logouts stops taking traffic
+TOKEN_REVOCATION_MAX_STALENESS_SECONDS = float(
+    os.getenv("TOKEN_REVOCATION_MAX_STALENESS_SECONDS", "10")
+)
+# Rows committed late can carry an older revoked_at; re-read this far back
+SYNC_OVERLAP = timedelta(seconds=30)
+TOKEN_LIFETIME = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+
+
+class RevokedToken(Base):
+    """A single logged-out token, kept until it would have expired anyway."""
+
+    __tablename__ = "revoked_tokens"
+    __table_args__ = {"schema": "id"}
+
+    jti = Column(String(32), primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    revoked_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), index=True
+    )
+
+
+class TokenCutoff(Base):
+    """Tokens of the user issued before `issued_before` are revoked."""
+
+    __tablename__ = "token_cutoffs"
+    __table_args__ = {"schema": "id"}
+
+    user_id = Column(Integer, primary_key=True)
+    issued_before = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    updated_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), index=True
+    )
+
+
+def revoke_token(db: Session, jti: str, user_id: int, expires_at: datetime):
+    db.execute(
+        insert(RevokedToken)
+        .values(jti=jti, user_id=user_id, expires_at=expires_at)
+        .on_conflict_do_nothing()
+    )
+    db.commit()
+    token_revocations.add_token(jti, expires_at.timestamp())
+
+
+def revoke_all_tokens(db: Session, user_id: int):
+    now = datetime.now(timezone.utc)
+    values = {
+        "issued_before": now,
+        "expires_at": now + TOKEN_LIFETIME,
+        "updated_at": func.now(),
+    }
+    db.execute(
+        insert(TokenCutoff)
+        .values(user_id=user_id, **values)
+        .on_conflict_do_update(index_elements=[TokenCutoff.user_id], set_=values)
+    )
+    db.commit()
+    token_revocations.add_cutoff(
+        user_id, now.timestamp(), (now + TOKEN_LIFETIME).timestamp()
+    )
+
+
+class TokenRevocations:
+    """
+    In-memory copy of the revocations of tokens that have not expired yet.
+
+    Tokens are short-lived, so the set stays small and can be exact: a
+    lookup is a dict access per request and never touches the database.
+    Revocations made by this process apply at once; those made by other
+    workers arrive with the next incremental sync. Until a first sync has
+    succeeded, or once the last one is older than `max_staleness`, `check`
+    fails so the worker is reported not ready.
+    """
+
+    def __init__(
+        self,
+        interval: float = TOKEN_REVOCATION_SYNC_SECONDS,
+        prune_interval: float = TOKEN_REVOCATION_PRUNE_SECONDS,
+        max_staleness: float = TOKEN_REVOCATION_MAX_STALENESS_SECONDS,
+    ):
+        self.interval = interval
+        self.prune_interval = prune_interval
+        self.max_staleness = max_staleness
+        # jti -> token expiry (epoch seconds)
+        self._tokens: dict[str, float] = {}
+        # user id -> (issued_before, expiry of the cutoff) in epoch seconds
+        self._cutoffs: dict[int, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._synced_tokens_at: datetime | None = None
+        self._synced_cutoffs_at: datetime | None = None
+        # Workers start at different times, so their deletes are spread out
+        self._pruned_at = time.monotonic()
+        self._created_at = time.monotonic()
+        self._synced_at: float | None = None
+        self._task: asyncio.Task | None = None
+        self._failing = False
+
+    def __len__(self) -> int:
+        return len(self._tokens) + len(self._cutoffs)
+
+    def is_revoked(self, jti: str, user_id: int, issued_at: float) -> bool:
+        if jti in self._tokens:
+            return True
+        cutoff = self._cutoffs.get(user_id)
+        return cutoff is not None and issued_at < cutoff[0]
+
+    def add_token(self, jti: str, expires_at: float):
+        with self._lock:
+            self._tokens[jti] = expires_at
+
+    def add_cutoff(self, user_id: int, issued_before: float, expires_at: float):
+        with self._lock:
+            current = self._cutoffs.get(user_id)
+            if current is None or current[0] < issued_before:
+                self._cutoffs[user_id] = (issued_before, expires_at)
+
+    def prune(self):
+        """Forget revocations of tokens that have expired by now."""
+        now = time.time()
+        with self._lock:
+            for jti in [jti for jti, exp in self._tokens.items() if exp <= now]:
+                del self._tokens[jti]
+            for user_id in [
+                user_id for user_id, (_, exp) in self._cutoffs.items() if exp <= now
+            ]:
+                del self._cutoffs[user_id]
+
+    def sync(self, db: Session):
+        """
+        Load revocations made since the last sync, and delete expired rows
+        once every `prune_interval`.
+        """
+        now = datetime.now(timezone.utc)
+        tokens = select(RevokedToken).where(RevokedToken.expires_at > now)
+        if self._synced_tokens_at is not None:
+            tokens = tokens.where(
+                RevokedToken.revoked_at > self._synced_tokens_at - SYNC_OVERLAP
+            )
+        for row in db.scalars(tokens):
+            self.add_token(row.jti, row.expires_at.timestamp())
+            self._synced_tokens_at = max(
+                self._synced_tokens_at or row.revoked_at, row.revoked_at
+            )
+
+        cutoffs = select(TokenCutoff).where(TokenCutoff.expires_at > now)
+        if self._synced_cutoffs_at is not None:
+            cutoffs = cutoffs.where(
+                TokenCutoff.updated_at > self._synced_cutoffs_at - SYNC_OVERLAP
+            )
+        for row in db.scalars(cutoffs):
+            self.add_cutoff(
+                row.user_id, row.issued_before.timestamp(), row.expires_at.timestamp()
+            )
+            self._synced_cutoffs_at = max(
+                self._synced_cutoffs_at or row.updated_at, row.updated_at
+            )
+
+        # Expired rows are never loaded, so they only cost disk; any worker
+        # may delete them, but none needs to do it often
+        if time.monotonic() - self._pruned_at >= self.prune_interval:
+            db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+            db.execute(delete(TokenCutoff).where(TokenCutoff.expires_at <= now))
+            self._pruned_at = time.monotonic()
+        db.commit()
+        self._synced_at = time.monotonic()
+
+    def sync_age(self) -> float:
+        """Seconds since the last successful sync, or since creation."""
+        return time.monotonic() - (self._synced_at or self._created_at)
+
+    def check(self):
+        """Readiness check: fail until synced, and while syncs are stale."""
+        if self._synced_at is None:
+            raise RuntimeError("token revocations not synced yet")
+        if self.sync_age() > self.max_staleness:
+            raise RuntimeError(f"token revocations {self.sync_age():.0f}s stale")
+
+    def _sync_once(self):
+        db = SessionLocal()
+        try:
+            self.sync(db)
+            if self._failing:
+                logger.info("Token revocation sync recovered")
+            self._failing = False
+        except Exception as exc:
+            db.rollback()
+            metrics.increment("token_revocation_sync_failures_total")
+            if not self._failing:
+                logger.warning(f"Token revocation sync failed: {exc!r}")
+            self._failing = True
+        finally:
+            db.close()
+            self.prune()
+
+    async def _run_forever(self):
+        while True:
+            await anyio.to_thread.run_sync(self._sync_once, abandon_on_cancel=True)
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+token_revocations = TokenRevocations()
+metrics.gauge("token_revocations_cached", lambda: len(token_revocations))
+metrics.gauge("token_revocations_sync_age_seconds", token_revocations.sync_age)
@@ -2,6 +2,8 @@ from fastapi import APIRouter
 
 from app.id.public.user_by_token import UserByToken
 from app.id.user._get_profile import get_user_profile
+from app.id.user._get_user import get_user
+from app.id.user._post_logout import post_logout, post_logout_all
 from app.id.user._post_register import post_register
 from app.id.user._post_token import TokenResponse, token
 
@@ -36,3 +38,35 @@ user_router.add_api_route(
     summary="Get User Profile",
     description="Get User Profile (protected endpoint example).",
 )
+
+user_router.add_api_route(
+    "/logout",
+    endpoint=post_logout,
+    methods=["POST"],
+    status_code=204,
+    response_model=None,
+    tags=["Logout"],
+    summary="Logout",
+    description="Revoke the access token used for this request.",
+)
+
+user_router.add_api_route(
+    "/logout-all",
+    endpoint=post_logout_all,
+    methods=["POST"],
+    status_code=204,
+    response_model=None,
+    tags=["Logout"],
+    summary="Logout from all sessions",
+    description="Revoke every access token issued to the current user so far.",
+)
+
+user_router.add_api_route(
+    "/{user_id:int}",
+    endpoint=get_user,
+    methods=["GET"],
+    response_model=UserByToken,
+    tags=["User Profile"],
+    summary="Get User",
+    description="Get the current user by id; other users' ids return 404.",
+)
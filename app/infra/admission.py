@@ -0,0 +1,197 @@
+import asyncio
+import os
+import time
+from collections import deque
+
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from app.infra.metrics import metrics
+
+# Requests running at once per route class; 0 disables admission control there
+ADMISSION_AUTH_LIMIT = int(os.getenv("ADMISSION_AUTH_LIMIT", "4"))
+ADMISSION_READ_LIMIT = int(os.getenv("ADMISSION_READ_LIMIT", "32"))
+ADMISSION_WRITE_LIMIT = int(os.getenv("ADMISSION_WRITE_LIMIT", "16"))
+# Requests allowed to wait for a slot per route class
+ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", "64"))
+# CoDel: acceptable queueing delay, and how long it may be exceeded
+ADMISSION_QUEUE_TARGET_MS = float(os.getenv("ADMISSION_QUEUE_TARGET_MS", "50"))
+ADMISSION_QUEUE_INTERVAL_MS = float(os.getenv("ADMISSION_QUEUE_INTERVAL_MS", "500"))
+ADMISSION_RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "1"))
+
+# Never shed: they are cheap and orchestrators rely on them under load.
+# Event streams are long-lived and would hold a slot for their whole life.
+CHEAP_PATHS = (
+    "/health",
+    "/metrics",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/account/events",
+)
+# Password hashing makes these the most expensive requests
+AUTH_PATHS = {"/user/token", "/user/register"}
+
+
+def classify(method: str, path: str) -> str:
+    """Route class of a request: cheap, auth, read or write."""
+    path = path.rstrip("/") or "/"
+    if path.startswith(CHEAP_PATHS):
+        return "cheap"
+    if path in AUTH_PATHS:
+        return "auth"
+    if method in ("GET", "HEAD", "OPTIONS"):
+        return "read"
+    return "write"
+
+
+class AdmissionQueue:
+    """
+    Concurrency limit with a bounded FIFO queue for one route class.
+
+    Queueing delay is tracked CoDel-style: once every request admitted over
+    `interval` seconds waited longer than `target`, the class is overloaded
+    and queued requests give up after `target` instead of `interval`. It
+    recovers as soon as a request is admitted within the target. Only
+    touched from the event loop, so it needs no locking.
+    """
+
+    def __init__(
+        self, name: str, limit: int, max_queue: int, target: float, interval: float
+    ):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.target = target
+        self.interval = interval
+        self.in_flight = 0
+        self.overloaded = False
+        self._first_above: float | None = None
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def _observe(self, delay: float):
+        if delay < self.target:
+            self._first_above = None
+            self.overloaded = False
+        elif self._first_above is None:
+            self._first_above = time.monotonic() + self.interval
+        elif time.monotonic() >= self._first_above:
+            self.overloaded = True
+        metrics.increment("admission_queue_seconds_total", delay, route_class=self.name)
+
+    async def acquire(self) -> str | None:
+        """Take a slot, waiting if needed; return the reason when shed instead."""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            self._observe(0)
+            return None
+        if len(self._waiters) >= self.max_queue:
+            return "queue_full"
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        started = time.monotonic()
+        timeout = self.target if self.overloaded else self.interval
+        try:
+            await asyncio.wait({future}, timeout=timeout)
+        except asyncio.CancelledError:
+            # Cancelled right after being handed a slot: pass it on
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+                self._waiters.remove(future)
+        if future.cancelled():
+            return "queue_timeout"
+        # release() already counted this request as in flight
+        self._observe(time.monotonic() - started)
+        return None
+
+    def release(self):
+        """Free a slot, handing it straight to the oldest waiter if any."""
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+
+def default_queues() -> dict[str, AdmissionQueue]:
+    limits = {
+        "auth": ADMISSION_AUTH_LIMIT,
+        "read": ADMISSION_READ_LIMIT,
+        "write": ADMISSION_WRITE_LIMIT,
+    }
+    return {
+        name: AdmissionQueue(
+            name,
+            limit,
+            ADMISSION_MAX_QUEUE,
+            ADMISSION_QUEUE_TARGET_MS / 1000,
+            ADMISSION_QUEUE_INTERVAL_MS / 1000,
+        )
+        for name, limit in limits.items()
+        if limit > 0
+    }
+
+
+class AdmissionMiddleware(BaseHTTPMiddleware):
+    """
+    Shed load early with 503 and Retry-After instead of letting requests
+    pile up in the worker threads and the database pool.
+
+    Each route class has its own `AdmissionQueue`, so slow password hashing
+    cannot starve account reads, and cheap endpoints are never limited.
+    Register it before the idempotency and single-flight middlewares so
+    replayed and coalesced requests do not take a slot.
+    """
+
+    def __init__(self, app, queues: dict[str, AdmissionQueue] | None = None):
+        super().__init__(app)
+        self.queues = default_queues() if queues is None else queues
+        for name, queue in self.queues.items():
+            metrics.gauge(
+                "admission_in_flight", lambda q=queue: q.in_flight, route_class=name
+            )
+            metrics.gauge(
+                "admission_queued", lambda q=queue: q.queued, route_class=name
+            )
+            metrics.gauge(
+                "admission_overloaded",
+                lambda q=queue: float(q.overloaded),
+                route_class=name,
+            )
+
+    async def dispatch(self, request: Request, call_next):
+        route_class = classify(request.method, request.url.path)
+        queue = self.queues.get(route_class)
+        if queue is None:
+            return await call_next(request)
+
+        reason = await queue.acquire()
+        if reason is not None:
+            metrics.increment(
+                "admission_shed_total", route_class=route_class, reason=reason
+            )
+            return JSONResponse(
+                status_code=503,
+                content={
+                    "error": "Service overloaded",
+                    "details": f"Too many {route_class} requests, retry later",
+                },
+                headers={"Retry-After": str(ADMISSION_RETRY_AFTER_SECONDS)},
+            )
+
+        metrics.increment("admission_admitted_total", route_class=route_class)
+        try:
+            return await call_next(request)
+        finally:
+            queue.release()
@@ -0,0 +1,251 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import secrets
+import threading
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import anyio.to_thread
+from fastapi import Header, HTTPException, status
+
+from app.infra.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Opt-in: share of requests whose allocations are snapshotted by site; any
+# value above 0 also starts tracemalloc and tracks retained bytes per route
+ALLOCATION_PROFILE_SAMPLE = float(os.getenv("ALLOCATION_PROFILE_SAMPLE", "0"))
+# Frames kept per allocation; more attributes better but costs more memory
+ALLOCATION_PROFILE_FRAMES = int(os.getenv("ALLOCATION_PROFILE_FRAMES", "10"))
+ALLOCATION_PROFILE_TOP = int(os.getenv("ALLOCATION_PROFILE_TOP", "20"))
+# Report written periodically when set; {pid} is replaced by the worker's pid
+ALLOCATION_PROFILE_DUMP_PATH = os.getenv("ALLOCATION_PROFILE_DUMP_PATH", "")
+ALLOCATION_PROFILE_DUMP_SECONDS = float(
+    os.getenv("ALLOCATION_PROFILE_DUMP_SECONDS", "300")
+)
+
+# Required in X-Debug-Token by GET /debug/allocations; without it the report is
+# only available through the dump file
+ALLOCATION_PROFILE_TOKEN = os.getenv("ALLOCATION_PROFILE_TOKEN", "")
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Sites kept per route; the smallest are pruned beyond this
+MAX_SITES = 500
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _frame(frame) -> str:
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def _app_frame(traceback) -> str | None:
+    """The innermost frame in our own code, e.g. the handler building a list."""
+    for frame in reversed(traceback):
+        if frame.filename.startswith(APP_DIR):
+            return _frame(frame)
+    return None
+
+
+def _top_sites(sites: dict, top: int) -> list[dict]:
+    return [
+        {"site": site, "app_site": app_site, "size_bytes": size, "count": count}
+        for (site, app_site), (size, count) in sorted(
+            sites.items(), key=lambda item: item[1][0], reverse=True
+        )[:top]
+    ]
+
+
+class AllocationProfiler:
+    """
+    Attributes memory allocations to routes with tracemalloc.
+
+    Every request records how many traced bytes it left allocated. For a
+    `sample` of requests, one at a time, snapshots taken before and after are
+    compared and the growth is aggregated by allocation site: the innermost
+    frame plus the innermost frame in `app/`. Overlapping requests blur each
+    other's numbers; replay traffic with --concurrency 1 for exact ones.
+    """
+
+    def __init__(
+        self,
+        sample: float = ALLOCATION_PROFILE_SAMPLE,
+        frames: int = ALLOCATION_PROFILE_FRAMES,
+        dump_path: str = ALLOCATION_PROFILE_DUMP_PATH,
+        dump_interval: float = ALLOCATION_PROFILE_DUMP_SECONDS,
+    ):
+        self.sample = sample
+        self.frames = frames
+        self.dump_path = dump_path.replace("{pid}", str(os.getpid()))
+        self.dump_interval = dump_interval
+        self._routes: dict[str, dict] = defaultdict(
+            lambda: {"requests": 0, "retained_bytes": 0, "sampled": 0, "sites": {}}
+        )
+        self._lock = threading.Lock()
+        # Held by the one request being snapshotted
+        self.snapshot_slot = threading.Lock()
+        self._task: asyncio.Task | None = None
+
+    def _sites(self, before, after) -> dict:
+        sites: dict[tuple, list[int]] = {}
+        for diff in after.compare_to(before, "traceback"):
+            if diff.size_diff <= 0:
+                continue
+            key = (_frame(diff.traceback[-1]), _app_frame(diff.traceback))
+            site = sites.setdefault(key, [0, 0])
+            site[0] += diff.size_diff
+            site[1] += diff.count_diff
+        return sites
+
+    def record(self, route: str, retained: int, before=None, after=None):
+        sites = self._sites(before, after) if after is not None else {}
+        with self._lock:
+            stats = self._routes[route]
+            stats["requests"] += 1
+            stats["retained_bytes"] += retained
+            if not sites:
+                return
+            stats["sampled"] += 1
+            merged = stats["sites"]
+            for key, (size, count) in sites.items():
+                site = merged.setdefault(key, [0, 0])
+                site[0] += size
+                site[1] += count
+            if len(merged) > MAX_SITES:
+                largest = sorted(merged.items(), key=lambda item: item[1][0])
+                stats["sites"] = dict(largest[len(largest) - MAX_SITES // 2 :])
+
+    def snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(_IGNORED)
+
+    def report(self, top: int = ALLOCATION_PROFILE_TOP) -> dict:
+        """Per-route totals and top sites, and what is allocated right now."""
+        with self._lock:
+            routes = {
+                route: {
+                    "requests": stats["requests"],
+                    "retained_bytes": stats["retained_bytes"],
+                    "retained_bytes_per_request": stats["retained_bytes"]
+                    // stats["requests"],
+                    "sampled": stats["sampled"],
+                    "top_sites": _top_sites(stats["sites"], top),
+                }
+                for route, stats in self._routes.items()
+            }
+        current, peak = tracemalloc.get_traced_memory()
+        live = {}
+        for statistic in self.snapshot().statistics("traceback"):
+            key = (_frame(statistic.traceback[-1]), _app_frame(statistic.traceback))
+            site = live.setdefault(key, [0, 0])
+            site[0] += statistic.size
+            site[1] += statistic.count
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "pid": os.getpid(),
+            "traced_bytes": current,
+            "peak_traced_bytes": peak,
+            "routes": dict(
+                sorted(
+                    routes.items(),
+                    key=lambda item: item[1]["retained_bytes"],
+                    reverse=True,
+                )
+            ),
+            "top_sites": _top_sites(live, top),
+        }
+
+    def dump(self):
+        report = self.report()
+        with open(self.dump_path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    async def _dump_forever(self):
+        while True:
+            await asyncio.sleep(self.dump_interval)
+            try:
+                await anyio.to_thread.run_sync(self.dump)
+            except OSError as exc:
+                logger.warning(f"Could not write allocation profile: {exc!r}")
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        if self.dump_path:
+            self._task = asyncio.create_task(self._dump_forever())
+
+    async def stop(self):
+        """Write a last report, if dumping, and stop tracing."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            await anyio.to_thread.run_sync(self.dump)
+        tracemalloc.stop()
+
+
+class AllocationProfileMiddleware:
+    """Record the allocations of each request against its route template."""
+
+    def __init__(self, app, profiler: AllocationProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracemalloc.is_tracing():
+            await self.app(scope, receive, send)
+            return
+
+        sampled = random.random() < self.profiler.sample and (
+            self.profiler.snapshot_slot.acquire(blocking=False)
+        )
+        # Released however the snapshots or the request end, even cancelled
+        try:
+            before = (
+                await anyio.to_thread.run_sync(self.profiler.snapshot)
+                if sampled
+                else None
+            )
+            started = tracemalloc.get_traced_memory()[0]
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                retained = tracemalloc.get_traced_memory()[0] - started
+                route = getattr(scope.get("route"), "path_format", None)
+                key = f"{scope['method']} {route or '(unmatched)'}"
+                if before is None:
+                    self.profiler.record(key, retained)
+                else:
+                    after = await anyio.to_thread.run_sync(self.profiler.snapshot)
+                    await anyio.to_thread.run_sync(
+                        self.profiler.record, key, retained, before, after
+                    )
+        finally:
+            if sampled:
+                self.profiler.snapshot_slot.release()
+
+
+def require_debug_token(x_debug_token: str = Header("")):
+    """Dependency rejecting requests without the ALLOCATION_PROFILE_TOKEN."""
+    if not ALLOCATION_PROFILE_TOKEN or not secrets.compare_digest(
+        x_debug_token.encode(), ALLOCATION_PROFILE_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Invalid debug token"
+        )
+
+
+allocation_profiler = AllocationProfiler() if ALLOCATION_PROFILE_SAMPLE > 0 else None
+if allocation_profiler:
+    metrics.gauge(
+        "tracemalloc_traced_bytes", lambda: tracemalloc.get_traced_memory()[0]
+    )
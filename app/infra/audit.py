@@ -0,0 +1,165 @@
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, insert
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import DataError, IntegrityError
+
+from app.infra.database import Base, engine
+from app.infra.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+AUDIT_QUEUE_SIZE = int(os.getenv("AUDIT_QUEUE_SIZE", "10000"))
+AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "500"))
+AUDIT_FLUSH_INTERVAL_MS = float(os.getenv("AUDIT_FLUSH_INTERVAL_MS", "200"))
+
+# Subjects can come from the client (a login's username), so longer ones are
+# cut to fit the column
+SUBJECT_MAX_LENGTH = 128
+
+
+class AuditEvent(Base):
+    __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_audit_events_user_id_occurred_at", "user_id", "occurred_at"),
+        {"schema": "audit"},
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    occurred_at = Column(DateTime(timezone=True), nullable=False)
+    type = Column(String(32), nullable=False)
+    user_id = Column(Integer, nullable=True)
+    # Who the event is about when there is no user id, e.g. a failed login
+    subject = Column(String(SUBJECT_MAX_LENGTH), nullable=True)
+    data = Column(JSONB, nullable=True)
+
+
+class AuditLog:
+    """
+    Write-behind audit trail. Requests only put events on a bounded queue; a
+    background thread inserts them in batches of up to `batch_size` or every
+    `flush_interval` seconds. When the queue is full events are dropped and
+    counted rather than slowing requests down.
+    """
+
+    def __init__(
+        self,
+        bind=engine,
+        max_queue: int = AUDIT_QUEUE_SIZE,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL_MS / 1000,
+    ):
+        self.bind = bind
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue[dict] = queue.Queue(max_queue)
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def record(
+        self,
+        type: str,
+        user_id: int | None = None,
+        subject: str | None = None,
+        data: dict | None = None,
+    ):
+        event = {
+            "occurred_at": datetime.now(timezone.utc),
+            "type": type,
+            "user_id": user_id,
+            "subject": subject[:SUBJECT_MAX_LENGTH] if subject else subject,
+            "data": data,
+        }
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            metrics.increment("audit_events_dropped_total", reason="queue_full")
+
+    def _next_batch(self) -> list[dict]:
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _insert(self, events: list[dict]):
+        with self.bind.begin() as conn:
+            conn.execute(insert(AuditEvent), events)
+
+    def _write_one_by_one(self, batch: list[dict]) -> int:
+        written = 0
+        for event in batch:
+            try:
+                self._insert([event])
+                written += 1
+            except Exception as exc:
+                metrics.increment("audit_events_dropped_total", reason="write_failed")
+                logger.warning(f"Dropped a {event['type']} audit event: {exc!r}")
+        return written
+
+    def _write(self, batch: list[dict]):
+        try:
+            try:
+                self._insert(batch)
+                written = len(batch)
+            except (DataError, IntegrityError):
+                # An event the table rejects; write the others without it
+                written = self._write_one_by_one(batch)
+            metrics.increment("audit_events_written_total", written)
+        except Exception as exc:
+            metrics.increment(
+                "audit_events_dropped_total", len(batch), reason="write_failed"
+            )
+            logger.warning(f"Dropped {len(batch)} audit events: {exc!r}")
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._write(batch)
+            elif self._stopping.is_set():
+                return
+
+    def start(self):
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="audit", daemon=True)
+        self._thread.start()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every queued event has been written or dropped."""
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(
+                lambda: not self._queue.unfinished_tasks, timeout
+            )
+
+    def stop(self, timeout: float = 10.0):
+        """Write what is still queued, then stop the background thread."""
+        self._stopping.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+audit_log = AuditLog()
+metrics.gauge("audit_queue_depth", lambda: audit_log.pending)
@@ -0,0 +1,226 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Hashable
+
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Event:
+    id: int
+    topic: Hashable
+    type: str
+    data: dict = field(default_factory=dict)
+
+    def encode(self) -> str:
+        """Server-Sent Events wire format."""
+        return f"id: {self.id}\nevent: {self.type}\ndata: {json.dumps(self.data)}\n\n"
+
+
+class Subscription:
+    """
+    Events for one connection. At most `max_pending` events are held; past
+    that the subscription is marked overflowed and the connection should be
+    closed, so the client reconnects and resumes from the replay buffer.
+    """
+
+    def __init__(self, topic: Hashable, max_pending: int):
+        self.topic = topic
+        self.max_pending = max_pending
+        self.overflowed = False
+        self._pending: deque[Event] = deque()
+        self._ready = asyncio.Event()
+
+    def put(self, event: Event):
+        if len(self._pending) >= self.max_pending:
+            self.overflowed = True
+        else:
+            self._pending.append(event)
+        self._ready.set()
+
+    async def next_events(self, timeout: float) -> list[Event]:
+        """Wait up to `timeout` seconds and return the pending events, if any."""
+        if not self._pending and not self.overflowed:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except TimeoutError:
+                return []
+        self._ready.clear()
+        events = list(self._pending)
+        self._pending.clear()
+        return events
+
+
+class Broadcaster:
+    """
+    In-process fan-out of events to subscribers of a topic.
+
+    `publish` may be called from any thread; events are delivered on the
+    event loop passed to `start`. Events are deduplicated by id, so the
+    same event can arrive both from the local write path and through
+    LISTEN/NOTIFY. The last `buffer_size` events are kept for resuming
+    with Last-Event-ID.
+    """
+
+    def __init__(self, buffer_size: int, max_pending: int):
+        self.max_pending = max_pending
+        self._buffer: deque[Event] = deque(maxlen=buffer_size)
+        self._buffered_ids: set[int] = set()
+        # Every event with a greater id is in the buffer; None until known
+        self._complete_after: int | None = None
+        self._subscribers: dict[Hashable, set[Subscription]] = defaultdict(set)
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+
+    def stop(self):
+        self._loop = None
+
+    def publish(self, event: Event):
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._dispatch, event)
+        except RuntimeError:
+            # The loop closed during shutdown
+            pass
+
+    def mark_complete_after(self, event_id: int):
+        """Declare that every event after `event_id` will reach this broadcaster."""
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._set_complete_after, event_id)
+
+    def _set_complete_after(self, event_id: int):
+        self._complete_after = max(self._complete_after or 0, event_id)
+
+    def _dispatch(self, event: Event):
+        if event.id in self._buffered_ids:
+            return
+        if len(self._buffer) == self._buffer.maxlen:
+            evicted = self._buffer.popleft()
+            self._buffered_ids.discard(evicted.id)
+            if self._complete_after is not None:
+                self._complete_after = max(self._complete_after, evicted.id)
+        self._buffer.append(event)
+        self._buffered_ids.add(event.id)
+        for subscription in list(self._subscribers.get(event.topic, ())):
+            subscription.put(event)
+
+    def subscribe(
+        self, topic: Hashable, last_event_id: int | None = None
+    ) -> tuple[Subscription, bool]:
+        """
+        Subscribe to `topic`, replaying buffered events after `last_event_id`.
+        Also returns whether the replay is complete; when it is not, the
+        client missed events and must reload its state.
+        """
+        subscription = Subscription(topic, self.max_pending)
+        complete = True
+        if last_event_id is not None:
+            complete = (
+                self._complete_after is not None
+                and last_event_id >= self._complete_after
+            )
+            for event in self.replay(topic, last_event_id):
+                subscription.put(event)
+        self._subscribers[topic].add(subscription)
+        return subscription, complete
+
+    def replay(self, topic: Hashable, after_id: int) -> list[Event]:
+        """Buffered events of `topic` with an id greater than `after_id`."""
+        return [
+            event
+            for event in self._buffer
+            if event.topic == topic and event.id > after_id
+        ]
+
+    def unsubscribe(self, subscription: Subscription):
+        subscribers = self._subscribers.get(subscription.topic)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.topic]
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+
+class PgListener:
+    """
+    Background thread that LISTENs on a Postgres channel and passes each
+    notification payload to `on_notify`. `on_connect` runs on every
+    (re)connection, after LISTEN, with the raw DBAPI connection.
+    It reconnects with backoff when the connection fails.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        channel: str,
+        on_notify: Callable[[str], None],
+        on_connect: Callable[[object], None] | None = None,
+    ):
+        self.engine = engine
+        self.channel = channel
+        self.on_notify = on_notify
+        self.on_connect = on_connect
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"listen-{self.channel}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _run(self):
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                self._listen()
+                backoff = 1.0
+            except Exception as exc:
+                logger.warning(f"LISTEN {self.channel} failed, retrying: {exc}")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _listen(self):
+        # A dedicated connection outside the pool: it is held for the process lifetime
+        raw = self.engine.raw_connection()
+        raw.detach()
+        conn = raw.driver_connection
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f'LISTEN "{self.channel}"')
+            if self.on_connect is not None:
+                self.on_connect(conn)
+            while not self._stop.is_set():
+                if select.select([conn], [], [], 1.0) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    try:
+                        self.on_notify(notify.payload)
+                    except Exception as exc:
+                        logger.error(f"Bad notification on {self.channel}: {exc}")
+        finally:
+            conn.close()
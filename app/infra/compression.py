@@ -0,0 +1,113 @@
+import gzip
+import os
+
+import anyio.to_thread
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from app.infra.metrics import metrics
+from app.infra.response_snapshot import take_snapshot
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip is offered without it
+    brotli = None
+
+# Encodings offered, most preferred first; empty disables compression
+COMPRESSION_ALGORITHMS = [
+    algorithm.strip()
+    for algorithm in os.getenv("COMPRESSION_ALGORITHMS", "br,gzip").split(",")
+    if algorithm.strip() in ("gzip", "br") and (algorithm.strip() != "br" or brotli)
+]
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/xml")
+# Bodies at least this large are compressed off the event loop
+THREAD_THRESHOLD = 64 * 1024
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    """
+    The offered encoding the client accepts with the highest q-value, ties
+    going to the server's preference; None when nothing offered is accepted.
+    """
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for algorithm in COMPRESSION_ALGORITHMS:
+        quality = accepted.get(algorithm, wildcard)
+        if quality > best_quality:
+            best, best_quality = algorithm, quality
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def _compressible(content_type: str) -> bool:
+    return content_type.startswith(COMPRESSIBLE_TYPES) and not content_type.startswith(
+        "text/event-stream"
+    )
+
+
+def _vary_on_accept_encoding(headers):
+    # Cached bodies may already vary on it; don't list it twice
+    vary = headers.get("vary", "")
+    if "accept-encoding" not in (token.strip().lower() for token in vary.split(",")):
+        headers.add_vary_header("Accept-Encoding")
+
+
+class CompressionMiddleware(BaseHTTPMiddleware):
+    """
+    Compress responses of at least `minimum_size` bytes with the best
+    encoding the client accepts. Streams (Server-Sent Events) and responses
+    that already carry a Content-Encoding, such as pre-compressed cached
+    bodies, pass through untouched.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MINIMUM_SIZE):
+        super().__init__(app)
+        self.minimum_size = minimum_size
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if (
+            not COMPRESSION_ALGORITHMS
+            or "content-encoding" in response.headers
+            or not _compressible(response.headers.get("content-type", ""))
+        ):
+            return response
+
+        encoding = negotiate(request.headers.get("accept-encoding", ""))
+        snapshot = await take_snapshot(response)
+        response = snapshot.to_response()
+        _vary_on_accept_encoding(response.headers)
+        if encoding is None or len(snapshot.body) < self.minimum_size:
+            return response
+
+        if len(snapshot.body) >= THREAD_THRESHOLD:
+            body = await anyio.to_thread.run_sync(compress, snapshot.body, encoding)
+        else:
+            body = compress(snapshot.body, encoding)
+        metrics.increment("compression_bytes_in_total", len(snapshot.body))
+        metrics.increment("compression_bytes_out_total", len(body), encoding=encoding)
+        response.body = body
+        response.headers["Content-Encoding"] = encoding
+        response.headers["Content-Length"] = str(len(body))
+        return response
@@ -0,0 +1,159 @@
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from app.infra.response_snapshot import ResponseSnapshot, take_snapshot
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "600"))
+IDEMPOTENCY_MAX_ENTRIES = int(os.getenv("IDEMPOTENCY_MAX_ENTRIES", "10000"))
+
+
+def _digest(value: bytes) -> str:
+    return hashlib.sha256(value).hexdigest()
+
+
+class IdempotencyStore:
+    """
+    Completed responses by idempotency key, plus the requests still in flight.
+
+    Entries expire after `ttl` seconds and the oldest are evicted beyond
+    `max_entries`. The store lives in the worker process and is only touched
+    from the event loop, so it needs no locking.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._completed: OrderedDict[str, tuple[float, str, ResponseSnapshot]] = (
+            OrderedDict()
+        )
+        self._in_flight: dict[str, tuple[str, asyncio.Future]] = {}
+
+    def get(self, key: str):
+        entry = self._completed.get(key)
+        if entry is None:
+            return None
+        expires_at, fingerprint, snapshot = entry
+        if expires_at <= time.monotonic():
+            del self._completed[key]
+            return None
+        return fingerprint, snapshot
+
+    def put(self, key: str, fingerprint: str, snapshot: ResponseSnapshot):
+        self._completed[key] = (time.monotonic() + self.ttl, fingerprint, snapshot)
+        self._completed.move_to_end(key)
+        while len(self._completed) > self.max_entries:
+            self._completed.popitem(last=False)
+
+    def in_flight(self, key: str):
+        return self._in_flight.get(key)
+
+    def begin(self, key: str, fingerprint: str) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = (fingerprint, future)
+        return future
+
+    def end(self, key: str, snapshot: ResponseSnapshot | None):
+        _, future = self._in_flight.pop(key)
+        future.set_result(snapshot)
+
+
+def _authorization_caller(request: Request) -> str:
+    return _digest(request.headers.get("Authorization", "").encode())
+
+
+def _key_reused_response() -> JSONResponse:
+    return JSONResponse(
+        status_code=400,
+        content={
+            "error": "Validation failed",
+            "details": f"{IDEMPOTENCY_HEADER} was already used for a different request",
+        },
+    )
+
+
+class IdempotencyMiddleware(BaseHTTPMiddleware):
+    """
+    Replay the first response of a POST for repeated `Idempotency-Key` values.
+
+    `paths` match with or without a trailing slash. Keys are scoped by the
+    exact path and by `caller(request)`, which should stay the same when the
+    client refreshes its token; it defaults to the Authorization header. A
+    repeat with a different body is rejected. A repeat arriving while the
+    first request is still running waits for it instead of running again.
+    Server errors are not stored, so the client can retry them.
+    """
+
+    def __init__(
+        self,
+        app,
+        paths: set[str],
+        store: IdempotencyStore | None = None,
+        caller: Callable[[Request], str] = _authorization_caller,
+    ):
+        super().__init__(app)
+        self.paths = {path.rstrip("/") for path in paths}
+        self.caller = caller
+        self.store = store or IdempotencyStore(
+            IDEMPOTENCY_TTL_SECONDS, IDEMPOTENCY_MAX_ENTRIES
+        )
+
+    async def dispatch(self, request: Request, call_next):
+        idempotency_key = request.headers.get(IDEMPOTENCY_HEADER)
+        if (
+            request.method != "POST"
+            or not idempotency_key
+            or request.url.path.rstrip("/") not in self.paths
+        ):
+            return await call_next(request)
+
+        if len(idempotency_key) > 255:
+            return JSONResponse(
+                status_code=400,
+                content={
+                    "error": "Validation failed",
+                    "details": f"{IDEMPOTENCY_HEADER} must be at most 255 characters",
+                },
+            )
+
+        key = f"{request.url.path}:{self.caller(request)}:{idempotency_key}"
+        fingerprint = _digest(await request.body())
+
+        while True:
+            completed = self.store.get(key)
+            if completed is not None:
+                stored_fingerprint, snapshot = completed
+                if stored_fingerprint != fingerprint:
+                    return _key_reused_response()
+                return snapshot.to_response({"Idempotent-Replayed": "true"})
+
+            in_flight = self.store.in_flight(key)
+            if in_flight is None:
+                break
+            stored_fingerprint, future = in_flight
+            if stored_fingerprint != fingerprint:
+                return _key_reused_response()
+            snapshot = await asyncio.shield(future)
+            if snapshot is not None:
+                return snapshot.to_response({"Idempotent-Replayed": "true"})
+            # The first attempt failed; let this one run (or wait on a newer one)
+
+        self.store.begin(key, fingerprint)
+        snapshot = None
+        try:
+            snapshot = await take_snapshot(await call_next(request))
+            if snapshot.status_code < 500:
+                self.store.put(key, fingerprint, snapshot)
+        finally:
+            self.store.end(
+                key, snapshot if snapshot and snapshot.status_code < 500 else None
+            )
+        return snapshot.to_response()
@@ -0,0 +1,41 @@
+import threading
+from collections import defaultdict
+from typing import Callable
+
+
+def _series(name: str, labels: dict[str, str]) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+    return f"{name}{{{rendered}}}"
+
+
+class Metrics:
+    """In-process counters and computed gauges, exposed by GET /metrics."""
+
+    def __init__(self):
+        self._counters: dict[str, float] = defaultdict(float)
+        self._gauges: dict[str, Callable[[], float]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1, **labels: str):
+        series = _series(name, labels)
+        with self._lock:
+            self._counters[series] += value
+
+    def gauge(self, name: str, read: Callable[[], float], **labels: str):
+        """Register a gauge whose value is computed when metrics are read."""
+        self._gauges[_series(name, labels)] = read
+
+    def value(self, name: str, **labels: str) -> float:
+        return self._counters.get(_series(name, labels), 0)
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            values = dict(self._counters)
+        for series, read in list(self._gauges.items()):
+            values[series] = read()
+        return dict(sorted(values.items()))
+
+
+metrics = Metrics()
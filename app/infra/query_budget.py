@@ -0,0 +1,281 @@
+import asyncio
+import os
+import threading
+import time
+from contextvars import ContextVar
+
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import Pool
+
+from app.infra.admission import ADMISSION_RETRY_AFTER_SECONDS, classify
+from app.infra.metrics import metrics
+
+# Time a request's queries may take in total, per route class; 0 disables
+QUERY_TIMEOUT_AUTH_MS = int(os.getenv("QUERY_TIMEOUT_AUTH_MS", "2000"))
+QUERY_TIMEOUT_READ_MS = int(os.getenv("QUERY_TIMEOUT_READ_MS", "2000"))
+QUERY_TIMEOUT_WRITE_MS = int(os.getenv("QUERY_TIMEOUT_WRITE_MS", "5000"))
+# Longest wait for a row or table lock; 0 waits as long as the budget allows
+QUERY_LOCK_TIMEOUT_MS = int(os.getenv("QUERY_LOCK_TIMEOUT_MS", "500"))
+
+
+def _overrides(value: str) -> dict[str, int]:
+    """Parse "/account/statements=10000,/user/token=1000" into path budgets."""
+    overrides = {}
+    for item in value.split(","):
+        path, _, timeout = item.strip().partition("=")
+        if path and timeout:
+            overrides[path] = int(timeout)
+    return overrides
+
+
+# Budgets for paths (and the paths below them) that differ from their class
+QUERY_TIMEOUT_OVERRIDES = _overrides(os.getenv("QUERY_TIMEOUT_OVERRIDES", ""))
+
+# SQLSTATEs: statement_timeout or a cancel request, and lock_timeout
+QUERY_CANCELED = "57014"
+LOCK_NOT_AVAILABLE = "55P03"
+
+
+class QueryBudget:
+    """
+    The database time left to one request, and the pooled connections its
+    transactions are running on, so they can be cancelled if the client
+    goes away.
+    """
+
+    def __init__(self, route_class: str, timeout_ms: int, lock_timeout_ms: int):
+        self.route_class = route_class
+        self.deadline = time.monotonic() + timeout_ms / 1000
+        self.lock_timeout_ms = lock_timeout_ms
+        self.cancelled = False
+        self._finished = False
+        self._connections: set = set()
+        self._lock = threading.Lock()
+
+    def remaining_ms(self) -> int:
+        # At least 1: 0 would disable statement_timeout altogether
+        return max(1, int((self.deadline - time.monotonic()) * 1000))
+
+    def attach(self, dbapi_connection):
+        with self._lock:
+            if not self._finished:
+                self._connections.add(dbapi_connection)
+
+    def detach(self, dbapi_connection):
+        with self._lock:
+            self._connections.discard(dbapi_connection)
+
+    def finish(self):
+        """Stop tracking connections; nothing is cancelled after this."""
+        with self._lock:
+            self._finished = True
+            self._connections.clear()
+
+    def cancel(self) -> int:
+        """Cancel the queries running for this request; blocks on the network."""
+        with self._lock:
+            if self._finished:
+                return 0
+            self.cancelled = True
+            for connection in self._connections:
+                connection.cancel()
+            return len(self._connections)
+
+
+_current_budget: ContextVar[QueryBudget | None] = ContextVar(
+    "query_budget", default=None
+)
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_budget(session, transaction, connection):
+    """Limit each transaction to what is left of the request's budget."""
+    budget = _current_budget.get()
+    if budget is None:
+        return
+    statement = budget.remaining_ms()
+    lock = min(budget.lock_timeout_ms, statement) if budget.lock_timeout_ms else 0
+    # SET LOCAL is reset when the transaction ends, so the pooled connection
+    # goes back without the request's limits. Sent with the transaction's
+    # first statement (see _send_limits) rather than in a round trip of its own
+    connection.info["query_budget_limits"] = (
+        f"SET LOCAL statement_timeout = {statement}; SET LOCAL lock_timeout = {lock}; "
+    )
+    pooled = connection.connection
+    pooled.info["query_budget"] = budget
+    budget.attach(pooled.driver_connection)
+
+
+@event.listens_for(Engine, "before_cursor_execute", retval=True)
+def _send_limits(conn, cursor, statement, parameters, context, executemany):
+    """Prefix the first statement of a budgeted transaction with its limits."""
+    limits = conn.info.pop("query_budget_limits", None)
+    if limits is not None:
+        statement = limits + statement
+    return statement, parameters
+
+
+@event.listens_for(Pool, "checkin")
+def _release_connection(dbapi_connection, connection_record):
+    # Runs before another request can check the connection out, so a late
+    # cancel never reaches someone else's query
+    connection_record.info.pop("query_budget_limits", None)
+    budget = connection_record.info.pop("query_budget", None)
+    if budget is not None:
+        budget.detach(dbapi_connection)
+
+
+def timeout_response(exc: OperationalError) -> JSONResponse | None:
+    """
+    503/504 for a query stopped by the request's budget or cancelled after
+    a disconnect; None for any other database error.
+    """
+    budget = _current_budget.get()
+    code = getattr(exc.orig, "pgcode", None)
+    if budget is None or code not in (QUERY_CANCELED, LOCK_NOT_AVAILABLE):
+        return None
+
+    if code == LOCK_NOT_AVAILABLE:
+        reason = "lock_timeout"
+    elif budget.cancelled:
+        reason = "disconnect"
+    else:
+        reason = "statement_timeout"
+    metrics.increment(
+        "db_query_timeouts_total", route_class=budget.route_class, reason=reason
+    )
+    if reason == "statement_timeout":
+        return JSONResponse(
+            status_code=504,
+            content={
+                "error": "Database timeout",
+                "details": "The request took too long, retry later",
+            },
+        )
+    return JSONResponse(
+        status_code=503,
+        content={
+            "error": "Service busy",
+            "details": "The requested data is locked, retry later"
+            if reason == "lock_timeout"
+            else "The request was cancelled",
+        },
+        headers={"Retry-After": str(ADMISSION_RETRY_AFTER_SECONDS)},
+    )
+
+
+def _has_body(scope) -> bool:
+    for name, value in scope.get("headers", []):
+        if name == b"transfer-encoding" or (
+            name == b"content-length" and value.strip() != b"0"
+        ):
+            return True
+    return False
+
+
+class QueryBudgetMiddleware:
+    """
+    Give each request a database time budget by route class, applied as
+    `statement_timeout` and `lock_timeout` on every transaction it begins,
+    so a slow or blocked query cannot hold a pooled connection and a worker
+    thread indefinitely.
+
+    Once the request body has been read, the middleware keeps listening for
+    the client disconnecting and then cancels the request's running queries.
+    Register it first so it runs innermost and budgets start once a request
+    has been admitted.
+    """
+
+    def __init__(
+        self,
+        app,
+        budgets: dict[str, int] | None = None,
+        overrides: dict[str, int] | None = None,
+        lock_timeout_ms: int = QUERY_LOCK_TIMEOUT_MS,
+    ):
+        self.app = app
+        self.budgets = (
+            {
+                "auth": QUERY_TIMEOUT_AUTH_MS,
+                "read": QUERY_TIMEOUT_READ_MS,
+                "write": QUERY_TIMEOUT_WRITE_MS,
+            }
+            if budgets is None
+            else budgets
+        )
+        self.overrides = QUERY_TIMEOUT_OVERRIDES if overrides is None else overrides
+        self.lock_timeout_ms = lock_timeout_ms
+
+    def budget_for(self, method: str, path: str) -> QueryBudget | None:
+        route_class = classify(method, path)
+        timeout = self.budgets.get(route_class, 0)
+        for prefix, override in self.overrides.items():
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                timeout = override
+        if not timeout:
+            return None
+        return QueryBudget(route_class, timeout, self.lock_timeout_ms)
+
+    async def __call__(self, scope, receive, send):
+        budget = (
+            self.budget_for(scope["method"], scope["path"])
+            if scope["type"] == "http"
+            else None
+        )
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+
+        loop = asyncio.get_running_loop()
+        messages: asyncio.Queue = asyncio.Queue()
+        disconnected = asyncio.Event()
+        listener: asyncio.Task | None = None
+
+        async def listen():
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    disconnected.set()
+                    # The default executor, as the request's own thread pool
+                    # may be the thing that is exhausted
+                    cancelled = await loop.run_in_executor(None, budget.cancel)
+                    if cancelled:
+                        metrics.increment(
+                            "db_queries_cancelled_total",
+                            cancelled,
+                            route_class=budget.route_class,
+                        )
+                    return
+
+        def start_listening():
+            nonlocal listener
+            listener = asyncio.create_task(listen())
+
+        async def receive_wrapper():
+            if listener is None:
+                message = await receive()
+                if message["type"] == "http.request" and not message.get(
+                    "more_body", False
+                ):
+                    start_listening()
+                return message
+            if disconnected.is_set() and messages.empty():
+                return {"type": "http.disconnect"}
+            return await messages.get()
+
+        # Handlers without a body never call receive(), so listen right away
+        if not _has_body(scope):
+            start_listening()
+        token = _current_budget.set(budget)
+        try:
+            await self.app(scope, receive_wrapper, send)
+        finally:
+            budget.finish()
+            if listener is not None:
+                listener.cancel()
+            _current_budget.reset(token)
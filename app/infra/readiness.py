@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import os
+import signal
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+import anyio.to_thread
+
+logger = logging.getLogger(__name__)
+
+READINESS_INTERVAL_SECONDS = float(os.getenv("READINESS_INTERVAL_SECONDS", "5"))
+READINESS_TIMEOUT_SECONDS = float(os.getenv("READINESS_TIMEOUT_SECONDS", "2"))
+# How long to keep serving, reported as not ready, after SIGTERM
+READINESS_DRAIN_SECONDS = float(os.getenv("READINESS_DRAIN_SECONDS", "5"))
+
+
+def check_threadpool():
+    """Fail when every worker thread (sync handlers, bcrypt hashing) is busy."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    if limiter.available_tokens < 1:
+        raise RuntimeError(f"all {limiter.total_tokens} worker threads are busy")
+
+
+class ReadinessProbe:
+    """
+    Runs dependency checks in the background and serves the cached result,
+    so readiness requests never touch the dependencies themselves.
+
+    `checks` map a name to a blocking callable that raises when the
+    dependency is unavailable; they run in a worker thread with a timeout.
+    Cheap checks that must run on the event loop, like `check_threadpool`,
+    go in `loop_checks`.
+    """
+
+    def __init__(
+        self,
+        checks: dict[str, Callable[[], None]],
+        loop_checks: dict[str, Callable[[], None]] | None = None,
+        interval: float = READINESS_INTERVAL_SECONDS,
+        timeout: float = READINESS_TIMEOUT_SECONDS,
+    ):
+        self.checks = checks
+        self.loop_checks = loop_checks or {}
+        self.interval = interval
+        self.timeout = timeout
+        self.draining = False
+        self._results: dict[str, dict] = {}
+        self._checked_at: datetime | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def ready(self) -> bool:
+        return (
+            not self.draining
+            and bool(self._results)
+            and all(result["ok"] for result in self._results.values())
+        )
+
+    def status(self) -> dict:
+        if self.draining:
+            state = "draining"
+        else:
+            state = "ready" if self.ready else "not_ready"
+        return {
+            "status": state,
+            "checked_at": self._checked_at.isoformat() if self._checked_at else None,
+            "checks": self._results,
+        }
+
+    async def _run_check(
+        self, name: str, check: Callable[[], None], in_thread: bool
+    ) -> dict:
+        started = time.perf_counter()
+        try:
+            if in_thread:
+                await asyncio.wait_for(
+                    anyio.to_thread.run_sync(check, abandon_on_cancel=True),
+                    self.timeout,
+                )
+            else:
+                check()
+            error = None
+        except Exception as exc:
+            # Details go to the log only; the probe response is unauthenticated
+            logger.warning(f"Readiness check {name} failed: {exc!r}")
+            error = exc.__class__.__name__
+        return {
+            "ok": error is None,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 3),
+            "error": error,
+        }
+
+    async def run_once(self):
+        results = {
+            name: await self._run_check(name, check, in_thread=False)
+            for name, check in self.loop_checks.items()
+        }
+        for name, check in self.checks.items():
+            results[name] = await self._run_check(name, check, in_thread=True)
+
+        self._results = results
+        self._checked_at = datetime.now(timezone.utc)
+
+    async def _run_forever(self):
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        self.draining = False
+        self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def drain(self):
+        """Report not ready from now on, ahead of shutdown."""
+        if not self.draining:
+            logger.info("Draining: readiness set to false")
+        self.draining = True
+
+
+def install_drain_handler(probe: ReadinessProbe, seconds: float):
+    """
+    On SIGTERM, report not ready for `seconds` while still serving, then hand
+    the signal to the server so it shuts down gracefully.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    loop = asyncio.get_running_loop()
+    previous = signal.getsignal(signal.SIGTERM)
+
+    def forward(signum, frame):
+        signal.signal(signal.SIGTERM, previous)
+        if callable(previous):
+            previous(signum, frame)
+        else:
+            signal.raise_signal(signum)
+
+    def handle(signum, frame):
+        probe.drain()
+        loop.call_soon_threadsafe(loop.call_later, seconds, forward, signum, frame)
+
+    signal.signal(signal.SIGTERM, handle)
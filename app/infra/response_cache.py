@@ -0,0 +1,91 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+from starlette.responses import Response
+
+from app.infra.compression import COMPRESSION_MINIMUM_SIZE, compress, negotiate
+from app.infra.metrics import metrics
+
+
+class CachedBody:
+    """A serialized response body and its compressed variants, made on demand."""
+
+    def __init__(self, version: int, body: bytes):
+        self.version = version
+        self.body = body
+        self.encoded: dict[str, bytes] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(body) for body in self.encoded.values())
+
+
+class ResponseCache:
+    """
+    LRU of serialized JSON bodies, each valid for one version of the data it
+    was built from, kept together with their compressed variants so a hit
+    skips both serialization and compression. Bounded by total bytes.
+    """
+
+    def __init__(self, name: str, max_bytes: int):
+        self.name = name
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, CachedBody] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        metrics.gauge("response_cache_bytes", lambda: self._bytes, cache=name)
+
+    def get(self, key: Hashable, version: int) -> CachedBody | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version:
+                metrics.increment("response_cache_misses_total", cache=self.name)
+                return None
+            self._entries.move_to_end(key)
+        metrics.increment("response_cache_hits_total", cache=self.name)
+        return entry
+
+    def put(self, key: Hashable, version: int, body: bytes) -> CachedBody:
+        entry = CachedBody(version, body)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            self._evict()
+        return entry
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+
+    def _encoded(self, key: Hashable, entry: CachedBody, encoding: str) -> bytes:
+        body = entry.encoded.get(encoding)
+        if body is None:
+            body = compress(entry.body, encoding)
+            with self._lock:
+                if encoding not in entry.encoded and self._entries.get(key) is entry:
+                    self._bytes += len(body)
+                    entry.encoded[encoding] = body
+                    self._evict()
+        return body
+
+    def response(self, key: Hashable, entry: CachedBody, accept_encoding: str):
+        """A JSON response with the body in the best encoding the client accepts."""
+        encoding = (
+            negotiate(accept_encoding)
+            if len(entry.body) >= COMPRESSION_MINIMUM_SIZE
+            else None
+        )
+        headers = {"Vary": "Accept-Encoding"}
+        if encoding is None:
+            return Response(entry.body, media_type="application/json", headers=headers)
+        headers["Content-Encoding"] = encoding
+        return Response(
+            self._encoded(key, entry, encoding),
+            media_type="application/json",
+            headers=headers,
+        )
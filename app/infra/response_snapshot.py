@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+from starlette.responses import Response
+
+
+@dataclass(frozen=True)
+class ResponseSnapshot:
+    """A fully buffered response that can be replayed any number of times."""
+
+    status_code: int
+    headers: tuple[tuple[bytes, bytes], ...]
+    body: bytes
+
+    def to_response(self, extra_headers: dict[str, str] | None = None) -> Response:
+        response = Response(content=self.body, status_code=self.status_code)
+        response.raw_headers = list(self.headers)
+        for name, value in (extra_headers or {}).items():
+            response.headers[name] = value
+        return response
+
+
+async def take_snapshot(response: Response) -> ResponseSnapshot:
+    """Drain a (possibly streaming) response into a ResponseSnapshot."""
+    body = getattr(response, "body", None)
+    if body is None:
+        body = b"".join([chunk async for chunk in response.body_iterator])
+    return ResponseSnapshot(
+        status_code=response.status_code,
+        headers=tuple(response.raw_headers),
+        body=body,
+    )
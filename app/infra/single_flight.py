@@ -0,0 +1,84 @@
+import asyncio
+import hashlib
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from app.infra.metrics import metrics
+from app.infra.response_snapshot import take_snapshot
+
+SAFE_METHODS = {"GET", "HEAD"}
+
+
+class SingleFlightMiddleware(BaseHTTPMiddleware):
+    """
+    Coalesce identical concurrent reads into one computation.
+
+    Requests are identical when method, path, query string, caller (the
+    Authorization header) and accepted encodings match. The first one runs the
+    handler and every request arriving while it runs receives a copy of its
+    response, unless it failed (5xx or cancelled) and they run it themselves.
+    Only GET/HEAD requests to the configured `paths` are coalesced, so routes
+    with side effects always run once per request.
+    """
+
+    def __init__(self, app, paths: set[str]):
+        super().__init__(app)
+        self.paths = {path.rstrip("/") for path in paths}
+        self._in_flight: dict[str, asyncio.Future] = {}
+        for path in self.paths:
+            metrics.gauge(
+                "single_flight_coalescing_ratio",
+                lambda route=path: self.coalescing_ratio(route),
+                route=path,
+            )
+
+    @staticmethod
+    def coalescing_ratio(route: str) -> float:
+        """Share of requests served from another request's computation."""
+        leaders = metrics.value("single_flight_leaders_total", route=route)
+        followers = metrics.value("single_flight_followers_total", route=route)
+        total = leaders + followers
+        return followers / total if total else 0.0
+
+    async def dispatch(self, request: Request, call_next):
+        route = request.url.path.rstrip("/")
+        if request.method not in SAFE_METHODS or route not in self.paths:
+            return await call_next(request)
+
+        caller = hashlib.sha256(
+            request.headers.get("Authorization", "").encode()
+        ).hexdigest()
+        key = "|".join(
+            (
+                request.method,
+                request.url.path,
+                "&".join(sorted(request.url.query.split("&"))),
+                caller,
+                request.headers.get("Accept-Encoding", ""),
+            )
+        )
+
+        while (leader := self._in_flight.get(key)) is not None:
+            snapshot = await asyncio.shield(leader)
+            if snapshot is not None:
+                metrics.increment("single_flight_followers_total", route=route)
+                return snapshot.to_response()
+            # The leader failed; run the handler (or follow a newer leader)
+
+        metrics.increment("single_flight_leaders_total", route=route)
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        snapshot = None
+        try:
+            snapshot = await take_snapshot(await call_next(request))
+        finally:
+            del self._in_flight[key]
+            # Followers run the handler themselves rather than share a failure,
+            # e.g. a 503 after the leader's own client disconnected
+            future.set_result(
+                snapshot
+                if snapshot is not None and snapshot.status_code < 500
+                else None
+            )
+        return snapshot.to_response()
@@ -0,0 +1,221 @@
+import hashlib
+import hmac
+import json
+import logging
+import os
+import queue
+import random
+import re
+import secrets
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Callable
+from urllib.parse import parse_qsl
+
+from starlette.requests import Request
+
+# Opt-in: set a file path to record traffic for benchmarks/replay_traffic.py
+TRAFFIC_CAPTURE_PATH = os.getenv("TRAFFIC_CAPTURE_PATH", "")
+TRAFFIC_CAPTURE_MAX_BYTES = int(
+    os.getenv("TRAFFIC_CAPTURE_MAX_BYTES", str(50 * 1024 * 1024))
+)
+TRAFFIC_CAPTURE_BACKUPS = int(os.getenv("TRAFFIC_CAPTURE_BACKUPS", "5"))
+# Share of requests recorded
+TRAFFIC_CAPTURE_SAMPLE = float(os.getenv("TRAFFIC_CAPTURE_SAMPLE", "1"))
+# Larger request bodies are recorded by size only
+TRAFFIC_CAPTURE_MAX_BODY = int(os.getenv("TRAFFIC_CAPTURE_MAX_BODY", "16384"))
+# Keys the pseudonyms and caller hashes, so they cannot be reversed by hashing
+# guessed emails; never written to the capture. Random per process when unset;
+# set it to keep pseudonyms the same across workers and restarts.
+TRAFFIC_CAPTURE_PSEUDONYM_KEY = os.getenv(
+    "TRAFFIC_CAPTURE_PSEUDONYM_KEY", ""
+).encode() or secrets.token_bytes(32)
+
+SECRET_FIELDS = {"password", "access_token", "refresh_token", "token", "client_secret"}
+# Personal data the replay does not need
+PERSONAL_FIELDS = {"name"}
+# Replaced by a stable pseudonym, so the same person maps to the same value
+IDENTITY_FIELDS = {"email", "username"}
+# Kept the same length, with every digit zeroed
+NUMBER_FIELDS = {"account_number", "last_four_digits", "agency"}
+REDACTED = "***"
+
+
+def _keyed_hash(value: str) -> str:
+    return hmac.new(
+        TRAFFIC_CAPTURE_PSEUDONYM_KEY, value.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def pseudonym(value: str) -> str:
+    return f"u{_keyed_hash(value)[:10]}@capture.test"
+
+
+def _authorization_caller(request: Request) -> str:
+    return request.headers.get("Authorization", "")
+
+
+def sanitize(value):
+    """
+    Copy of a decoded body with secrets and personal data redacted and
+    identities pseudonymized.
+    """
+    if isinstance(value, list):
+        return [sanitize(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    cleaned = {}
+    for key, item in value.items():
+        name = key.lower()
+        if name in SECRET_FIELDS or name in PERSONAL_FIELDS:
+            cleaned[key] = REDACTED
+        elif name in IDENTITY_FIELDS and isinstance(item, str):
+            cleaned[key] = pseudonym(item)
+        elif name in NUMBER_FIELDS and isinstance(item, str):
+            cleaned[key] = re.sub(r"\d", "0", item)
+        else:
+            cleaned[key] = sanitize(item)
+    return cleaned
+
+
+def _decode_body(content_type: str, body: bytes):
+    """The sanitized body and its format, or (None, None) if not recordable."""
+    if not body or len(body) > TRAFFIC_CAPTURE_MAX_BODY:
+        return None, None
+    try:
+        if content_type.startswith("application/json"):
+            return sanitize(json.loads(body)), "json"
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            return sanitize(dict(parse_qsl(body.decode()))), "form"
+    except ValueError:
+        pass
+    return None, None
+
+
+class TrafficCapture:
+    """
+    Writes one JSON line per request to a rotating file. Lines go through a
+    queue to a background listener, so requests never wait on file I/O.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = TRAFFIC_CAPTURE_MAX_BYTES,
+        backups: int = TRAFFIC_CAPTURE_BACKUPS,
+    ):
+        handler = RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._listener = QueueListener(self._queue, handler)
+        self._logger = logging.getLogger(f"{__name__}.{path}")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        self._logger.handlers = [QueueHandler(self._queue)]
+
+    def write(self, record: dict):
+        self._logger.info(json.dumps(record, separators=(",", ":"), default=str))
+
+    def start(self):
+        self._listener.start()
+
+    def stop(self):
+        """Write the lines still queued and close the file."""
+        self._listener.stop()
+
+
+class TrafficCaptureMiddleware:
+    """
+    Record method, route template, query, status, timings, sizes and the
+    sanitized request body of sampled requests. The caller is recorded only
+    as a keyed hash of `caller(request)`, which should stay the same when the
+    client refreshes its token so a replay maps it to one user; it defaults
+    to the Authorization header.
+    """
+
+    def __init__(
+        self,
+        app,
+        capture: TrafficCapture,
+        sample: float = TRAFFIC_CAPTURE_SAMPLE,
+        caller: Callable[[Request], str] = _authorization_caller,
+    ):
+        self.app = app
+        self.capture = capture
+        self.sample = sample
+        self.caller = caller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or random.random() >= self.sample:
+            await self.app(scope, receive, send)
+            return
+
+        started_wall, started = time.time(), time.perf_counter()
+        # Before the request runs, which may revoke its own token (logout)
+        caller = self.caller(Request(scope))
+        body = bytearray()
+        request_bytes = 0
+        response = {"status": None, "bytes": 0, "content_type": ""}
+
+        async def receive_wrapper():
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                request_bytes += len(chunk)
+                if len(body) <= TRAFFIC_CAPTURE_MAX_BODY:
+                    body.extend(chunk)
+            return message
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                for name, value in message.get("headers", []):
+                    if name.lower() == b"content-type":
+                        response["content_type"] = value.decode("latin-1")
+            elif message["type"] == "http.response.body":
+                response["bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            self._record(
+                scope, started_wall, started, caller, body, request_bytes, response
+            )
+
+    def _record(
+        self, scope, started_wall, started, caller, body, request_bytes, response
+    ):
+        headers = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+        route = scope.get("route")
+        content_type = headers.get("content-type", "")
+        decoded, body_format = _decode_body(content_type, bytes(body))
+        query = parse_qsl(scope.get("query_string", b"").decode())
+        self.capture.write(
+            {
+                "ts": round(started_wall, 6),
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(route, "path_format", None),
+                "query": sanitize(dict(query)) if query else None,
+                "caller": _keyed_hash(caller)[:16] if caller else None,
+                "idempotent": "idempotency-key" in headers,
+                "content_type": content_type or None,
+                "body_format": body_format,
+                "body": decoded,
+                "request_bytes": request_bytes,
+                "status": response["status"],
+                "response_bytes": response["bytes"],
+                "response_type": response["content_type"] or None,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+            }
+        )
+
+
+traffic_capture = TrafficCapture(TRAFFIC_CAPTURE_PATH) if TRAFFIC_CAPTURE_PATH else None
@@ -1,22 +1,64 @@
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from dotenv import load_dotenv
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import OperationalError
+
+from app.id.public.request_caller import request_caller
 
 # Import models to register them with SQLAlchemy metadata
+from app.id.user._revocation import (  # noqa: F401
+    RevokedToken,
+    TokenCutoff,
+    token_revocations,
+)
 from app.id.user._user import User  # noqa: F401
 from app.id.user.route import user_router
-from app.infra.database import create_tables, init_database
+from app.infra.admission import AdmissionMiddleware
+from app.infra.allocation_profile import (
+    ALLOCATION_PROFILE_TOKEN,
+    ALLOCATION_PROFILE_TOP,
+    AllocationProfileMiddleware,
+    allocation_profiler,
+    require_debug_token,
+)
+from app.infra.audit import AuditEvent, audit_log  # noqa: F401
+from app.infra.compression import CompressionMiddleware
+from app.infra.database import check_database, create_tables, init_database
+from app.infra.idempotency import IdempotencyMiddleware
+from app.infra.metrics import metrics
+from app.infra.query_budget import QueryBudgetMiddleware, timeout_response
+from app.infra.readiness import (
+    READINESS_DRAIN_SECONDS,
+    ReadinessProbe,
+    check_threadpool,
+    install_drain_handler,
+)
+from app.infra.single_flight import SingleFlightMiddleware
+from app.infra.traffic_capture import TrafficCaptureMiddleware, traffic_capture
+from app.me.route import me_router
 from app.movement.account._account import (  # noqa: F401
     Account,
     BankDetail,
     CreditDetails,
 )
+from app.movement.account._account_events import (
+    account_events,
+    account_events_listener,
+)
+from app.movement.account._account_list_cache import (  # noqa: F401
+    AccountListVersion,
+)
+from app.movement.account._account_summary import AccountSummary  # noqa: F401
 from app.movement.account.route import account_router
 from app.util.exceptions import DomainException
+from app.warmup import warmup
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -26,17 +68,99 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 
+readiness = ReadinessProbe(
+    checks={"database": check_database},
+    loop_checks={
+        "threadpool": check_threadpool,
+        "warmup": warmup.check,
+        "token_revocations": token_revocations.check,
+    },
+)
+
+
+async def warm_up():
+    await anyio.to_thread.run_sync(warmup.run, abandon_on_cancel=True)
+    # Report ready right away rather than at the next probe interval
+    await readiness.run_once()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    audit_log.start()
+    if traffic_capture:
+        traffic_capture.start()
+    if allocation_profiler:
+        allocation_profiler.start()
+    readiness.start()
+    warm_up_task = asyncio.create_task(warm_up())
+    install_drain_handler(readiness, READINESS_DRAIN_SECONDS)
+    account_events.start()
+    account_events_listener.start()
+    token_revocations.start()
+    yield
+    readiness.drain()
+    account_events_listener.stop()
+    account_events.stop()
+    warm_up_task.cancel()
+    await token_revocations.stop()
+    await readiness.stop()
+    # Last, so events of requests finishing during shutdown are written too
+    await anyio.to_thread.run_sync(audit_log.stop)
+    if traffic_capture:
+        traffic_capture.stop()
+    if allocation_profiler:
+        await allocation_profiler.stop()
+
+
 # Create FastAPI instance
 app = FastAPI(
     title="Daily Real",
     description="App to trace my money",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Initialize database schemas and create tables
 init_database()
 create_tables()
 
+# Bound the database time of each request and cancel its queries when the
+# client disconnects. Added first so it runs innermost, once admitted.
+app.add_middleware(QueryBudgetMiddleware)
+
+# Shed load per route class before requests queue on threads and the DB pool.
+# Added early so it runs inside idempotency and single flight: replays and
+# coalesced reads skip it.
+app.add_middleware(AdmissionMiddleware)
+
+# Replay retried POSTs carrying an Idempotency-Key instead of running them again;
+# keys belong to the user, so a retry with a refreshed token still matches
+app.add_middleware(
+    IdempotencyMiddleware,
+    paths={"/account", "/user/register"},
+    caller=request_caller,
+)
+
+# Share one computation between identical concurrent reads
+app.add_middleware(SingleFlightMiddleware, paths={"/account", "/user/profile", "/me"})
+
+# Compress large responses; added last so it runs outermost and replayed or
+# coalesced responses are compressed for each client's Accept-Encoding
+app.add_middleware(CompressionMiddleware)
+
+# Opt-in (ALLOCATION_PROFILE_SAMPLE): attribute allocations to routes, including
+# validation error payloads and compression
+if allocation_profiler:
+    app.add_middleware(AllocationProfileMiddleware, profiler=allocation_profiler)
+
+# Opt-in (TRAFFIC_CAPTURE_PATH): record sanitized traffic for replay, outermost
+# so timings and sizes are what clients see; callers are told apart by user,
+# so token refreshes do not split one user into several
+if traffic_capture:
+    app.add_middleware(
+        TrafficCaptureMiddleware, capture=traffic_capture, caller=request_caller
+    )
+
 
 # Custom exception handler for validation errors
 @app.exception_handler(RequestValidationError)
@@ -101,6 +225,18 @@ async def generic_exception_handler(request: Request, exc: Exception):
     )
 
 
+@app.exception_handler(OperationalError)
+async def database_timeout_handler(request: Request, exc: OperationalError):
+    """
+    Queries stopped by the request's time budget return 503/504 instead of 500
+    """
+    response = timeout_response(exc)
+    if response is None:
+        return await generic_exception_handler(request, exc)
+    logger.warning(f"Database time budget exceeded on {request.url}: {exc.orig!r}")
+    return response
+
+
 app.include_router(
     user_router,
     prefix="/user",
@@ -111,12 +247,41 @@ app.include_router(
     prefix="/account",
 )
 
+app.include_router(
+    me_router,
+    prefix="/me",
+)
+
 
 @app.get("/health")
+@app.get("/health/live")
 async def health_check():
+    """Liveness: the process is up and serving requests."""
     return JSONResponse(status_code=200, content={"status": "ok"})
 
 
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness: the last background dependency probe passed and not draining."""
+    return JSONResponse(
+        status_code=200 if readiness.ready else 503, content=readiness.status()
+    )
+
+
+@app.get("/metrics")
+async def get_metrics():
+    return JSONResponse(status_code=200, content=metrics.snapshot())
+
+
+if allocation_profiler and ALLOCATION_PROFILE_TOKEN:
+
+    @app.get("/debug/allocations", dependencies=[Depends(require_debug_token)])
+    async def get_allocations(top: int = ALLOCATION_PROFILE_TOP):
+        """Allocations per route and the largest live allocation sites."""
+        report = await anyio.to_thread.run_sync(allocation_profiler.report, top)
+        return JSONResponse(status_code=200, content=report)
+
+
 if __name__ == "__main__":
     import uvicorn
 
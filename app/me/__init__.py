@@ -0,0 +1 @@
+# Me context module for composite views of the current user
@@ -0,0 +1,40 @@
+from fastapi import Query
+from fastapi.params import Depends
+from sqlalchemy.orm import Session
+
+from app.id.public.get_user_by_token import get_user_by_token
+from app.id.public.get_user_read_db import get_user_read_db
+from app.id.public.user_by_token import UserByToken
+from app.me._me_response import MeResponse
+from app.movement.public.list_accounts import list_accounts
+from app.util.exceptions import DomainException
+
+SECTIONS = ("profile", "accounts")
+
+
+def _parse_include(include: str) -> set[str]:
+    sections = {section.strip() for section in include.split(",") if section.strip()}
+    unknown = sections - set(SECTIONS)
+    if unknown:
+        raise DomainException(
+            f"Unknown include section(s): {', '.join(sorted(unknown))}; "
+            f"expected any of {', '.join(SECTIONS)}"
+        )
+    return sections
+
+
+def get_me(
+    include: str = Query(",".join(SECTIONS)),
+    db: Session = Depends(get_user_read_db),
+    current_user: UserByToken = Depends(get_user_by_token),
+) -> MeResponse:
+    """
+    Get the current user's profile and accounts in one request. The token is
+    decoded once and the accounts are read on a single session; sections not
+    listed in `include` are returned as null.
+    """
+    sections = _parse_include(include)
+    return MeResponse(
+        profile=current_user if "profile" in sections else None,
+        accounts=list_accounts(db, current_user.id) if "accounts" in sections else None,
+    )
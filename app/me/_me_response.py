@@ -0,0 +1,11 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from app.id.public.user_by_token import UserByToken
+from app.movement.public.list_accounts import AccountResponse
+
+
+class MeResponse(BaseModel):
+    profile: Optional[UserByToken] = None
+    accounts: Optional[List[AccountResponse]] = None
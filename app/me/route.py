@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+
+from app.me._get_me import get_me
+from app.me._me_response import MeResponse
+
+me_router = APIRouter()
+
+me_router.add_api_route(
+    "",
+    endpoint=get_me,
+    methods=["GET"],
+    response_model=MeResponse,
+    tags=["Me"],
+    summary="Get Current User Overview",
+    description="Get the profile and accounts of the current user in one request. "
+    "Use include=profile,accounts to select sections.",
+)
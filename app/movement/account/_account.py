@@ -1,7 +1,18 @@
 import enum
+import os
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    String,
+    text,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -16,13 +27,38 @@ class AccountType(enum.Enum):
     CASH = "Cash"
 
 
+# Hash partition the account tables by owner into this many partitions; 0 keeps
+# plain tables. Only applies when the tables are created (see create_tables).
+ACCOUNT_PARTITIONS = int(os.getenv("ACCOUNT_PARTITIONS", "0"))
+
+
+def _owner_table_args(*constraints):
+    """Table args for the account tables, partitioned by owner_id when enabled."""
+    options = {"schema": "movement"}
+    if ACCOUNT_PARTITIONS:
+        options["postgresql_partition_by"] = "HASH (owner_id)"
+        options["info"] = {"partitions": ACCOUNT_PARTITIONS}
+    return (*constraints, options)
+
+
+def _account_reference():
+    # Partitioned tables are only unique on (id, owner_id), so reference both
+    if ACCOUNT_PARTITIONS:
+        return ForeignKeyConstraint(
+            ["account_id", "owner_id"],
+            ["movement.accounts.id", "movement.accounts.owner_id"],
+        )
+    return ForeignKeyConstraint(["account_id"], ["movement.accounts.id"])
+
+
 # SQLAlchemy models
 class CreditDetails(Base):
     __tablename__ = "credit_details"
-    __table_args__ = {"schema": "movement"}
+    __table_args__ = _owner_table_args(_account_reference())
 
-    id = Column(Integer, primary_key=True, index=True)
-    account_id = Column(Integer, ForeignKey("movement.accounts.id"), nullable=False)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    owner_id = Column(Integer, nullable=False, primary_key=bool(ACCOUNT_PARTITIONS))
+    account_id = Column(Integer, nullable=False, index=True)
     last_four_digits = Column(String(4), nullable=False)
     billing_cycle_day = Column(Integer, nullable=False)
     due_day = Column(Integer, nullable=False)
@@ -42,10 +78,11 @@ class CreditDetails(Base):
 
 class BankDetail(Base):
     __tablename__ = "bank_details"
-    __table_args__ = {"schema": "movement"}
+    __table_args__ = _owner_table_args(_account_reference())
 
-    id = Column(Integer, primary_key=True, index=True)
-    account_id = Column(Integer, ForeignKey("movement.accounts.id"), nullable=False)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    owner_id = Column(Integer, nullable=False, primary_key=bool(ACCOUNT_PARTITIONS))
+    account_id = Column(Integer, nullable=False, index=True)
     agency = Column(String(10), nullable=False)
     account_number = Column(String(20), nullable=False)
     account_type = Column(String(20), nullable=False)  # "Checking", "Savings"
@@ -65,25 +102,53 @@ class BankDetail(Base):
 
 class Account(Base):
     __tablename__ = "accounts"
-    __table_args__ = {"schema": "movement"}
-
-    id = Column(Integer, primary_key=True, index=True)
+    # Active and archived accounts are indexed apart, so listing active ones
+    # stays proportional to live accounts however many are archived
+    __table_args__ = _owner_table_args(
+        Index(
+            "ix_movement_accounts_active_owner_id_id",
+            "owner_id",
+            "id",
+            postgresql_where=text("archived_at IS NULL"),
+        ),
+        Index(
+            "ix_movement_accounts_archived_owner_id_id",
+            "owner_id",
+            "id",
+            postgresql_where=text("archived_at IS NOT NULL"),
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     name = Column(String(32), nullable=False)
     type = Column(Enum(AccountType), nullable=False)
+    owner_id = Column(
+        Integer,
+        ForeignKey("id.users.id"),
+        nullable=False,
+        primary_key=bool(ACCOUNT_PARTITIONS),
+    )
     created_by = Column(String(128), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    archived_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships to detail tables
     credit_details = relationship("CreditDetails", uselist=False)
     bank_detail = relationship("BankDetail", uselist=False)
 
-    def __init__(self, payload: AccountCreate, created_by: str):
+    # Accounts are identified by id alone, even when owner_id joins the table's key
+    __mapper_args__ = {"primary_key": [id]}
+
+    def __init__(self, payload: AccountCreate, created_by: str, owner_id: int):
         if not payload.name:
             raise DomainException("Account name cannot be empty")
         if not created_by:
             raise DomainException("Created by cannot be empty")
+        if not owner_id:
+            raise DomainException("Owner cannot be empty")
 
         self.name = payload.name
+        self.owner_id = owner_id
         self.created_by = created_by
         self.created_at = datetime.now()
 
@@ -94,6 +159,7 @@ class Account(Base):
                 account_number=payload.bank_detail.account_number,
                 account_type=payload.bank_detail.account_type,
             )
+            self.bank_detail.owner_id = owner_id
         elif payload.credit_details:
             self.type = AccountType.CREDIT_CARD
             self.credit_details = CreditDetails(
@@ -101,6 +167,7 @@ class Account(Base):
                 billing_cycle_day=payload.credit_details.billing_cycle_day,
                 due_day=payload.credit_details.due_day,
             )
+            self.credit_details.owner_id = owner_id
         else:
             raise DomainException(
                 "Must provide either credit details or bank details for account configuration"
@@ -5,8 +5,8 @@ from pydantic import BaseModel, Field
 
 class CreditDetailsCreate(BaseModel):
     last_four_digits: str = Field(..., pattern=r"^\d{4}$")
-    billing_cycle_day: int = Field(..., ge=1, le=30)
-    due_day: int = Field(..., ge=1, le=30)
+    billing_cycle_day: int = Field(..., ge=1, le=31)
+    due_day: int = Field(..., ge=1, le=31)
 
 
 class BankDetailCreate(BaseModel):
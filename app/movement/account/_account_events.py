@@ -0,0 +1,147 @@
+import json
+import os
+
+from fastapi import Header
+from fastapi.params import Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Sequence, text
+from sqlalchemy.orm import Session
+
+from app.id.public.get_user_by_token import get_user_by_token
+from app.id.public.user_by_token import UserByToken
+from app.infra.broadcaster import Broadcaster, Event, PgListener
+from app.infra.database import Base, engine
+from app.infra.metrics import metrics
+from app.movement.account._account import Account
+
+ACCOUNT_EVENTS_CHANNEL = "account_events"
+ACCOUNT_EVENTS_HEARTBEAT_SECONDS = float(
+    os.getenv("ACCOUNT_EVENTS_HEARTBEAT_SECONDS", "15")
+)
+# How long clients wait before reconnecting
+ACCOUNT_EVENTS_RETRY_MS = 3000
+# Recent events kept for Last-Event-ID resume, across all users
+ACCOUNT_EVENTS_BUFFER_SIZE = int(os.getenv("ACCOUNT_EVENTS_BUFFER_SIZE", "1000"))
+# Events a slow connection may fall behind before it is closed
+ACCOUNT_EVENTS_MAX_PENDING = int(os.getenv("ACCOUNT_EVENTS_MAX_PENDING", "100"))
+
+# Event ids, ordered across all workers
+account_events_seq = Sequence(
+    "account_events_seq", schema="movement", metadata=Base.metadata
+)
+
+account_events = Broadcaster(ACCOUNT_EVENTS_BUFFER_SIZE, ACCOUNT_EVENTS_MAX_PENDING)
+metrics.gauge("account_event_subscribers", lambda: account_events.subscriber_count)
+
+
+def _event_from_payload(payload: str) -> Event:
+    message = json.loads(payload)
+    return Event(
+        id=message["id"],
+        topic=message["owner_id"],
+        type=message["type"],
+        data=message["data"],
+    )
+
+
+def _on_listen(conn):
+    # Events after the current sequence value will be received from now on
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f"SELECT last_value, is_called FROM movement.{account_events_seq.name}"
+        )
+        last_value, is_called = cursor.fetchone()
+    account_events.mark_complete_after(last_value if is_called else last_value - 1)
+
+
+account_events_listener = PgListener(
+    engine,
+    ACCOUNT_EVENTS_CHANNEL,
+    on_notify=lambda payload: account_events.publish(_event_from_payload(payload)),
+    on_connect=_on_listen,
+)
+
+
+# Takes the event id and queues the notification in a single round trip
+_NOTIFY = text(
+    f"""
+    SELECT id, pg_notify(
+        :channel,
+        json_build_object(
+            'id', id,
+            'owner_id', :owner_id,
+            'type', :type,
+            'data', json_build_object('account_id', :account_id)
+        )::text
+    )
+    FROM (SELECT nextval('movement.{account_events_seq.name}') AS id) AS event
+    """
+)
+
+
+def notify_account_changed(
+    db: Session, owner_id: int, account_id: int, event_type: str
+) -> Event:
+    """
+    Queue a notification of `event_type` in the caller's transaction; other
+    workers receive it on commit. Publish the returned event locally after
+    committing.
+    """
+    event_id = db.execute(
+        _NOTIFY,
+        {
+            "channel": ACCOUNT_EVENTS_CHANNEL,
+            "owner_id": owner_id,
+            "type": event_type,
+            "account_id": account_id,
+        },
+    ).scalar_one()
+    return Event(
+        id=event_id,
+        topic=owner_id,
+        type=event_type,
+        data={"account_id": account_id},
+    )
+
+
+def notify_account_created(db: Session, account: Account) -> Event:
+    return notify_account_changed(db, account.owner_id, account.id, "account_created")
+
+
+async def get_account_events(
+    last_event_id: int | None = Header(None, alias="Last-Event-ID"),
+    current_user: UserByToken = Depends(get_user_by_token),
+):
+    """
+    Stream changes to the current user's accounts as Server-Sent Events.
+    A `reset` event means events were missed and the accounts should be
+    reloaded.
+    """
+
+    async def stream():
+        subscription, complete = account_events.subscribe(
+            current_user.id, last_event_id
+        )
+        try:
+            yield f"retry: {ACCOUNT_EVENTS_RETRY_MS}\n\n"
+            if not complete:
+                yield "event: reset\ndata: {}\n\n"
+            while True:
+                events = await subscription.next_events(
+                    ACCOUNT_EVENTS_HEARTBEAT_SECONDS
+                )
+                if not events and not subscription.overflowed:
+                    yield ": heartbeat\n\n"
+                for event in events:
+                    yield event.encode()
+                if subscription.overflowed:
+                    # The client reconnects and resumes from the last delivered id
+                    break
+        finally:
+            account_events.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
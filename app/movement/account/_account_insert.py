@@ -0,0 +1,81 @@
+from sqlalchemy import bindparam, cast, insert, select
+from sqlalchemy.orm import Session
+
+from app.infra.database import PreparedStatement
+from app.movement.account._account import Account, BankDetail, CreditDetails
+
+
+def _insert_with_detail(name: str, detail, columns: list[str]) -> PreparedStatement:
+    """Insert an account and its detail row in one statement, via a CTE."""
+    accounts = Account.__table__
+    new_account = (
+        insert(accounts)
+        .values(
+            {
+                column: bindparam(column)
+                for column in ("name", "type", "owner_id", "created_by", "created_at")
+            }
+        )
+        .returning(accounts.c.id, accounts.c.owner_id)
+        .cte("new_account")
+    )
+    details = detail.__table__
+    return PreparedStatement(
+        name,
+        insert(details)
+        .from_select(
+            ["owner_id", "account_id", *columns],
+            select(
+                new_account.c.owner_id,
+                new_account.c.id,
+                *[
+                    cast(bindparam(column), details.c[column].type)
+                    for column in columns
+                ],
+            ),
+        )
+        .returning(details.c.account_id),
+    )
+
+
+_insert_bank_account = _insert_with_detail(
+    "movement_insert_bank_account",
+    BankDetail,
+    ["agency", "account_number", "account_type"],
+)
+_insert_credit_card = _insert_with_detail(
+    "movement_insert_credit_card",
+    CreditDetails,
+    ["last_four_digits", "billing_cycle_day", "due_day"],
+)
+
+
+def insert_account(db: Session, account: Account):
+    """
+    Insert a new account and its details in a single round trip and set
+    `account.id`. The account is not added to the session.
+    """
+    params = {
+        "name": account.name,
+        "type": account.type,
+        "owner_id": account.owner_id,
+        "created_by": account.created_by,
+        "created_at": account.created_at,
+    }
+    if account.bank_detail is not None:
+        statement = _insert_bank_account
+        detail = account.bank_detail
+        params.update(
+            agency=detail.agency,
+            account_number=detail.account_number,
+            account_type=detail.account_type,
+        )
+    else:
+        statement = _insert_credit_card
+        detail = account.credit_details
+        params.update(
+            last_four_digits=detail.last_four_digits,
+            billing_cycle_day=detail.billing_cycle_day,
+            due_day=detail.due_day,
+        )
+    account.id = statement.execute(db, **params).scalar_one()
@@ -0,0 +1,60 @@
+import os
+
+from pydantic import TypeAdapter
+from sqlalchemy import BigInteger, Column, Integer, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.infra.database import Base
+from app.infra.response_cache import ResponseCache
+from app.movement.account._account_response import (
+    AccountDetailResponse,
+    AccountResponse,
+)
+
+ACCOUNT_LIST_CACHE_BYTES = int(
+    os.getenv("ACCOUNT_LIST_CACHE_BYTES", str(64 * 1024 * 1024))
+)
+ACCOUNT_CACHE_BYTES = int(os.getenv("ACCOUNT_CACHE_BYTES", str(16 * 1024 * 1024)))
+
+
+class AccountListVersion(Base):
+    """
+    Bumped whenever the user's accounts change, in the same transaction, so
+    cached account lists and accounts are checked with one key lookup.
+    """
+
+    __tablename__ = "account_list_versions"
+    __table_args__ = {"schema": "movement"}
+
+    owner_id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+
+def bump_account_list_version(db: Session, owner_id: int):
+    """Invalidate the owner's cached accounts inside the caller's transaction."""
+    statement = insert(AccountListVersion).values(owner_id=owner_id, version=1)
+    db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[AccountListVersion.owner_id],
+            set_={"version": AccountListVersion.version + 1},
+        )
+    )
+
+
+def account_list_version(db: Session, owner_id: int) -> int:
+    version = db.scalar(
+        select(AccountListVersion.version).where(
+            AccountListVersion.owner_id == owner_id
+        )
+    )
+    return version or 0
+
+
+# Serialized GET /account bodies per owner, with their compressed variants
+account_list_cache = ResponseCache("account_list", ACCOUNT_LIST_CACHE_BYTES)
+accounts_adapter = TypeAdapter(list[AccountResponse])
+
+# Serialized GET /account/{id} bodies per (owner, account id)
+account_cache = ResponseCache("account", ACCOUNT_CACHE_BYTES)
+account_adapter = TypeAdapter(AccountDetailResponse)
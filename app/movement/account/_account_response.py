@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
 
 from app.movement.account._account import AccountType
 
@@ -32,3 +33,34 @@ class AccountResponse(BaseModel):
     created_at: datetime
     credit_details: Optional[CreditDetailsResponse] = None
     bank_detail: Optional[BankDetailResponse] = None
+
+
+class AccountDetailResponse(AccountResponse):
+    archived_at: Optional[datetime] = None
+
+
+class ArchivedAccountResponse(AccountResponse):
+    archived_at: datetime
+
+
+class ArchivedAccountsPage(BaseModel):
+    accounts: List[ArchivedAccountResponse]
+    # Pass as `after` to get the next page; null on the last page
+    next_after: Optional[int] = None
+
+
+@lru_cache(maxsize=None)
+def partial_accounts_adapter(fields: frozenset[str]) -> TypeAdapter:
+    """
+    Validator and serializer for a list of accounts trimmed to `fields`,
+    built once per shape.
+    """
+    model = create_model(
+        "PartialAccountResponse",
+        **{
+            name: (field.annotation, field)
+            for name, field in AccountResponse.model_fields.items()
+            if name in fields
+        },
+    )
+    return TypeAdapter(List[model])
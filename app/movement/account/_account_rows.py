@@ -0,0 +1,66 @@
+from sqlalchemy import and_, select
+
+from app.movement.account._account import Account, BankDetail, CreditDetails
+
+
+def select_accounts():
+    """
+    Every column of the account response, archived_at included, with the
+    detail rows joined in the same query. Details are matched on owner_id
+    too, so partitioned tables are pruned to the owner's partition.
+    """
+    return (
+        select(
+            Account.id,
+            Account.name,
+            Account.type,
+            Account.created_by,
+            Account.created_at,
+            Account.archived_at,
+            BankDetail.agency,
+            BankDetail.account_number,
+            BankDetail.account_type,
+            CreditDetails.last_four_digits,
+            CreditDetails.billing_cycle_day,
+            CreditDetails.due_day,
+        )
+        .outerjoin(
+            BankDetail,
+            and_(
+                BankDetail.account_id == Account.id,
+                BankDetail.owner_id == Account.owner_id,
+            ),
+        )
+        .outerjoin(
+            CreditDetails,
+            and_(
+                CreditDetails.account_id == Account.id,
+                CreditDetails.owner_id == Account.owner_id,
+            ),
+        )
+    )
+
+
+def account_dict(row) -> dict:
+    return {
+        "id": row.id,
+        "name": row.name,
+        "type": row.type,
+        "created_by": row.created_by,
+        "created_at": row.created_at,
+        "archived_at": row.archived_at,
+        "bank_detail": None
+        if row.agency is None
+        else {
+            "agency": row.agency,
+            "account_number": row.account_number,
+            "account_type": row.account_type,
+        },
+        "credit_details": None
+        if row.last_four_digits is None
+        else {
+            "last_four_digits": row.last_four_digits,
+            "billing_cycle_day": row.billing_cycle_day,
+            "due_day": row.due_day,
+        },
+    }
@@ -0,0 +1,94 @@
+from sqlalchemy import Column, DateTime, Enum, Integer, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.infra.database import Base
+from app.movement.account._account import Account, AccountType
+
+
+class AccountSummary(Base):
+    """
+    Per-user counters of active accounts, maintained in the account write
+    path. Archived accounts are not counted.
+    """
+
+    __tablename__ = "account_summaries"
+    __table_args__ = {"schema": "movement"}
+
+    owner_id = Column(Integer, primary_key=True)
+    type = Column(Enum(AccountType), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    last_created_at = Column(DateTime(timezone=True))
+
+
+def record_account_created(db: Session, account: Account):
+    """Bump the counters for a new account inside the caller's transaction."""
+    statement = insert(AccountSummary).values(
+        owner_id=account.owner_id,
+        type=account.type,
+        count=1,
+        last_created_at=account.created_at,
+    )
+    db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[AccountSummary.owner_id, AccountSummary.type],
+            set_={
+                "count": AccountSummary.count + 1,
+                "last_created_at": func.greatest(
+                    AccountSummary.last_created_at, statement.excluded.last_created_at
+                ),
+            },
+        )
+    )
+
+
+def record_account_archived(db: Session, account: Account, archived: bool):
+    """
+    Take an account out of the active counters, or put it back when it is
+    unarchived, inside the caller's transaction. Call it after the account's
+    archived_at has been updated, so `last_created_at` is recomputed from the
+    remaining active accounts, as a rebuild would.
+    """
+    if archived:
+        last_created_at = (
+            select(func.max(Account.created_at))
+            .where(
+                Account.owner_id == account.owner_id,
+                Account.type == account.type,
+                Account.archived_at.is_(None),
+            )
+            .scalar_subquery()
+        )
+        db.query(AccountSummary).filter(
+            AccountSummary.owner_id == account.owner_id,
+            AccountSummary.type == account.type,
+        ).update(
+            {
+                AccountSummary.count: AccountSummary.count - 1,
+                AccountSummary.last_created_at: last_created_at,
+            },
+            synchronize_session=False,
+        )
+    else:
+        record_account_created(db, account)
+
+
+def rebuild_account_summaries(db: Session):
+    """Recompute every counter from the active accounts."""
+    # Hold off concurrent account inserts until the rebuilt counters commit
+    db.execute(text(f"LOCK TABLE {Account.__table__.fullname} IN SHARE MODE"))
+    db.query(AccountSummary).delete()
+    db.execute(
+        insert(AccountSummary).from_select(
+            ["owner_id", "type", "count", "last_created_at"],
+            select(
+                Account.owner_id,
+                Account.type,
+                func.count(Account.id),
+                func.max(Account.created_at),
+            )
+            .where(Account.archived_at.is_(None))
+            .group_by(Account.owner_id, Account.type),
+        )
+    )
+    db.commit()
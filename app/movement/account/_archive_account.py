@@ -0,0 +1,79 @@
+from fastapi import HTTPException, Response, status
+from fastapi.params import Depends
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.id.public.get_user_by_token import get_user_by_token
+from app.id.public.user_by_token import UserByToken
+from app.infra.database import get_db, mark_write
+from app.movement.account._account import Account
+from app.movement.account._account_events import (
+    account_events,
+    notify_account_changed,
+)
+from app.movement.account._account_list_cache import bump_account_list_version
+from app.movement.account._account_summary import record_account_archived
+
+
+def _set_archived(
+    db: Session, account_id: int, current_user: UserByToken, archived: bool
+) -> Response:
+    changed = db.execute(
+        update(Account)
+        .where(
+            Account.id == account_id,
+            Account.owner_id == current_user.id,
+            Account.archived_at.is_(None)
+            if archived
+            else Account.archived_at.is_not(None),
+        )
+        .values(archived_at=func.now() if archived else None)
+        .returning(Account.id, Account.owner_id, Account.type, Account.created_at)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if changed is None:
+        exists = (
+            db.query(Account.id)
+            .filter(Account.id == account_id, Account.owner_id == current_user.id)
+            .first()
+        )
+        if exists is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Account not found"
+            )
+        # Already in the requested state
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    record_account_archived(db, changed, archived)
+    bump_account_list_version(db, current_user.id)
+    event = notify_account_changed(
+        db,
+        current_user.id,
+        account_id,
+        "account_archived" if archived else "account_unarchived",
+    )
+    db.commit()
+    mark_write(current_user.email)
+    account_events.publish(event)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def post_archive(
+    account_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserByToken = Depends(get_user_by_token),
+):
+    """
+    Archive an account of the current user: it is left out of account
+    lists, statements and counts until unarchived.
+    """
+    return _set_archived(db, account_id, current_user, archived=True)
+
+
+def post_unarchive(
+    account_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserByToken = Depends(get_user_by_token),
+):
+    """Make an archived account of the current user active again."""
+    return _set_archived(db, account_id, current_user, archived=False)
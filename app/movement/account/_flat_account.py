@@ -0,0 +1,95 @@
+from types import SimpleNamespace
+
+from sqlalchemy import CheckConstraint, Column, DateTime, Enum, Integer, String
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.infra.database import Base
+from app.movement.account._account import Account, AccountType
+
+
+class FlatAccount(Base):
+    """
+    Single-row account layout: type-specific details live in nullable columns
+    of the account row, guarded by CHECK constraints, so reads touch one table.
+
+    Created and backfilled by migrations/002_flat_accounts.sql.
+    """
+
+    __tablename__ = "flat_accounts"
+    __table_args__ = (
+        CheckConstraint(
+            "type <> 'BANK' OR (bank_agency IS NOT NULL"
+            " AND bank_account_number IS NOT NULL"
+            " AND bank_account_type IS NOT NULL"
+            " AND credit_last_four_digits IS NULL)",
+            name="ck_flat_accounts_bank_detail",
+        ),
+        CheckConstraint(
+            "type <> 'CREDIT_CARD' OR (credit_last_four_digits IS NOT NULL"
+            " AND credit_billing_cycle_day BETWEEN 1 AND 31"
+            " AND credit_due_day BETWEEN 1 AND 31"
+            " AND bank_agency IS NULL)",
+            name="ck_flat_accounts_credit_details",
+        ),
+        {"schema": "movement"},
+    )
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(32), nullable=False)
+    type = Column(Enum(AccountType), nullable=False)
+    owner_id = Column(Integer, nullable=False, index=True)
+    created_by = Column(String(128), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    bank_agency = Column(String(10))
+    bank_account_number = Column(String(20))
+    bank_account_type = Column(String(20))
+
+    credit_last_four_digits = Column(String(4))
+    credit_billing_cycle_day = Column(Integer)
+    credit_due_day = Column(Integer)
+
+    @classmethod
+    def from_account(cls, account: Account) -> "FlatAccount":
+        row = cls(
+            name=account.name,
+            type=account.type,
+            owner_id=account.owner_id,
+            created_by=account.created_by,
+            created_at=account.created_at,
+        )
+        if account.bank_detail:
+            row.bank_agency = account.bank_detail.agency
+            row.bank_account_number = account.bank_detail.account_number
+            row.bank_account_type = account.bank_detail.account_type
+        if account.credit_details:
+            row.credit_last_four_digits = account.credit_details.last_four_digits
+            row.credit_billing_cycle_day = account.credit_details.billing_cycle_day
+            row.credit_due_day = account.credit_details.due_day
+        return row
+
+    # Same attribute shape as Account, so AccountResponse validates either one
+    @property
+    def bank_detail(self):
+        if self.bank_agency is None:
+            return None
+        return SimpleNamespace(
+            agency=self.bank_agency,
+            account_number=self.bank_account_number,
+            account_type=self.bank_account_type,
+        )
+
+    @property
+    def credit_details(self):
+        if self.credit_last_four_digits is None:
+            return None
+        return SimpleNamespace(
+            last_four_digits=self.credit_last_four_digits,
+            billing_cycle_day=self.credit_billing_cycle_day,
+            due_day=self.credit_due_day,
+        )
+
+
+def list_flat_accounts(db: Session, owner_id: int):
+    return db.query(FlatAccount).filter(FlatAccount.owner_id == owner_id).all()
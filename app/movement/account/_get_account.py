@@ -0,0 +1,54 @@
+from fastapi import HTTPException, Request, status
+from fastapi.params import Depends
+from sqlalchemy import bindparam
+from sqlalchemy.orm import Session
+
+from app.id.public.get_user_by_token import get_user_by_token
+from app.id.public.get_user_read_db import get_user_read_db
+from app.id.public.user_by_token import UserByToken
+from app.infra.database import PreparedStatement
+from app.movement.account._account import Account
+from app.movement.account._account_list_cache import (
+    account_adapter,
+    account_cache,
+    account_list_version,
+)
+from app.movement.account._account_rows import account_dict, select_accounts
+
+# Primary key lookup; the owner filter is the ownership check, so foreign and
+# missing ids cost the same single-row miss
+_ACCOUNT_BY_ID = PreparedStatement(
+    "movement_get_account",
+    select_accounts().where(
+        Account.id == bindparam("account_id"),
+        Account.owner_id == bindparam("owner_id"),
+    ),
+)
+
+
+def get_account(
+    account_id: int,
+    request: Request,
+    db: Session = Depends(get_user_read_db),
+    current_user: UserByToken = Depends(get_user_by_token),
+):
+    """
+    Get one account of the current user, archived or not, with its details.
+    Served from a cache until the user's accounts change.
+    """
+    key = (current_user.id, account_id)
+    version = account_list_version(db, current_user.id)
+    entry = account_cache.get(key, version)
+    if entry is None:
+        row = _ACCOUNT_BY_ID.execute(
+            db, account_id=account_id, owner_id=current_user.id
+        ).first()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Account not found"
+            )
+        account = account_adapter.validate_python(account_dict(row))
+        entry = account_cache.put(key, version, account_adapter.dump_json(account))
+    return account_cache.response(
+        key, entry, request.headers.get("accept-encoding", "")
+    )
@@ -1,22 +1,64 @@
-from typing import List
+from typing import Optional
 
+from fastapi import Query, Request, Response
 from fastapi.params import Depends
 from sqlalchemy.orm import Session
 
 from app.id.public.get_user_by_token import get_user_by_token
+from app.id.public.get_user_read_db import get_user_read_db
 from app.id.public.user_by_token import UserByToken
-from app.infra.database import get_db
-from app.movement.account._account import Account
-from app.movement.account._account_response import AccountResponse
+from app.movement.account._account_list_cache import (
+    account_list_cache,
+    account_list_version,
+    accounts_adapter,
+)
+from app.movement.account._account_response import partial_accounts_adapter
+from app.movement.public.list_accounts import ACCOUNT_FIELDS, list_accounts
+from app.util.exceptions import DomainException
+
+
+def _parse_fields(fields: str) -> frozenset[str]:
+    selected = frozenset(field.strip() for field in fields.split(",") if field.strip())
+    unknown = selected - set(ACCOUNT_FIELDS)
+    if not selected or unknown:
+        raise DomainException(
+            f"Unknown field(s): {', '.join(sorted(unknown)) or '(none given)'}; "
+            f"expected any of {', '.join(ACCOUNT_FIELDS)}"
+        )
+    return selected
 
 
 def get_accounts(
-    db: Session = Depends(get_db),
+    request: Request,
+    fields: Optional[str] = Query(
+        None, description="Comma separated fields to return, e.g. id,name,type"
+    ),
+    db: Session = Depends(get_user_read_db),
     current_user: UserByToken = Depends(get_user_by_token),
-) -> List[AccountResponse]:
+) -> Response:
     """
-    Get all accounts created by the current user (based on email from token).
+    Get all active accounts owned by the current user (based on the user id from token).
+    Rows are read as plain dicts and validated once against the response model.
+    With `fields`, only those columns are read (detail tables are not joined
+    unless requested) and the response is trimmed to match. The full list is
+    cached serialized and compressed until the user's accounts change.
     """
-    accounts = db.query(Account).filter(Account.created_by == current_user.email).all()
-
-    return [AccountResponse.model_validate(account) for account in accounts]
+    if fields is None:
+        # Read before the accounts, so a concurrent write can only make the
+        # cached body newer than its version, never older
+        version = account_list_version(db, current_user.id)
+        entry = account_list_cache.get(current_user.id, version)
+        if entry is None:
+            accounts = accounts_adapter.validate_python(
+                list_accounts(db, current_user.id)
+            )
+            entry = account_list_cache.put(
+                current_user.id, version, accounts_adapter.dump_json(accounts)
+            )
+        return account_list_cache.response(
+            current_user.id, entry, request.headers.get("accept-encoding", "")
+        )
+    selected = _parse_fields(fields)
+    adapter = partial_accounts_adapter(selected)
+    accounts = adapter.validate_python(list_accounts(db, current_user.id, selected))
+    return Response(adapter.dump_json(accounts), media_type="application/json")
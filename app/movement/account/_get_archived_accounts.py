@@ -0,0 +1,44 @@
+from fastapi import Query
+from fastapi.params import Depends
+from sqlalchemy import bindparam
+from sqlalchemy.orm import Session
+
+from app.id.public.get_user_by_token import get_user_by_token
+from app.id.public.get_user_read_db import get_user_read_db
+from app.id.public.user_by_token import UserByToken
+from app.infra.database import PreparedStatement
+from app.movement.account._account import Account
+from app.movement.account._account_response import ArchivedAccountsPage
+from app.movement.account._account_rows import account_dict, select_accounts
+
+# Keyset paging by id over the archived partial index: each page costs the
+# same however deep it is
+_ARCHIVED_PAGE = PreparedStatement(
+    "movement_list_archived_accounts",
+    select_accounts()
+    .where(Account.owner_id == bindparam("owner_id"))
+    .where(Account.archived_at.is_not(None))
+    .where(Account.id > bindparam("after"))
+    .order_by(Account.id)
+    .limit(bindparam("limit")),
+)
+
+
+def get_archived_accounts(
+    after: int = Query(0, ge=0, description="Return accounts with a greater id"),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_user_read_db),
+    current_user: UserByToken = Depends(get_user_by_token),
+) -> ArchivedAccountsPage:
+    """
+    Page through the current user's archived accounts, oldest first.
+    """
+    # One extra row tells whether there is a next page
+    rows = _ARCHIVED_PAGE.execute(
+        db, owner_id=current_user.id, after=after, limit=limit + 1
+    ).all()
+    accounts = [account_dict(row) for row in rows[:limit]]
+    return ArchivedAccountsPage(
+        accounts=accounts,
+        next_after=accounts[-1]["id"] if len(rows) > limit else None,
+    )
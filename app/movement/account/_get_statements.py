@@ -0,0 +1,87 @@
+from datetime import date
+from typing import List
+
+from fastapi import HTTPException, Query, status
+from fastapi.params import Depends
+from sqlalchemy.orm import Session
+
+from app.id.public.get_user_by_token import get_user_by_token
+from app.id.public.get_user_read_db import get_user_read_db
+from app.id.public.user_by_token import UserByToken
+from app.movement.account._account import Account, CreditDetails
+from app.movement.account._statement_calendar import statement_schedules
+from app.movement.account._statement_response import (
+    CardStatementsResponse,
+    StatementWindowResponse,
+)
+
+
+def _card_query(db: Session, current_user: UserByToken):
+    return (
+        db.query(
+            Account.id,
+            Account.name,
+            CreditDetails.last_four_digits,
+            CreditDetails.billing_cycle_day,
+            CreditDetails.due_day,
+        )
+        .join(
+            CreditDetails,
+            (CreditDetails.account_id == Account.id)
+            & (CreditDetails.owner_id == Account.owner_id),
+        )
+        .filter(Account.owner_id == current_user.id)
+        .filter(Account.archived_at.is_(None))
+        .filter(CreditDetails.owner_id == current_user.id)
+    )
+
+
+def _to_responses(cards, count: int) -> List[CardStatementsResponse]:
+    schedules = statement_schedules(
+        ((card.id, card.billing_cycle_day, card.due_day) for card in cards),
+        today=date.today(),
+        count=count,
+    )
+    return [
+        CardStatementsResponse(
+            account_id=card.id,
+            name=card.name,
+            last_four_digits=card.last_four_digits,
+            billing_cycle_day=card.billing_cycle_day,
+            due_day=card.due_day,
+            statements=[
+                StatementWindowResponse.model_validate(window)
+                for window in schedules[card.id]
+            ],
+        )
+        for card in cards
+    ]
+
+
+def get_statements(
+    count: int = Query(3, ge=1, le=12),
+    db: Session = Depends(get_user_read_db),
+    current_user: UserByToken = Depends(get_user_by_token),
+) -> List[CardStatementsResponse]:
+    """
+    Get current and upcoming statement windows for all credit cards of the user.
+    """
+    cards = _card_query(db, current_user).order_by(Account.id).all()
+    return _to_responses(cards, count)
+
+
+def get_account_statements(
+    account_id: int,
+    count: int = Query(3, ge=1, le=12),
+    db: Session = Depends(get_user_read_db),
+    current_user: UserByToken = Depends(get_user_by_token),
+) -> CardStatementsResponse:
+    """
+    Get current and upcoming statement windows for one credit card of the current user.
+    """
+    card = _card_query(db, current_user).filter(Account.id == account_id).first()
+    if card is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Credit card not found"
+        )
+    return _to_responses([card], count)[0]
@@ -0,0 +1,36 @@
+from fastapi.params import Depends
+from sqlalchemy.orm import Session
+
+from app.id.public.get_user_by_token import get_user_by_token
+from app.id.public.get_user_read_db import get_user_read_db
+from app.id.public.user_by_token import UserByToken
+from app.movement.account._account import AccountType
+from app.movement.account._account_summary import AccountSummary
+from app.movement.account._summary_response import AccountSummaryResponse
+
+
+def get_summary(
+    db: Session = Depends(get_user_read_db),
+    current_user: UserByToken = Depends(get_user_by_token),
+) -> AccountSummaryResponse:
+    """
+    Get account counts per type for the current user from the maintained counters.
+    """
+    rows = (
+        db.query(AccountSummary)
+        .filter(AccountSummary.owner_id == current_user.id)
+        .all()
+    )
+
+    counts = {account_type.value: 0 for account_type in AccountType}
+    for row in rows:
+        counts[row.type.value] = row.count
+
+    return AccountSummaryResponse(
+        counts=counts,
+        total=sum(counts.values()),
+        last_created_at=max(
+            (row.last_created_at for row in rows if row.last_created_at),
+            default=None,
+        ),
+    )
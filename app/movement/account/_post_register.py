@@ -4,9 +4,14 @@ from sqlalchemy.orm import Session
 
 from app.id.public.get_user_by_token import get_user_by_token
 from app.id.public.user_by_token import UserByToken
-from app.infra.database import get_db
+from app.infra.audit import audit_log
+from app.infra.database import get_db, mark_write
 from app.movement.account._account import Account
 from app.movement.account._account_create import AccountCreate
+from app.movement.account._account_events import account_events, notify_account_created
+from app.movement.account._account_insert import insert_account
+from app.movement.account._account_list_cache import bump_account_list_version
+from app.movement.account._account_summary import record_account_created
 
 
 def post_register(
@@ -14,13 +19,25 @@ def post_register(
     db: Session = Depends(get_db),
     current_user: UserByToken = Depends(get_user_by_token),
 ):
-    account_db = Account(payload=account, created_by=current_user.email)
+    account_db = Account(
+        payload=account, created_by=current_user.email, owner_id=current_user.id
+    )
 
-    db.add(account_db)
+    insert_account(db, account_db)
+    record_account_created(db, account_db)
+    bump_account_list_version(db, current_user.id)
+    event = notify_account_created(db, account_db)
     db.commit()
-    db.refresh(account_db)
+    mark_write(current_user.email)
+    account_events.publish(event)
+    audit_log.record(
+        "account_created",
+        user_id=current_user.id,
+        subject=current_user.email,
+        data={"account_id": account_db.id, "type": account_db.type.value},
+    )
     return JSONResponse(
         status_code=201,
         content=None,
-        headers={"Location": f"/accounts/{account_db.id}"},
+        headers={"Location": f"/account/{account_db.id}"},
     )
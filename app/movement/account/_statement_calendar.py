@@ -0,0 +1,91 @@
+import calendar
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Iterable, Tuple
+
+
+@dataclass(frozen=True)
+class StatementWindow:
+    period_start: date
+    closing_date: date
+    due_date: date
+
+
+def _clamp(year: int, month: int, day: int) -> date:
+    """Return the given day of the month, falling back to the month's last day."""
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+def _shift(year: int, month: int, months: int) -> Tuple[int, int]:
+    index = year * 12 + (month - 1) + months
+    return index // 12, index % 12 + 1
+
+
+@lru_cache(maxsize=4096)
+def _calendar(
+    billing_cycle_day: int, due_day: int, year: int, month: int, count: int
+) -> Tuple[StatementWindow, ...]:
+    """
+    Statement windows closing in `month` and the `count - 1` following months.
+
+    Every card sharing the same (billing_cycle_day, due_day) pair shares one
+    entry, so the table holds at most 31 * 31 rows per anchor month.
+    """
+    windows = []
+    previous_year, previous_month = _shift(year, month, -1)
+    previous_closing = _clamp(previous_year, previous_month, billing_cycle_day)
+    for offset in range(count):
+        closing_year, closing_month = _shift(year, month, offset)
+        closing_date = _clamp(closing_year, closing_month, billing_cycle_day)
+
+        # The bill is due on the first due day strictly after closing, which
+        # also covers short months clamping both days to the same date.
+        due_date = _clamp(closing_year, closing_month, due_day)
+        if due_date <= closing_date:
+            due_date = _clamp(*_shift(closing_year, closing_month, 1), due_day)
+
+        windows.append(
+            StatementWindow(
+                period_start=previous_closing + timedelta(days=1),
+                closing_date=closing_date,
+                due_date=due_date,
+            )
+        )
+        previous_closing = closing_date
+    return tuple(windows)
+
+
+def statement_windows(
+    billing_cycle_day: int, due_day: int, today: date, count: int = 3
+) -> Tuple[StatementWindow, ...]:
+    """
+    Current statement window (the one containing `today`) followed by the
+    next `count - 1` windows.
+    """
+    if billing_cycle_day < 1 or billing_cycle_day > 31:
+        raise ValueError("Billing cycle day must be between 1 and 31")
+    if due_day < 1 or due_day > 31:
+        raise ValueError("Due day must be between 1 and 31")
+    if count < 1:
+        raise ValueError("Count must be at least 1")
+
+    year, month = today.year, today.month
+    if today > _clamp(year, month, billing_cycle_day):
+        year, month = _shift(year, month, 1)
+    return _calendar(billing_cycle_day, due_day, year, month, count)
+
+
+def statement_schedules(
+    cards: Iterable[Tuple[int, int, int]], today: date, count: int = 3
+) -> dict[int, Tuple[StatementWindow, ...]]:
+    """
+    Statement windows for many cards in one pass.
+
+    `cards` yields (account_id, billing_cycle_day, due_day) tuples; windows are
+    computed once per distinct day pair and shared by every card using it.
+    """
+    return {
+        account_id: statement_windows(billing_cycle_day, due_day, today, count)
+        for account_id, billing_cycle_day, due_day in cards
+    }
@@ -0,0 +1,21 @@
+from datetime import date
+from typing import List
+
+from pydantic import BaseModel, ConfigDict
+
+
+class StatementWindowResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    period_start: date
+    closing_date: date
+    due_date: date
+
+
+class CardStatementsResponse(BaseModel):
+    account_id: int
+    name: str
+    last_four_digits: str
+    billing_cycle_day: int
+    due_day: int
+    statements: List[StatementWindowResponse]
@@ -0,0 +1,10 @@
+from datetime import datetime
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+
+class AccountSummaryResponse(BaseModel):
+    counts: Dict[str, int]
+    total: int
+    last_created_at: Optional[datetime] = None
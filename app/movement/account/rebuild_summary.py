@@ -0,0 +1,33 @@
+"""
+Rebuild the per-user account counters from the accounts table.
+
+Usage: uv run python -m app.movement.account.rebuild_summary
+"""
+
+import logging
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.id.user._user import User  # noqa: E402, F401
+from app.infra.database import SessionLocal  # noqa: E402
+from app.movement.account._account_summary import (  # noqa: E402
+    rebuild_account_summaries,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    db = SessionLocal()
+    try:
+        rebuild_account_summaries(db)
+    finally:
+        db.close()
+    logger.info("Account summaries rebuilt")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
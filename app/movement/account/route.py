@@ -1,10 +1,26 @@
 from typing import List
 
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 
-from app.movement.account._account_response import AccountResponse
+from app.movement.account._account_events import get_account_events
+from app.movement.account._account_response import (
+    AccountDetailResponse,
+    AccountResponse,
+    ArchivedAccountsPage,
+)
+from app.movement.account._archive_account import post_archive, post_unarchive
+from app.movement.account._get_account import get_account
 from app.movement.account._get_accounts import get_accounts
+from app.movement.account._get_archived_accounts import get_archived_accounts
+from app.movement.account._get_statements import (
+    get_account_statements,
+    get_statements,
+)
+from app.movement.account._get_summary import get_summary
 from app.movement.account._post_register import post_register
+from app.movement.account._statement_response import CardStatementsResponse
+from app.movement.account._summary_response import AccountSummaryResponse
 
 account_router = APIRouter()
 
@@ -25,3 +41,79 @@ account_router.add_api_route(
     tags=["Account"],
     summary="Get accounts by current user",
 )
+
+account_router.add_api_route(
+    "/{account_id:int}",
+    endpoint=get_account,
+    methods=["GET"],
+    response_model=AccountDetailResponse,
+    tags=["Account"],
+    summary="Get an account of the current user",
+)
+
+account_router.add_api_route(
+    "/archived",
+    endpoint=get_archived_accounts,
+    methods=["GET"],
+    response_model=ArchivedAccountsPage,
+    tags=["Account"],
+    summary="Page through archived accounts of the current user",
+)
+
+account_router.add_api_route(
+    "/{account_id:int}/archive",
+    endpoint=post_archive,
+    methods=["POST"],
+    status_code=204,
+    response_model=None,
+    tags=["Account"],
+    summary="Archive an account",
+)
+
+account_router.add_api_route(
+    "/{account_id:int}/unarchive",
+    endpoint=post_unarchive,
+    methods=["POST"],
+    status_code=204,
+    response_model=None,
+    tags=["Account"],
+    summary="Make an archived account active again",
+)
+
+account_router.add_api_route(
+    "/summary",
+    endpoint=get_summary,
+    methods=["GET"],
+    response_model=AccountSummaryResponse,
+    tags=["Account"],
+    summary="Get account counts per type for the current user",
+)
+
+account_router.add_api_route(
+    "/events",
+    endpoint=get_account_events,
+    methods=["GET"],
+    response_class=StreamingResponse,
+    tags=["Account"],
+    summary="Stream changes to the current user's accounts",
+    description="Server-Sent Events stream with heartbeats. Reconnect with "
+    "Last-Event-ID to resume; a reset event means the accounts should be reloaded.",
+)
+
+account_router.add_api_route(
+    "/statements",
+    endpoint=get_statements,
+    methods=["GET"],
+    response_model=List[CardStatementsResponse],
+    tags=["Account Statements"],
+    summary="Get statement windows and due dates for all credit cards",
+)
+
+account_router.add_api_route(
+    "/{account_id:int}/statements",
+    endpoint=get_account_statements,
+    methods=["GET"],
+    response_model=CardStatementsResponse,
+    tags=["Account Statements"],
+    summary="Get statement windows and due dates for a credit card",
+)
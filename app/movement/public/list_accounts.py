@@ -0,0 +1,98 @@
+from functools import lru_cache
+from typing import Callable, List, Optional
+
+from sqlalchemy import and_, bindparam, select
+from sqlalchemy.orm import Session
+
+from app.infra.database import PreparedStatement
+from app.movement.account._account import Account, BankDetail, CreditDetails
+
+# Re-exported: the shape of the accounts returned by list_accounts
+from app.movement.account._account_response import AccountResponse  # noqa: F401
+
+ACCOUNT_FIELDS = (
+    "id",
+    "name",
+    "type",
+    "created_by",
+    "created_at",
+    "bank_detail",
+    "credit_details",
+)
+
+# Detail field -> (table, its columns); the first column is never null, so it
+# tells whether the account has that detail
+_DETAILS = {
+    "bank_detail": (BankDetail, ("agency", "account_number", "account_type")),
+    "credit_details": (
+        CreditDetails,
+        ("last_four_digits", "billing_cycle_day", "due_day"),
+    ),
+}
+
+
+def _detail_dict(row, columns) -> Optional[dict]:
+    if getattr(row, columns[0]) is None:
+        return None
+    return {column: getattr(row, column) for column in columns}
+
+
+@lru_cache(maxsize=None)
+def _account_list(fields: frozenset[str]) -> tuple[PreparedStatement, Callable]:
+    """
+    The query and row converter for one set of fields, built once per shape.
+    Only the requested columns are selected and a detail table is joined only
+    when its field is requested.
+    """
+    plain = [
+        field for field in ACCOUNT_FIELDS if field in fields and field not in _DETAILS
+    ]
+    details = [(field, *_DETAILS[field]) for field in _DETAILS if field in fields]
+    statement = select(*[Account.__table__.c[field] for field in plain]).select_from(
+        Account
+    )
+    for _, model, detail_columns in details:
+        # Matched on owner_id too, so partitioned tables are pruned to the
+        # owner's partition
+        statement = statement.add_columns(
+            *[model.__table__.c[column] for column in detail_columns]
+        ).outerjoin(
+            model,
+            and_(model.account_id == Account.id, model.owner_id == Account.owner_id),
+        )
+    statement = (
+        statement.where(Account.owner_id == bindparam("owner_id"))
+        .where(Account.archived_at.is_(None))
+        .order_by(Account.id)
+    )
+
+    # The full shape keeps its original name; others are named by field mask
+    mask = sum(
+        1 << index for index, field in enumerate(ACCOUNT_FIELDS) if field in fields
+    )
+    name = (
+        "movement_list_accounts"
+        if len(fields) == len(ACCOUNT_FIELDS)
+        else f"movement_list_accounts_{mask:02x}"
+    )
+
+    def to_dict(row) -> dict:
+        account = {field: getattr(row, field) for field in plain}
+        for field, _, detail_columns in details:
+            account[field] = _detail_dict(row, detail_columns)
+        return account
+
+    return PreparedStatement(name, statement), to_dict
+
+
+def list_accounts(
+    db: Session, owner_id: int, fields: Optional[frozenset[str]] = None
+) -> List[dict]:
+    """
+    Active accounts owned by `owner_id` as plain dicts in the `AccountResponse`
+    shape, for use by other contexts. Reads columns with a single Core
+    query, without building ORM objects. With `fields` (a subset of
+    `ACCOUNT_FIELDS`) only those keys are read and returned.
+    """
+    statement, to_dict = _account_list(frozenset(fields or ACCOUNT_FIELDS))
+    return [to_dict(row) for row in statement.execute(db, owner_id=owner_id)]
@@ -0,0 +1,124 @@
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from pydantic import TypeAdapter
+
+from app.id.public.user_by_token import UserByToken
+from app.id.user._auth import (
+    create_access_token,
+    get_password_hash,
+    verify_password,
+    verify_token,
+)
+from app.id.user._post_token import TokenResponse
+from app.id.user._repository import get_user_by_username
+from app.infra.database import (
+    POOL_SIZE,
+    SessionLocal,
+    engine,
+    replica_engine,
+    warm_pool,
+)
+from app.movement.account._account import AccountType
+from app.movement.account._account_response import AccountResponse
+from app.movement.public.list_accounts import list_accounts
+
+logger = logging.getLogger(__name__)
+
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true") == "true"
+
+
+def _warm_pools():
+    warm_pool(engine, POOL_SIZE)
+    if replica_engine is not engine:
+        warm_pool(replica_engine, POOL_SIZE)
+
+
+def _warm_password_hashing():
+    # Loads passlib's bcrypt backend and runs its self test
+    verify_password("warm-up", get_password_hash("warm-up"))
+
+
+def _warm_tokens():
+    verify_token(create_access_token({"sub": "warm-up", "name": "Warm Up", "uid": 0}))
+
+
+def _warm_queries():
+    # Compiles the hot statements and prepares them on a pooled connection
+    db = SessionLocal()
+    try:
+        get_user_by_username(db, "warm-up@invalid")
+        list_accounts(db, 0)
+    finally:
+        db.rollback()
+        db.close()
+
+
+def _warm_serialization():
+    account = {
+        "id": 0,
+        "name": "Warm Up",
+        "type": AccountType.CREDIT_CARD,
+        "created_by": "warm-up@invalid",
+        "created_at": datetime.now(timezone.utc),
+        "credit_details": {
+            "last_four_digits": "0000",
+            "billing_cycle_day": 1,
+            "due_day": 10,
+        },
+        "bank_detail": None,
+    }
+    # What FastAPI does with a response: validate, then serialize
+    adapter = TypeAdapter(list[AccountResponse])
+    adapter.dump_json(adapter.validate_python([account]))
+    UserByToken(id=0, email="warm-up@invalid", name="Warm Up").model_dump_json()
+    TokenResponse(access_token="", token_type="bearer").model_dump_json()
+
+
+STEPS: dict[str, Callable[[], None]] = {
+    "pools": _warm_pools,
+    "password_hashing": _warm_password_hashing,
+    "tokens": _warm_tokens,
+    "queries": _warm_queries,
+    "serialization": _warm_serialization,
+}
+
+
+class WarmUp:
+    """
+    Pays the one-time costs of a fresh process before it reports ready:
+    opening pool connections, loading the bcrypt backend, compiling and
+    preparing hot statements and building serializers. Every step is best
+    effort; a failing step is logged and skipped.
+    """
+
+    def __init__(self, steps: dict[str, Callable[[], None]]):
+        self.steps = steps
+        self.done = False
+
+    def run(self):
+        self.done = False
+        started = time.perf_counter()
+        for name, step in self.steps.items():
+            step_started = time.perf_counter()
+            try:
+                step()
+            except Exception as exc:
+                logger.warning(f"Warm-up step {name} failed: {exc!r}")
+                continue
+            elapsed = (time.perf_counter() - step_started) * 1000
+            logger.info(f"Warm-up step {name} took {elapsed:.0f}ms")
+        self.done = True
+        elapsed = (time.perf_counter() - started) * 1000
+        logger.info(f"Warm-up finished in {elapsed:.0f}ms")
+
+    def check(self):
+        """Readiness check: fail until the warm-up has finished."""
+        if not self.done:
+            raise RuntimeError("warm-up in progress")
+
+
+warmup = WarmUp(STEPS if WARMUP_ENABLED else {})
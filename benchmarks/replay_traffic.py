@@ -0,0 +1,304 @@
+"""
+Replay traffic recorded with TRAFFIC_CAPTURE_PATH against a local instance and
+report per-route latency and errors, optionally compared with a saved run.
+
+Callers, logins and registrations in the capture are mapped to users created
+for the replay, and account ids in paths to accounts seeded for each caller.
+Access tokens are short-lived, so each replay user logs in again every
+--token-refresh seconds and whenever a request is rejected with 401.
+Event streams are skipped. Start the app on a scratch database, then:
+
+    uv run python -m benchmarks.replay_traffic traffic.jsonl traffic.jsonl.1 \
+        --speed 2 --save run.json --compare baseline.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import secrets
+import statistics
+import time
+import uuid
+
+import httpx
+
+PASSWORD = "replay_password123"
+ACCOUNT = {
+    "name": "Replay Account",
+    "bank_detail": {
+        "agency": "0001",
+        "account_number": "000000000",
+        "account_type": "Checking",
+    },
+}
+
+
+def _load(paths: list[str]) -> list[dict]:
+    records = []
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            records.extend(json.loads(line) for line in file if line.strip())
+    return sorted(
+        (
+            record
+            for record in records
+            if not (record.get("response_type") or "").startswith("text/event-stream")
+        ),
+        key=lambda record: record["ts"],
+    )
+
+
+class Replay:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        records: list[dict],
+        token_refresh: float = 60.0,
+    ):
+        self.client = client
+        self.records = records
+        self.token_refresh = token_refresh
+        self.run = secrets.token_hex(2)
+        self.callers: dict[str, dict] = {}
+        self.logins: dict[str, str] = {}
+        self.registrations = itertools.count()
+
+    async def _login(self, email: str) -> dict:
+        response = await self.client.post(
+            "/user/token", data={"username": email, "password": PASSWORD}
+        )
+        response.raise_for_status()
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    async def _register(self, email: str) -> dict:
+        await self.client.post(
+            "/user/register",
+            json={"email": email, "name": "Replay User", "password": PASSWORD},
+        )
+        return await self._login(email)
+
+    async def _refresh(self, caller: dict, rejected: str | None = None):
+        """
+        Log the caller in again once its token is due for refresh, or when the
+        `rejected` Authorization header is still the current one.
+        """
+        async with caller["lock"]:
+            due = time.monotonic() - caller["logged_in_at"] >= self.token_refresh
+            if due or caller["headers"]["Authorization"] == rejected:
+                caller["headers"] = await self._login(caller["email"])
+                caller["logged_in_at"] = time.monotonic()
+
+    async def setup(self, seed_accounts: int):
+        """Create a user per captured caller and login, outside the timed run."""
+        callers = {record["caller"] for record in self.records if record["caller"]}
+        for index, caller in enumerate(sorted(callers)):
+            email = f"c{index}{self.run}@replay.test"
+            headers = await self._register(email)
+            profile = (await self.client.get("/user/profile", headers=headers)).json()
+            accounts = []
+            for _ in range(seed_accounts):
+                response = await self.client.post(
+                    "/account/", json=ACCOUNT, headers=headers
+                )
+                accounts.append(int(response.headers["Location"].rsplit("/", 1)[1]))
+            self.callers[caller] = {
+                "email": email,
+                "headers": headers,
+                "logged_in_at": time.monotonic(),
+                "lock": asyncio.Lock(),
+                "user_id": profile["id"],
+                "accounts": itertools.cycle(accounts or [0]),
+            }
+
+        usernames = {
+            record["body"]["username"]
+            for record in self.records
+            if record["route"] == "/user/token" and record.get("body")
+        }
+        for index, username in enumerate(sorted(usernames)):
+            email = f"l{index}{self.run}@replay.test"
+            await self._register(email)
+            self.logins[username] = email
+
+    def _request(self, record: dict) -> dict:
+        caller = self.callers.get(record["caller"])
+        headers = dict(caller["headers"]) if caller else {}
+        if record["idempotent"]:
+            headers["Idempotency-Key"] = str(uuid.uuid4())
+
+        path = record["path"]
+        if caller and record["route"] and "{" in record["route"]:
+            path = record["route"].format(
+                account_id=next(caller["accounts"]), user_id=caller["user_id"]
+            )
+
+        request = {
+            "method": record["method"],
+            "url": path,
+            "params": record["query"],
+            "headers": headers,
+        }
+        body = record.get("body")
+        if record["route"] == "/user/register" and body:
+            body = {
+                **body,
+                "email": f"r{next(self.registrations)}{self.run}@replay.test",
+                "password": PASSWORD,
+            }
+        if record["route"] == "/user/token" and body:
+            body = {
+                **body,
+                "username": self.logins.get(body.get("username"), ""),
+                # Failed logins are replayed as failures
+                "password": PASSWORD if record["status"] == 200 else "wrong",
+            }
+        if record["body_format"] == "json":
+            request["json"] = body
+        elif record["body_format"] == "form":
+            request["data"] = body
+        return request
+
+    async def run_all(self, speed: float, concurrency: int) -> list[dict]:
+        limit = asyncio.Semaphore(concurrency)
+        started = time.perf_counter()
+        first_ts = self.records[0]["ts"] if self.records else 0
+
+        async def send(record: dict) -> dict:
+            if speed > 0:
+                delay = (record["ts"] - first_ts) / speed
+                await asyncio.sleep(max(0.0, delay - (time.perf_counter() - started)))
+            caller = self.callers.get(record["caller"])
+            async with limit:
+                if caller:
+                    await self._refresh(caller)
+                request = self._request(record)
+                sent = time.perf_counter()
+                status = await self._send(request)
+                if status == 401 and record["status"] != 401 and caller:
+                    # Expired early, or revoked by a replayed logout
+                    rejected = request["headers"]["Authorization"]
+                    await self._refresh(caller, rejected=rejected)
+                    request["headers"].update(caller["headers"])
+                    sent = time.perf_counter()
+                    status = await self._send(request)
+                return {
+                    "route": f"{record['method']} {record['route'] or '(unmatched)'}",
+                    "status": status,
+                    "captured_status": record["status"],
+                    "ms": (time.perf_counter() - sent) * 1000,
+                }
+
+        return await asyncio.gather(*(send(record) for record in self.records))
+
+    async def _send(self, request: dict) -> int | None:
+        try:
+            response = await self.client.request(**request)
+        except httpx.HTTPError:
+            return None
+        return response.status_code
+
+
+def _percentile(values: list[float], share: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * share))]
+
+
+def _summarize(results: list[dict]) -> dict:
+    routes: dict[str, list[dict]] = {}
+    for result in results:
+        routes.setdefault(result["route"], []).append(result)
+    summary = {}
+    for route, items in sorted(routes.items()):
+        timings = sorted(item["ms"] for item in items)
+        summary[route] = {
+            "count": len(items),
+            "errors": sum(
+                1 for item in items if item["status"] is None or item["status"] >= 500
+            ),
+            # Status class differs from the capture, e.g. 404 where it was 200
+            "mismatches": sum(
+                1
+                for item in items
+                if item["status"] is None
+                or item["captured_status"] is None
+                or item["status"] // 100 != item["captured_status"] // 100
+            ),
+            "p50_ms": statistics.median(timings),
+            "p95_ms": _percentile(timings, 0.95),
+            "p99_ms": _percentile(timings, 0.99),
+        }
+    return summary
+
+
+def _print(summary: dict, baseline: dict | None):
+    for route, stats in summary.items():
+        line = (
+            f"{route:<48} n={stats['count']:>6} err={stats['errors']:>4} "
+            f"mismatch={stats['mismatches']:>4} p50={stats['p50_ms']:8.2f}ms "
+            f"p95={stats['p95_ms']:8.2f}ms p99={stats['p99_ms']:8.2f}ms"
+        )
+        before = (baseline or {}).get(route)
+        if before:
+            error_rate = stats["errors"] / stats["count"]
+            before_rate = before["errors"] / before["count"]
+            line += (
+                f" | p50 {stats['p50_ms'] - before['p50_ms']:+8.2f}ms"
+                f" p95 {stats['p95_ms'] - before['p95_ms']:+8.2f}ms"
+                f" p99 {stats['p99_ms'] - before['p99_ms']:+8.2f}ms"
+                f" errors {(error_rate - before_rate) * 100:+6.2f}pp"
+            )
+        print(line)
+
+
+async def _main(args):
+    records = _load(args.captures)
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        timeout=args.timeout,
+        limits=httpx.Limits(max_connections=args.concurrency),
+    ) as client:
+        replay = Replay(client, records, args.token_refresh)
+        await replay.setup(args.seed_accounts)
+        started = time.perf_counter()
+        results = await replay.run_all(args.speed, args.concurrency)
+        elapsed = time.perf_counter() - started
+
+    summary = _summarize(results)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+    print(f"replayed {len(results)} requests in {elapsed:.1f}s")
+    _print(summary, baseline)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(summary, file, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("captures", nargs="+", help="Capture files, any order")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Multiple of the captured pace; 0 sends as fast as possible",
+    )
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--seed-accounts", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument(
+        "--token-refresh",
+        type=float,
+        default=60.0,
+        help="Seconds before each replay user logs in again; keep it below "
+        "ACCESS_TOKEN_EXPIRE_MINUTES",
+    )
+    parser.add_argument("--save", help="Write the per-route summary to this file")
+    parser.add_argument("--compare", help="Summary of an earlier run to diff with")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
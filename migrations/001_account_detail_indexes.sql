@@ -0,0 +1,6 @@
+-- Index the detail tables' foreign keys so loading an account's details is an
+-- index lookup instead of a sequential scan.
+CREATE INDEX IF NOT EXISTS ix_movement_bank_details_account_id
+    ON movement.bank_details (account_id);
+CREATE INDEX IF NOT EXISTS ix_movement_credit_details_account_id
+    ON movement.credit_details (account_id);
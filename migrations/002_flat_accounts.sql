@@ -0,0 +1,60 @@
+-- Single-row account layout (app/movement/account/_flat_account.py).
+-- Creates movement.flat_accounts and backfills it from accounts,
+-- bank_details and credit_details, keeping the account ids.
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS movement.flat_accounts (
+    id SERIAL NOT NULL,
+    name VARCHAR(32) NOT NULL,
+    type accounttype NOT NULL,
+    created_by VARCHAR(128) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    bank_agency VARCHAR(10),
+    bank_account_number VARCHAR(20),
+    bank_account_type VARCHAR(20),
+    credit_last_four_digits VARCHAR(4),
+    credit_billing_cycle_day INTEGER,
+    credit_due_day INTEGER,
+    PRIMARY KEY (id),
+    CONSTRAINT ck_flat_accounts_bank_detail CHECK (
+        type <> 'BANK' OR (
+            bank_agency IS NOT NULL
+            AND bank_account_number IS NOT NULL
+            AND bank_account_type IS NOT NULL
+            AND credit_last_four_digits IS NULL
+        )
+    ),
+    CONSTRAINT ck_flat_accounts_credit_details CHECK (
+        type <> 'CREDIT_CARD' OR (
+            credit_last_four_digits IS NOT NULL
+            AND credit_billing_cycle_day BETWEEN 1 AND 31
+            AND credit_due_day BETWEEN 1 AND 31
+            AND bank_agency IS NULL
+        )
+    )
+);
+
+CREATE INDEX IF NOT EXISTS ix_movement_flat_accounts_created_by
+    ON movement.flat_accounts (created_by);
+
+INSERT INTO movement.flat_accounts (
+    id, name, type, created_by, created_at,
+    bank_agency, bank_account_number, bank_account_type,
+    credit_last_four_digits, credit_billing_cycle_day, credit_due_day
+)
+SELECT
+    a.id, a.name, a.type, a.created_by, a.created_at,
+    b.agency, b.account_number, b.account_type,
+    c.last_four_digits, c.billing_cycle_day, c.due_day
+FROM movement.accounts a
+LEFT JOIN movement.bank_details b ON b.account_id = a.id
+LEFT JOIN movement.credit_details c ON c.account_id = a.id
+ON CONFLICT (id) DO NOTHING;
+
+SELECT setval(
+    pg_get_serial_sequence('movement.flat_accounts', 'id'),
+    COALESCE((SELECT max(id) FROM movement.flat_accounts), 0) + 1,
+    false
+);
+
+COMMIT;
@@ -0,0 +1,45 @@
+-- Key accounts by the numeric user id instead of the creator's email.
+-- Backfills owner_id from id.users by email; accounts whose creator no longer
+-- exists make the NOT NULL step fail and must be fixed by hand first.
+BEGIN;
+
+ALTER TABLE movement.accounts ADD COLUMN IF NOT EXISTS owner_id INTEGER;
+
+UPDATE movement.accounts a
+SET owner_id = u.id
+FROM id.users u
+WHERE u.email = a.created_by AND a.owner_id IS NULL;
+
+ALTER TABLE movement.accounts ALTER COLUMN owner_id SET NOT NULL;
+ALTER TABLE movement.accounts DROP CONSTRAINT IF EXISTS accounts_owner_id_fkey;
+ALTER TABLE movement.accounts
+    ADD CONSTRAINT accounts_owner_id_fkey
+    FOREIGN KEY (owner_id) REFERENCES id.users (id);
+CREATE INDEX IF NOT EXISTS ix_movement_accounts_owner_id_id
+    ON movement.accounts (owner_id, id);
+
+-- Counters are keyed by owner too; rebuild them from the backfilled rows.
+DROP TABLE IF EXISTS movement.account_summaries;
+CREATE TABLE movement.account_summaries (
+    owner_id INTEGER NOT NULL,
+    type accounttype NOT NULL,
+    count INTEGER NOT NULL,
+    last_created_at TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (owner_id, type)
+);
+INSERT INTO movement.account_summaries (owner_id, type, count, last_created_at)
+SELECT owner_id, type, count(id), max(created_at)
+FROM movement.accounts
+GROUP BY owner_id, type;
+
+ALTER TABLE movement.flat_accounts ADD COLUMN IF NOT EXISTS owner_id INTEGER;
+UPDATE movement.flat_accounts f
+SET owner_id = a.owner_id
+FROM movement.accounts a
+WHERE a.id = f.id AND f.owner_id IS NULL;
+ALTER TABLE movement.flat_accounts ALTER COLUMN owner_id SET NOT NULL;
+DROP INDEX IF EXISTS movement.ix_movement_flat_accounts_created_by;
+CREATE INDEX IF NOT EXISTS ix_movement_flat_accounts_owner_id
+    ON movement.flat_accounts (owner_id);
+
+COMMIT;
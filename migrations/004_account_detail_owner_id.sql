@@ -0,0 +1,19 @@
+-- Carry the owner on the detail rows so they can be partitioned (and pruned)
+-- by owner together with their account.
+BEGIN;
+
+ALTER TABLE movement.bank_details ADD COLUMN IF NOT EXISTS owner_id INTEGER;
+UPDATE movement.bank_details d
+SET owner_id = a.owner_id
+FROM movement.accounts a
+WHERE a.id = d.account_id AND d.owner_id IS NULL;
+ALTER TABLE movement.bank_details ALTER COLUMN owner_id SET NOT NULL;
+
+ALTER TABLE movement.credit_details ADD COLUMN IF NOT EXISTS owner_id INTEGER;
+UPDATE movement.credit_details d
+SET owner_id = a.owner_id
+FROM movement.accounts a
+WHERE a.id = d.account_id AND d.owner_id IS NULL;
+ALTER TABLE movement.credit_details ALTER COLUMN owner_id SET NOT NULL;
+
+COMMIT;
@@ -0,0 +1,121 @@
+-- Optional: convert existing account tables to hash partitioning by owner.
+-- Only for deployments that set ACCOUNT_PARTITIONS. The partition count is a
+-- psql variable and must equal ACCOUNT_PARTITIONS, the modulus the app's
+-- models are declared with:
+--
+--     psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -v partitions="$ACCOUNT_PARTITIONS" \
+--         -f migrations/005_partition_account_tables.sql
+--
+-- Without it the transaction fails before anything is changed. Fresh
+-- databases get partitioned tables from create_tables() directly. Run during
+-- a maintenance window: the tables are locked while rows are copied.
+--
+-- Applies after 001-004, before or after 006: archived_at and its partial
+-- indexes are created here as well, and archive state is copied when present.
+BEGIN;
+
+SELECT set_config('migration.account_partitions', :'partitions', true);
+
+LOCK TABLE movement.accounts, movement.bank_details, movement.credit_details
+    IN ACCESS EXCLUSIVE MODE;
+
+ALTER TABLE movement.credit_details RENAME TO credit_details_unpartitioned;
+ALTER TABLE movement.bank_details RENAME TO bank_details_unpartitioned;
+ALTER TABLE movement.accounts RENAME TO accounts_unpartitioned;
+
+-- Renaming a table keeps its index names, so move the old keys out of the way
+-- of the new ones; the other old indexes go with the tables at the end.
+ALTER TABLE movement.credit_details_unpartitioned
+    RENAME CONSTRAINT credit_details_pkey TO credit_details_unpartitioned_pkey;
+ALTER TABLE movement.bank_details_unpartitioned
+    RENAME CONSTRAINT bank_details_pkey TO bank_details_unpartitioned_pkey;
+ALTER TABLE movement.accounts_unpartitioned
+    RENAME CONSTRAINT accounts_pkey TO accounts_unpartitioned_pkey;
+ALTER TABLE movement.accounts_unpartitioned
+    ADD COLUMN IF NOT EXISTS archived_at TIMESTAMP WITH TIME ZONE;
+
+CREATE TABLE movement.accounts (
+    id INTEGER NOT NULL DEFAULT nextval('movement.accounts_id_seq'),
+    name VARCHAR(32) NOT NULL,
+    type accounttype NOT NULL,
+    owner_id INTEGER NOT NULL REFERENCES id.users (id),
+    created_by VARCHAR(128) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    archived_at TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (id, owner_id)
+) PARTITION BY HASH (owner_id);
+ALTER SEQUENCE movement.accounts_id_seq OWNED BY movement.accounts.id;
+
+CREATE TABLE movement.bank_details (
+    id INTEGER NOT NULL DEFAULT nextval('movement.bank_details_id_seq'),
+    owner_id INTEGER NOT NULL,
+    account_id INTEGER NOT NULL,
+    agency VARCHAR(10) NOT NULL,
+    account_number VARCHAR(20) NOT NULL,
+    account_type VARCHAR(20) NOT NULL,
+    PRIMARY KEY (id, owner_id),
+    FOREIGN KEY (account_id, owner_id) REFERENCES movement.accounts (id, owner_id)
+) PARTITION BY HASH (owner_id);
+ALTER SEQUENCE movement.bank_details_id_seq OWNED BY movement.bank_details.id;
+
+CREATE TABLE movement.credit_details (
+    id INTEGER NOT NULL DEFAULT nextval('movement.credit_details_id_seq'),
+    owner_id INTEGER NOT NULL,
+    account_id INTEGER NOT NULL,
+    last_four_digits VARCHAR(4) NOT NULL,
+    billing_cycle_day INTEGER NOT NULL,
+    due_day INTEGER NOT NULL,
+    PRIMARY KEY (id, owner_id),
+    FOREIGN KEY (account_id, owner_id) REFERENCES movement.accounts (id, owner_id)
+) PARTITION BY HASH (owner_id);
+ALTER SEQUENCE movement.credit_details_id_seq OWNED BY movement.credit_details.id;
+
+DO $$
+DECLARE
+    partitions integer := current_setting('migration.account_partitions')::integer;
+BEGIN
+    IF partitions < 1 THEN
+        RAISE EXCEPTION 'partitions must be ACCOUNT_PARTITIONS, got %', partitions;
+    END IF;
+    FOR remainder IN 0..partitions - 1 LOOP
+        EXECUTE format(
+            'CREATE TABLE movement.accounts_p%s PARTITION OF movement.accounts '
+            'FOR VALUES WITH (MODULUS %s, REMAINDER %s)',
+            remainder, partitions, remainder);
+        EXECUTE format(
+            'CREATE TABLE movement.bank_details_p%s PARTITION OF movement.bank_details '
+            'FOR VALUES WITH (MODULUS %s, REMAINDER %s)',
+            remainder, partitions, remainder);
+        EXECUTE format(
+            'CREATE TABLE movement.credit_details_p%s PARTITION OF movement.credit_details '
+            'FOR VALUES WITH (MODULUS %s, REMAINDER %s)',
+            remainder, partitions, remainder);
+    END LOOP;
+END $$;
+
+INSERT INTO movement.accounts
+SELECT id, name, type, owner_id, created_by, created_at, archived_at
+FROM movement.accounts_unpartitioned;
+INSERT INTO movement.bank_details
+SELECT id, owner_id, account_id, agency, account_number, account_type
+FROM movement.bank_details_unpartitioned;
+INSERT INTO movement.credit_details
+SELECT id, owner_id, account_id, last_four_digits, billing_cycle_day, due_day
+FROM movement.credit_details_unpartitioned;
+
+DROP TABLE movement.credit_details_unpartitioned;
+DROP TABLE movement.bank_details_unpartitioned;
+DROP TABLE movement.accounts_unpartitioned;
+
+CREATE INDEX ix_movement_accounts_id ON movement.accounts (id);
+CREATE INDEX ix_movement_accounts_active_owner_id_id
+    ON movement.accounts (owner_id, id) WHERE archived_at IS NULL;
+CREATE INDEX ix_movement_accounts_archived_owner_id_id
+    ON movement.accounts (owner_id, id) WHERE archived_at IS NOT NULL;
+CREATE INDEX ix_movement_bank_details_id ON movement.bank_details (id);
+CREATE INDEX ix_movement_bank_details_account_id ON movement.bank_details (account_id);
+CREATE INDEX ix_movement_credit_details_id ON movement.credit_details (id);
+CREATE INDEX ix_movement_credit_details_account_id
+    ON movement.credit_details (account_id);
+
+COMMIT;
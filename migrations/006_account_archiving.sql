@@ -0,0 +1,34 @@
+-- Let accounts be archived. Active and archived accounts get their own
+-- partial indexes, which replace the full (owner_id, id) index, so active
+-- account reads only touch live rows. Archived accounts are no longer counted
+-- in the summaries, so rebuild them afterwards:
+--     uv run python -m app.movement.account.rebuild_summary
+--
+-- The indexes are built CONCURRENTLY so accounts stay writable meanwhile.
+-- That cannot run inside a transaction: apply this file with plain
+-- `psql -f`, without --single-transaction. If a build is interrupted it
+-- leaves an INVALID index that IF NOT EXISTS would skip; drop it and rerun.
+--
+-- Partitioned deployments (ACCOUNT_PARTITIONS, migration 005): 005 already
+-- creates archived_at and both partial indexes, so skip this file. Tables
+-- partitioned by an earlier 005 need it, but Postgres cannot build or drop an
+-- index on a partitioned table CONCURRENTLY. Run the ALTER TABLE below, then
+-- for each index create it on the parent only, build it CONCURRENTLY on
+-- every partition and attach those, for example:
+--     CREATE INDEX ix_movement_accounts_active_owner_id_id
+--         ON ONLY movement.accounts (owner_id, id) WHERE archived_at IS NULL;
+--     CREATE INDEX CONCURRENTLY ix_movement_accounts_p0_active_owner_id_id
+--         ON movement.accounts_p0 (owner_id, id) WHERE archived_at IS NULL;
+--     ALTER INDEX movement.ix_movement_accounts_active_owner_id_id
+--         ATTACH PARTITION movement.ix_movement_accounts_p0_active_owner_id_id;
+-- and finally `DROP INDEX movement.ix_movement_accounts_owner_id_id` (not
+-- concurrently), which takes a short exclusive lock.
+ALTER TABLE movement.accounts
+    ADD COLUMN IF NOT EXISTS archived_at TIMESTAMP WITH TIME ZONE;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_movement_accounts_active_owner_id_id
+    ON movement.accounts (owner_id, id) WHERE archived_at IS NULL;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_movement_accounts_archived_owner_id_id
+    ON movement.accounts (owner_id, id) WHERE archived_at IS NOT NULL;
+
+DROP INDEX CONCURRENTLY IF EXISTS movement.ix_movement_accounts_owner_id_id;
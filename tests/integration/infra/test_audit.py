@@ -0,0 +1,121 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.infra.audit import SUBJECT_MAX_LENGTH, AuditEvent, AuditLog, audit_log
+from app.infra.metrics import metrics
+
+
+def _events(test_db_session: Session) -> list[AuditEvent]:
+    test_db_session.expire_all()
+    return test_db_session.scalars(select(AuditEvent).order_by(AuditEvent.id)).all()
+
+
+class TestAuditLog:
+    """Test cases for the write-behind audit log."""
+
+    def test_events_are_written_in_batches_on_stop(
+        self, test_engine, test_db_session: Session, clean_database
+    ):
+        """Test queued events are all written when the log stops."""
+        log = AuditLog(bind=test_engine, batch_size=2, flush_interval=0.05)
+        log.start()
+        for index in range(5):
+            log.record("login_failed", subject=f"user{index}@example.com")
+
+        log.stop()
+
+        events = _events(test_db_session)
+        assert [event.subject for event in events] == [
+            f"user{index}@example.com" for index in range(5)
+        ]
+        assert log.pending == 0
+
+    def test_rejected_event_does_not_drop_its_batch(
+        self, test_engine, test_db_session: Session, clean_database
+    ):
+        """Test a batch the table rejects is written event by event."""
+        log = AuditLog(bind=test_engine, batch_size=10, flush_interval=0.05)
+        dropped = metrics.value("audit_events_dropped_total", reason="write_failed")
+        log.start()
+        log.record("login_failed", subject="before@example.com")
+        log.record("x" * 40, subject="rejected@example.com")
+        log.record("login_failed", subject="after@example.com")
+
+        log.stop()
+
+        events = _events(test_db_session)
+        assert [event.subject for event in events] == [
+            "before@example.com",
+            "after@example.com",
+        ]
+        assert (
+            metrics.value("audit_events_dropped_total", reason="write_failed")
+            == dropped + 1
+        )
+
+    def test_full_queue_drops_events(self, test_engine):
+        """Test events over the queue size are dropped and counted."""
+        log = AuditLog(bind=test_engine, max_queue=1)
+        dropped = metrics.value("audit_events_dropped_total", reason="queue_full")
+
+        log.record("login_failed", subject="first@example.com")
+        log.record("login_failed", subject="second@example.com")
+
+        assert log.pending == 1
+        assert (
+            metrics.value("audit_events_dropped_total", reason="queue_full")
+            == dropped + 1
+        )
+
+    def test_auth_and_account_events_are_recorded(
+        self,
+        test_client: TestClient,
+        authenticated_user,
+        test_db_session: Session,
+    ):
+        """Test registration, logins and account creation are audited."""
+        test_client.post(
+            "/user/token",
+            data={"username": authenticated_user["email"], "password": "wrong"},
+        )
+        test_client.post(
+            "/account/",
+            json={
+                "name": "My Card",
+                "credit_details": {
+                    "last_four_digits": "1234",
+                    "billing_cycle_day": 15,
+                    "due_day": 25,
+                },
+            },
+            headers=authenticated_user["headers"],
+        )
+
+        assert audit_log.flush()
+
+        events = _events(test_db_session)
+        assert [event.type for event in events] == [
+            "user_registered",
+            "login_succeeded",
+            "login_failed",
+            "account_created",
+        ]
+        assert {event.subject for event in events} == {authenticated_user["email"]}
+        assert events[-1].data["type"] == "CreditCard"
+
+    def test_oversized_username_is_truncated(
+        self, test_client: TestClient, clean_database, test_db_session: Session
+    ):
+        """Test a failed login with a huge username is still audited."""
+        username = "x" * 1000 + "@example.com"
+
+        response = test_client.post(
+            "/user/token", data={"username": username, "password": "wrong"}
+        )
+
+        assert response.status_code == 401
+        assert audit_log.flush()
+        events = _events(test_db_session)
+        assert [event.type for event in events] == ["login_failed"]
+        assert events[0].subject == username[:SUBJECT_MAX_LENGTH]
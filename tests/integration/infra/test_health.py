@@ -0,0 +1,142 @@
+import asyncio
+import signal
+import time
+
+import httpx
+from fastapi.testclient import TestClient
+
+from app.infra.readiness import ReadinessProbe, install_drain_handler
+
+
+def _failing_check():
+    raise RuntimeError("connection refused")
+
+
+class TestReadinessProbe:
+    """Test cases for the cached readiness probe."""
+
+    async def test_ready_when_all_checks_pass(self):
+        """Test the probe is ready after a passing run."""
+        probe = ReadinessProbe(checks={"database": lambda: None})
+
+        assert not probe.ready
+        await probe.run_once()
+
+        assert probe.ready
+        status = probe.status()
+        assert status["status"] == "ready"
+        assert status["checks"]["database"]["ok"] is True
+        assert status["checks"]["database"]["latency_ms"] >= 0
+
+    async def test_not_ready_when_a_check_fails(self):
+        """Test a failing check reports its error without leaking details."""
+        probe = ReadinessProbe(
+            checks={"database": _failing_check},
+            loop_checks={"threadpool": lambda: None},
+        )
+
+        await probe.run_once()
+
+        assert not probe.ready
+        status = probe.status()
+        assert status["status"] == "not_ready"
+        assert status["checks"]["threadpool"]["ok"] is True
+        assert status["checks"]["database"]["error"] == "RuntimeError"
+
+    async def test_slow_check_times_out(self):
+        """Test a check exceeding the timeout counts as failed."""
+        probe = ReadinessProbe(checks={"database": lambda: time.sleep(1)}, timeout=0.1)
+
+        await probe.run_once()
+
+        assert not probe.ready
+        assert probe.status()["checks"]["database"]["error"] == "TimeoutError"
+
+    async def test_draining_is_not_ready(self):
+        """Test draining reports not ready even when checks pass."""
+        probe = ReadinessProbe(checks={"database": lambda: None})
+        await probe.run_once()
+
+        probe.drain()
+
+        assert not probe.ready
+        assert probe.status()["status"] == "draining"
+
+
+class TestHealthEndpoints:
+    """Test cases for health endpoints."""
+
+    def test_liveness(self, test_client: TestClient):
+        """Test liveness does not depend on any dependency."""
+        response = test_client.get("/health/live")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    def test_readiness_serves_cached_status(self, test_client: TestClient, monkeypatch):
+        """Test readiness returns the last probe result without running checks."""
+        from app.main import readiness
+
+        calls = []
+        outcome = {"error": None}
+
+        def check():
+            calls.append(1)
+            if outcome["error"]:
+                raise outcome["error"]
+
+        monkeypatch.setattr(readiness, "checks", {"database": check})
+        monkeypatch.setattr(readiness, "loop_checks", {})
+        test_client.portal.call(readiness.run_once)
+        probed = len(calls)
+
+        response = test_client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+        assert response.json()["checks"]["database"]["ok"] is True
+
+        # A failure only shows once the probe runs again
+        outcome["error"] = RuntimeError("connection refused")
+        assert test_client.get("/health/ready").status_code == 200
+        assert len(calls) == probed
+
+        test_client.portal.call(readiness.run_once)
+        response = test_client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "not_ready"
+        assert response.json()["checks"]["database"]["error"] == "RuntimeError"
+
+    async def test_sigterm_drains_readiness_only(self, test_engine, monkeypatch):
+        """Test SIGTERM flips readiness to 503, keeps liveness up, then forwards."""
+        from app.main import app, readiness
+
+        monkeypatch.setattr(readiness, "checks", {"database": lambda: None})
+        monkeypatch.setattr(readiness, "loop_checks", {})
+        await readiness.run_once()
+        forwarded = []
+        original = signal.signal(
+            signal.SIGTERM, lambda signum, frame: forwarded.append(signum)
+        )
+        try:
+            install_drain_handler(readiness, 0.05)
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                assert (await client.get("/health/ready")).status_code == 200
+
+                signal.raise_signal(signal.SIGTERM)
+                ready = await client.get("/health/ready")
+                live = await client.get("/health/live")
+
+                assert ready.status_code == 503
+                assert ready.json()["status"] == "draining"
+                assert live.status_code == 200
+                assert forwarded == []
+
+                await asyncio.sleep(0.2)
+                assert forwarded == [signal.SIGTERM]
+        finally:
+            signal.signal(signal.SIGTERM, original)
+            readiness.draining = False
@@ -0,0 +1,62 @@
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.orm import Session
+
+from app.id.user._user import User
+from app.infra.database import PreparedStatement
+
+users_by_name = PreparedStatement(
+    "test_users_by_name",
+    select(User.id, User.email)
+    .where(User.name == bindparam("name"))
+    .order_by(User.id)
+    .limit(10),
+)
+
+
+def _add_user(db: Session, email: str, name: str) -> User:
+    user = User(email=email, name=name)
+    user.update_password("hash")
+    db.add(user)
+    db.commit()
+    return user
+
+
+class TestPreparedStatement:
+    """Test cases for server-side prepared statements."""
+
+    def test_prepared_once_per_connection(
+        self, test_db_session: Session, clean_database
+    ):
+        """Test the statement is prepared once and executed by name after."""
+        first = _add_user(test_db_session, "first@example.com", "Shared")
+        _add_user(test_db_session, "other@example.com", "Other")
+
+        rows = users_by_name.execute(test_db_session, name="Shared").all()
+        again = users_by_name.execute(test_db_session, name="Other").all()
+
+        assert [(row.id, row.email) for row in rows] == [
+            (first.id, "first@example.com")
+        ]
+        assert [row.email for row in again] == ["other@example.com"]
+        prepared = test_db_session.execute(
+            text(
+                "SELECT count(*) FROM pg_prepared_statements "
+                "WHERE name = 'test_users_by_name'"
+            )
+        ).scalar()
+        assert prepared == 1
+
+    def test_loads_orm_entities(self, test_db_session: Session, clean_database):
+        """Test an entity statement returns mapped objects."""
+        user = _add_user(test_db_session, "entity@example.com", "Entity")
+        by_email = PreparedStatement(
+            "test_user_by_email", select(User).where(User.email == bindparam("email"))
+        )
+
+        loaded = (
+            by_email.execute(test_db_session, entity=User, email="entity@example.com")
+            .scalars()
+            .one()
+        )
+
+        assert loaded is user
@@ -0,0 +1,120 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.infra.metrics import metrics
+from app.infra.query_budget import QueryBudgetMiddleware, timeout_response
+
+
+def _app(middleware_app, test_engine, **options):
+    app = middleware_app(QueryBudgetMiddleware, **options)
+
+    @app.exception_handler(OperationalError)
+    async def handle_timeout(request, exc):
+        return timeout_response(exc)
+
+    @app.get("/slow")
+    def slow():
+        with Session(test_engine) as db:
+            db.execute(text("SELECT pg_sleep(2)"))
+        return {"ok": True}
+
+    @app.get("/locked")
+    def locked():
+        with Session(test_engine) as db:
+            db.execute(text("LOCK TABLE id.users IN ACCESS EXCLUSIVE MODE"))
+        return {"ok": True}
+
+    @app.get("/settings")
+    def settings():
+        with Session(test_engine) as db:
+            return {
+                "statement_timeout": db.scalar(text("SHOW statement_timeout")),
+                "lock_timeout": db.scalar(text("SHOW lock_timeout")),
+            }
+
+    return app
+
+
+class TestQueryBudget:
+    """Test cases for database time budgets against Postgres."""
+
+    def test_statement_timeout_returns_504(self, middleware_app, test_engine):
+        """Test a query running past the budget is cancelled with a 504."""
+        before = metrics.value(
+            "db_query_timeouts_total", route_class="read", reason="statement_timeout"
+        )
+        client = TestClient(_app(middleware_app, test_engine, budgets={"read": 200}))
+
+        response = client.get("/slow")
+
+        assert response.status_code == 504
+        assert response.json()["error"] == "Database timeout"
+        assert (
+            metrics.value(
+                "db_query_timeouts_total",
+                route_class="read",
+                reason="statement_timeout",
+            )
+            == before + 1
+        )
+
+    def test_lock_timeout_returns_503(self, middleware_app, test_engine):
+        """Test waiting on a lock held elsewhere gives up with a 503."""
+        client = TestClient(
+            _app(
+                middleware_app, test_engine, budgets={"read": 5000}, lock_timeout_ms=100
+            )
+        )
+
+        with test_engine.connect() as holder:
+            holder.execute(text("LOCK TABLE id.users IN ACCESS EXCLUSIVE MODE"))
+            response = client.get("/locked")
+            holder.rollback()
+
+        assert response.status_code == 503
+        assert "Retry-After" in response.headers
+
+    def test_limits_are_local_to_the_transaction(self, middleware_app, test_engine):
+        """Test the budget is applied per transaction and not left on the pool."""
+        client = TestClient(
+            _app(
+                middleware_app, test_engine, budgets={"read": 3000}, lock_timeout_ms=100
+            )
+        )
+
+        response = client.get("/settings")
+        with Session(test_engine) as db:
+            pooled = db.scalar(text("SHOW statement_timeout"))
+
+        assert response.json()["lock_timeout"] == "100ms"
+        assert response.json()["statement_timeout"].endswith(("s", "ms"))
+        assert response.json()["statement_timeout"] != "0"
+        assert pooled == "0"
+
+    def test_limits_are_sent_with_the_first_statement(
+        self, middleware_app, test_engine
+    ):
+        """Test setting the budget costs no round trip of its own."""
+        client = TestClient(
+            _app(
+                middleware_app, test_engine, budgets={"read": 3000}, lock_timeout_ms=100
+            )
+        )
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine, "after_cursor_execute", record)
+        try:
+            response = client.get("/settings")
+        finally:
+            event.remove(test_engine, "after_cursor_execute", record)
+
+        assert response.json()["lock_timeout"] == "100ms"
+        assert len(statements) == 2
+        assert statements[0].startswith("SET LOCAL statement_timeout")
+        assert statements[0].endswith("SHOW statement_timeout")
+        assert statements[1] == "SHOW lock_timeout"
@@ -0,0 +1,118 @@
+from typing import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+from testcontainers.postgres import PostgresContainer
+
+import app.infra.database as database
+from app.infra.database import Base, get_read_db, mark_write, route_read
+
+
+@pytest.fixture(scope="module")
+def replica_engine(test_engine):
+    """Start a second PostgreSQL instance standing in for the read replica."""
+    with PostgresContainer("postgres:15-alpine") as postgres:
+        engine = create_engine(postgres.get_connection_url())
+        with engine.connect() as conn:
+            conn.execute(text("CREATE SCHEMA IF NOT EXISTS id"))
+            conn.execute(text("CREATE SCHEMA IF NOT EXISTS movement"))
+            conn.commit()
+        Base.metadata.create_all(bind=engine)
+        yield engine
+        engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def replica_session(replica_engine) -> Generator[Session, None, None]:
+    session = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="function")
+def replica_client(test_client: TestClient, replica_session: Session):
+    """Route the app's read sessions to the replica instance."""
+
+    def override_get_read_db():
+        yield replica_session
+
+    database._recent_writes.clear()
+    test_client.app.dependency_overrides[get_read_db] = override_get_read_db
+    yield test_client
+    database._recent_writes.clear()
+
+
+class TestReadReplicaRouting:
+    """Test cases for read routing between the primary and a replica."""
+
+    def test_route_read_prefers_replica(self, test_db_session, replica_session):
+        """Test reads without recent writes go to the replica."""
+        database._recent_writes.clear()
+
+        assert route_read("a@example.com", test_db_session, replica_session) is (
+            replica_session
+        )
+
+    def test_route_read_sticks_to_primary_after_write(
+        self, test_db_session, replica_session
+    ):
+        """Test reads stick to the primary within the stickiness window."""
+        mark_write("a@example.com")
+
+        assert route_read("a@example.com", test_db_session, replica_session) is (
+            test_db_session
+        )
+        assert route_read("b@example.com", test_db_session, replica_session) is (
+            replica_session
+        )
+        database._recent_writes.clear()
+
+    def test_stickiness_expires(self, test_db_session, replica_session, monkeypatch):
+        """Test reads go back to the replica once the window has passed."""
+        monkeypatch.setattr(database, "REPLICA_STICKINESS_SECONDS", 0)
+        mark_write("a@example.com")
+
+        assert route_read("a@example.com", test_db_session, replica_session) is (
+            replica_session
+        )
+
+    def test_user_reads_own_writes_then_replica(
+        self, replica_client: TestClient, clean_database
+    ):
+        """Test a user sees their new account, then reads move to the replica."""
+        replica_client.post(
+            "/user/register",
+            json={
+                "email": "replica@example.com",
+                "name": "Replica User",
+                "password": "secure_password123",
+            },
+        )
+        token = replica_client.post(
+            "/user/token",
+            data={"username": "replica@example.com", "password": "secure_password123"},
+        ).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        replica_client.post(
+            "/account/",
+            json={
+                "name": "My Credit Card",
+                "credit_details": {
+                    "last_four_digits": "1234",
+                    "billing_cycle_day": 15,
+                    "due_day": 5,
+                },
+            },
+            headers=headers,
+        )
+
+        # Within the stickiness window the read is served by the primary
+        assert len(replica_client.get("/account/", headers=headers).json()) == 1
+
+        # Afterwards it is served by the replica, which has not seen the write
+        database._recent_writes.clear()
+        assert replica_client.get("/account/", headers=headers).json() == []
@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infra.metrics import metrics
+from app.infra.single_flight import SingleFlightMiddleware
+
+
+def _counting_app():
+    calls = []
+    app = FastAPI()
+    app.add_middleware(SingleFlightMiddleware, paths={"/items"})
+
+    @app.get("/items")
+    def list_items(page: int = 0):
+        calls.append(page)
+        time.sleep(0.2)
+        return {"calls": len(calls), "page": page}
+
+    @app.post("/items")
+    def create_item():
+        calls.append("post")
+        time.sleep(0.2)
+        return {"calls": len(calls)}
+
+    return app, calls
+
+
+async def _gather(app, requests):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(
+            *[
+                client.request(method, url, headers=headers)
+                for method, url, headers in requests
+            ]
+        )
+
+
+class TestSingleFlight:
+    """Test cases for coalescing identical concurrent reads."""
+
+    async def test_identical_reads_share_one_computation(self):
+        """Test concurrent identical reads run the handler once."""
+        app, calls = _counting_app()
+        headers = {"Authorization": "Bearer a"}
+
+        responses = await _gather(app, [("GET", "/items", headers)] * 5)
+
+        assert len(calls) == 1
+        assert all(response.json() == {"calls": 1, "page": 0} for response in responses)
+        assert SingleFlightMiddleware.coalescing_ratio("/items") > 0
+
+    async def test_different_callers_and_params_are_not_coalesced(self):
+        """Test reads differing in caller or query string run separately."""
+        app, calls = _counting_app()
+
+        await _gather(
+            app,
+            [
+                ("GET", "/items", {"Authorization": "Bearer a"}),
+                ("GET", "/items", {"Authorization": "Bearer b"}),
+                ("GET", "/items?page=2", {"Authorization": "Bearer a"}),
+            ],
+        )
+
+        assert sorted(calls) == [0, 0, 2]
+
+    async def test_writes_bypass_coalescing(self):
+        """Test non-idempotent requests always run."""
+        app, calls = _counting_app()
+
+        await _gather(app, [("POST", "/items", {})] * 3)
+
+        assert calls == ["post", "post", "post"]
+
+    def test_metrics_expose_coalescing(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test the metrics endpoint reports single-flight counters."""
+        test_client.get("/account/", headers=authenticated_user["headers"])
+
+        response = test_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.json()['single_flight_leaders_total{route="/account"}'] >= 1
+        assert 'single_flight_coalescing_ratio{route="/account"}' in response.json()
+        assert metrics.value("single_flight_leaders_total", route="/account") >= 1
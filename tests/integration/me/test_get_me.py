@@ -0,0 +1,76 @@
+from fastapi.testclient import TestClient
+
+
+class TestGetMe:
+    """Test cases for the composite current user endpoint."""
+
+    def _create_account(self, test_client: TestClient, headers):
+        test_client.post(
+            "/account/",
+            json={
+                "name": "My Checking Account",
+                "bank_detail": {
+                    "agency": "1234",
+                    "account_number": "567890123",
+                    "account_type": "Checking",
+                },
+            },
+            headers=headers,
+        )
+
+    def test_profile_and_accounts(self, test_client: TestClient, authenticated_user):
+        """Test both sections are returned by default."""
+        self._create_account(test_client, authenticated_user["headers"])
+
+        response = test_client.get("/me", headers=authenticated_user["headers"])
+
+        assert response.status_code == 200
+        response_data = response.json()
+        assert response_data["profile"]["email"] == authenticated_user["email"]
+        assert response_data["profile"]["name"] == authenticated_user["name"]
+        assert len(response_data["accounts"]) == 1
+        assert response_data["accounts"][0]["name"] == "My Checking Account"
+
+    def test_include_selects_sections(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test sections not listed in include are null."""
+        self._create_account(test_client, authenticated_user["headers"])
+
+        response = test_client.get(
+            "/me?include=profile", headers=authenticated_user["headers"]
+        )
+
+        assert response.status_code == 200
+        assert response.json()["profile"]["email"] == authenticated_user["email"]
+        assert response.json()["accounts"] is None
+
+    def test_accounts_of_other_users_are_not_returned(
+        self, test_client: TestClient, authenticated_user_factory
+    ):
+        """Test only the current user's accounts are listed."""
+        owner = authenticated_user_factory("owner@example.com")
+        other = authenticated_user_factory("other@example.com")
+        self._create_account(test_client, owner["headers"])
+
+        response = test_client.get("/me?include=accounts", headers=other["headers"])
+
+        assert response.status_code == 200
+        assert response.json()["accounts"] == []
+        assert response.json()["profile"] is None
+
+    def test_unknown_section(self, test_client: TestClient, authenticated_user):
+        """Test an unknown include section is rejected."""
+        response = test_client.get(
+            "/me?include=profile,settings", headers=authenticated_user["headers"]
+        )
+
+        assert response.status_code == 400
+        assert response.json()["error"] == "Validation failed"
+        assert "settings" in response.json()["details"]
+
+    def test_me_without_token(self, test_client: TestClient, clean_database):
+        """Test the endpoint requires authentication."""
+        response = test_client.get("/me")
+
+        assert response.status_code == 401
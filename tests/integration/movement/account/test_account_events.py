@@ -0,0 +1,46 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from app.movement.account._account_events import account_events
+
+
+class TestAccountEvents:
+    """Test cases for account change events."""
+
+    def test_account_creation_publishes_event(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test creating an account publishes an account_created event."""
+        headers = authenticated_user["headers"]
+        user_id = test_client.get("/user/profile", headers=headers).json()["id"]
+
+        response = test_client.post(
+            "/account/",
+            json={
+                "name": "My Checking Account",
+                "bank_detail": {
+                    "agency": "1234",
+                    "account_number": "567890123",
+                    "account_type": "Checking",
+                },
+            },
+            headers=headers,
+        )
+        account_id = int(response.headers["Location"].rsplit("/", 1)[1])
+
+        # Delivery happens on the event loop, shortly after the commit
+        deadline = time.monotonic() + 2
+        while not account_events.replay(user_id, 0) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        events = account_events.replay(user_id, 0)
+        assert len(events) == 1
+        assert events[0].type == "account_created"
+        assert events[0].data == {"account_id": account_id}
+
+    def test_events_without_token(self, test_client: TestClient, clean_database):
+        """Test the event stream requires authentication."""
+        response = test_client.get("/account/events")
+
+        assert response.status_code == 401
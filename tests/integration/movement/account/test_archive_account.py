@@ -0,0 +1,170 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.movement.account._account_summary import rebuild_account_summaries
+
+BANK_ACCOUNT = {
+    "name": "My Checking Account",
+    "bank_detail": {
+        "agency": "1234",
+        "account_number": "567890123",
+        "account_type": "Checking",
+    },
+}
+
+CREDIT_CARD = {
+    "name": "My Card",
+    "credit_details": {
+        "last_four_digits": "1234",
+        "billing_cycle_day": 15,
+        "due_day": 25,
+    },
+}
+
+
+def _create(test_client: TestClient, payload: dict, headers: dict) -> int:
+    response = test_client.post("/account/", json=payload, headers=headers)
+    return int(response.headers["Location"].rsplit("/", 1)[1])
+
+
+class TestArchiveAccount:
+    """Test cases for archiving and unarchiving accounts."""
+
+    def test_archived_accounts_are_left_out_of_reads(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test an archived account is not listed, counted or scheduled."""
+        headers = authenticated_user["headers"]
+        bank_id = _create(test_client, BANK_ACCOUNT, headers)
+        card_id = _create(test_client, CREDIT_CARD, headers)
+
+        response = test_client.post(f"/account/{card_id}/archive", headers=headers)
+
+        assert response.status_code == 204
+        accounts = test_client.get("/account/", headers=headers).json()
+        assert [account["id"] for account in accounts] == [bank_id]
+        summary = test_client.get("/account/summary", headers=headers).json()
+        assert summary["counts"] == {"Bank": 1, "CreditCard": 0, "Cash": 0}
+        assert test_client.get("/account/statements", headers=headers).json() == []
+
+    def test_unarchive_restores_the_account(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test an unarchived account is listed and counted again."""
+        headers = authenticated_user["headers"]
+        card_id = _create(test_client, CREDIT_CARD, headers)
+        test_client.post(f"/account/{card_id}/archive", headers=headers)
+
+        response = test_client.post(f"/account/{card_id}/unarchive", headers=headers)
+
+        assert response.status_code == 204
+        accounts = test_client.get("/account/", headers=headers).json()
+        assert [account["id"] for account in accounts] == [card_id]
+        summary = test_client.get("/account/summary", headers=headers).json()
+        assert summary["counts"]["CreditCard"] == 1
+
+    def test_archiving_twice_counts_once(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test repeating an archive is a no-op."""
+        headers = authenticated_user["headers"]
+        _create(test_client, CREDIT_CARD, headers)
+        card_id = _create(test_client, CREDIT_CARD, headers)
+
+        test_client.post(f"/account/{card_id}/archive", headers=headers)
+        response = test_client.post(f"/account/{card_id}/archive", headers=headers)
+
+        assert response.status_code == 204
+        summary = test_client.get("/account/summary", headers=headers).json()
+        assert summary["counts"]["CreditCard"] == 1
+
+    def test_cannot_archive_accounts_of_other_users(
+        self, test_client: TestClient, authenticated_user_factory
+    ):
+        """Test archiving another user's account returns 404."""
+        owner = authenticated_user_factory("owner@example.com")
+        other = authenticated_user_factory("other@example.com")
+        account_id = _create(test_client, BANK_ACCOUNT, owner["headers"])
+
+        response = test_client.post(
+            f"/account/{account_id}/archive", headers=other["headers"]
+        )
+
+        assert response.status_code == 404
+        accounts = test_client.get("/account/", headers=owner["headers"]).json()
+        assert len(accounts) == 1
+
+    def test_rebuilt_summary_skips_archived_accounts(
+        self,
+        test_client: TestClient,
+        authenticated_user,
+        test_db_session: Session,
+    ):
+        """Test rebuilding the counters leaves archived accounts out."""
+        headers = authenticated_user["headers"]
+        _create(test_client, BANK_ACCOUNT, headers)
+        bank_id = _create(test_client, BANK_ACCOUNT, headers)
+        test_client.post(f"/account/{bank_id}/archive", headers=headers)
+
+        rebuild_account_summaries(test_db_session)
+
+        summary = test_client.get("/account/summary", headers=headers).json()
+        assert summary["counts"]["Bank"] == 1
+
+    def test_archiving_the_newest_account_matches_a_rebuild(
+        self,
+        test_client: TestClient,
+        authenticated_user,
+        test_db_session: Session,
+    ):
+        """Test last_created_at falls back to the newest active account."""
+        headers = authenticated_user["headers"]
+        _create(test_client, BANK_ACCOUNT, headers)
+        newest_id = _create(test_client, BANK_ACCOUNT, headers)
+        created = test_client.get("/account/summary", headers=headers).json()
+
+        test_client.post(f"/account/{newest_id}/archive", headers=headers)
+        maintained = test_client.get("/account/summary", headers=headers).json()
+        rebuild_account_summaries(test_db_session)
+        rebuilt = test_client.get("/account/summary", headers=headers).json()
+
+        assert maintained == rebuilt
+        assert maintained["counts"]["Bank"] == 1
+        assert maintained["last_created_at"] < created["last_created_at"]
+
+
+class TestGetArchivedAccounts:
+    """Test cases for paging through archived accounts."""
+
+    def test_pages_through_archived_accounts(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test archived accounts are paged by id with a next cursor."""
+        headers = authenticated_user["headers"]
+        _create(test_client, BANK_ACCOUNT, headers)
+        archived = [_create(test_client, CREDIT_CARD, headers) for _ in range(3)]
+        for account_id in archived:
+            test_client.post(f"/account/{account_id}/archive", headers=headers)
+
+        first = test_client.get("/account/archived?limit=2", headers=headers).json()
+        second = test_client.get(
+            f"/account/archived?limit=2&after={first['next_after']}",
+            headers=headers,
+        ).json()
+
+        assert [account["id"] for account in first["accounts"]] == archived[:2]
+        assert first["next_after"] == archived[1]
+        assert first["accounts"][0]["archived_at"] is not None
+        assert first["accounts"][0]["credit_details"] == CREDIT_CARD["credit_details"]
+        assert [account["id"] for account in second["accounts"]] == archived[2:]
+        assert second["next_after"] is None
+
+    def test_no_archived_accounts(self, test_client: TestClient, authenticated_user):
+        """Test an empty page when nothing is archived."""
+        headers = authenticated_user["headers"]
+        _create(test_client, BANK_ACCOUNT, headers)
+
+        response = test_client.get("/account/archived", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json() == {"accounts": [], "next_after": None}
@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.movement.account._account import Account, AccountType
+from app.movement.account._account_create import AccountCreate
+from app.movement.account._account_response import AccountResponse
+from app.movement.account._flat_account import FlatAccount, list_flat_accounts
+
+
+class TestFlatAccount:
+    """Test cases for the single-row account layout."""
+
+    def test_flat_account_round_trip(self, test_db_session: Session, clean_database):
+        """Test a flat row reads back with the same shape as Account."""
+        account = Account(
+            payload=AccountCreate(
+                name="My Credit Card",
+                credit_details={
+                    "last_four_digits": "1234",
+                    "billing_cycle_day": 31,
+                    "due_day": 10,
+                },
+            ),
+            created_by="flat@example.com",
+            owner_id=1,
+        )
+        test_db_session.add(FlatAccount.from_account(account))
+        test_db_session.commit()
+
+        rows = list_flat_accounts(test_db_session, 1)
+
+        assert len(rows) == 1
+        response = AccountResponse.model_validate(rows[0])
+        assert response.type == AccountType.CREDIT_CARD
+        assert response.credit_details.billing_cycle_day == 31
+        assert response.bank_detail is None
+
+    def test_bank_row_requires_bank_columns(
+        self, test_db_session: Session, clean_database
+    ):
+        """Test the CHECK constraint rejects a bank row without bank details."""
+        test_db_session.add(
+            FlatAccount(
+                name="Broken",
+                type=AccountType.BANK,
+                owner_id=1,
+                created_by="flat@example.com",
+            )
+        )
+
+        with pytest.raises(IntegrityError):
+            test_db_session.commit()
+        test_db_session.rollback()
@@ -0,0 +1,64 @@
+from fastapi.testclient import TestClient
+
+BANK_ACCOUNT = {
+    "name": "My Checking Account",
+    "bank_detail": {
+        "agency": "1234",
+        "account_number": "567890123",
+        "account_type": "Checking",
+    },
+}
+
+
+class TestGetAccount:
+    """Test cases for getting one account by id."""
+
+    def test_location_of_a_new_account(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test the Location returned on creation serves the account."""
+        headers = authenticated_user["headers"]
+        created = test_client.post("/account/", json=BANK_ACCOUNT, headers=headers)
+
+        response = test_client.get(created.headers["Location"], headers=headers)
+
+        assert response.status_code == 200
+        account = response.json()
+        assert created.headers["Location"] == f"/account/{account['id']}"
+        assert account["name"] == "My Checking Account"
+        assert account["bank_detail"] == BANK_ACCOUNT["bank_detail"]
+        assert account["credit_details"] is None
+        assert account["archived_at"] is None
+
+    def test_archiving_refreshes_the_cached_account(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test a cached account reflects a later archive."""
+        headers = authenticated_user["headers"]
+        location = test_client.post(
+            "/account/", json=BANK_ACCOUNT, headers=headers
+        ).headers["Location"]
+        test_client.get(location, headers=headers)
+
+        test_client.post(f"{location}/archive", headers=headers)
+        response = test_client.get(location, headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["archived_at"] is not None
+
+    def test_missing_and_foreign_accounts_are_not_found(
+        self, test_client: TestClient, authenticated_user_factory
+    ):
+        """Test ids of other users' accounts or unknown ids return 404."""
+        owner = authenticated_user_factory("owner@example.com")
+        other = authenticated_user_factory("other@example.com")
+        location = test_client.post(
+            "/account/", json=BANK_ACCOUNT, headers=owner["headers"]
+        ).headers["Location"]
+        test_client.get(location, headers=owner["headers"])
+
+        foreign = test_client.get(location, headers=other["headers"])
+        missing = test_client.get("/account/999999", headers=owner["headers"])
+
+        assert foreign.status_code == 404
+        assert missing.status_code == 404
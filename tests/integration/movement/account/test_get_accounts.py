@@ -0,0 +1,134 @@
+from fastapi.testclient import TestClient
+
+from app.infra.metrics import metrics
+
+BANK_ACCOUNT = {
+    "name": "My Checking Account",
+    "bank_detail": {
+        "agency": "1234",
+        "account_number": "567890123",
+        "account_type": "Checking",
+    },
+}
+
+CREDIT_CARD = {
+    "name": "My Card",
+    "credit_details": {
+        "last_four_digits": "1234",
+        "billing_cycle_day": 15,
+        "due_day": 25,
+    },
+}
+
+
+class TestGetAccounts:
+    """Test cases for listing accounts."""
+
+    def test_accounts_with_their_details(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test each account is listed with its own details, oldest first."""
+        headers = authenticated_user["headers"]
+        test_client.post("/account/", json=BANK_ACCOUNT, headers=headers)
+        test_client.post("/account/", json=CREDIT_CARD, headers=headers)
+
+        response = test_client.get("/account/", headers=headers)
+
+        assert response.status_code == 200
+        bank, card = response.json()
+        assert bank["name"] == "My Checking Account"
+        assert bank["type"] == "Bank"
+        assert bank["created_by"] == authenticated_user["email"]
+        assert bank["bank_detail"] == BANK_ACCOUNT["bank_detail"]
+        assert bank["credit_details"] is None
+        assert card["type"] == "CreditCard"
+        assert card["credit_details"] == CREDIT_CARD["credit_details"]
+        assert card["bank_detail"] is None
+        assert bank["id"] < card["id"]
+
+    def test_accounts_of_other_users_are_not_listed(
+        self, test_client: TestClient, authenticated_user_factory
+    ):
+        """Test only the current user's accounts are listed."""
+        owner = authenticated_user_factory("owner@example.com")
+        other = authenticated_user_factory("other@example.com")
+        test_client.post("/account/", json=BANK_ACCOUNT, headers=owner["headers"])
+
+        response = test_client.get("/account/", headers=other["headers"])
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_cached_list_follows_account_changes(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test repeated reads hit the cache until the accounts change."""
+        headers = authenticated_user["headers"]
+        test_client.post("/account/", json=BANK_ACCOUNT, headers=headers)
+        test_client.get("/account/", headers=headers)
+        hits = metrics.value("response_cache_hits_total", cache="account_list")
+
+        cached = test_client.get("/account/", headers=headers)
+        uncompressed = test_client.get(
+            "/account/", headers={**headers, "Accept-Encoding": "identity"}
+        )
+        test_client.post("/account/", json=CREDIT_CARD, headers=headers)
+        changed = test_client.get("/account/", headers=headers)
+
+        assert (
+            metrics.value("response_cache_hits_total", cache="account_list") == hits + 2
+        )
+        assert len(cached.json()) == 1
+        # Set once by the cache, not repeated by the compression middleware
+        assert cached.headers["vary"] == "Accept-Encoding"
+        assert uncompressed.headers["vary"] == "Accept-Encoding"
+        assert "content-encoding" not in uncompressed.headers
+        assert [account["name"] for account in changed.json()] == [
+            "My Checking Account",
+            "My Card",
+        ]
+
+    def test_fields_trim_the_accounts(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test only the requested fields are returned."""
+        headers = authenticated_user["headers"]
+        test_client.post("/account/", json=BANK_ACCOUNT, headers=headers)
+        test_client.post("/account/", json=CREDIT_CARD, headers=headers)
+
+        response = test_client.get("/account/?fields=id,name,type", headers=headers)
+
+        assert response.status_code == 200
+        bank, card = response.json()
+        assert set(bank) == {"id", "name", "type"}
+        assert bank["name"] == "My Checking Account"
+        assert card["type"] == "CreditCard"
+
+    def test_fields_with_one_detail(self, test_client: TestClient, authenticated_user):
+        """Test a requested detail is returned without the other one."""
+        headers = authenticated_user["headers"]
+        test_client.post("/account/", json=BANK_ACCOUNT, headers=headers)
+        test_client.post("/account/", json=CREDIT_CARD, headers=headers)
+
+        response = test_client.get(
+            "/account/?fields=name, credit_details", headers=headers
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"name": "My Checking Account", "credit_details": None},
+            {"name": "My Card", "credit_details": CREDIT_CARD["credit_details"]},
+        ]
+
+    def test_unknown_fields_are_rejected(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test unknown or empty field lists return a validation error."""
+        headers = authenticated_user["headers"]
+
+        unknown = test_client.get("/account/?fields=id,balance", headers=headers)
+        empty = test_client.get("/account/?fields=", headers=headers)
+
+        assert unknown.status_code == 400
+        assert "balance" in unknown.json()["details"]
+        assert empty.status_code == 400
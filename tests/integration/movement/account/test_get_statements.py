@@ -0,0 +1,123 @@
+from datetime import date
+
+from fastapi.testclient import TestClient
+
+from app.movement.account._statement_calendar import (
+    statement_schedules,
+    statement_windows,
+)
+
+
+class TestStatementCalendar:
+    """Test cases for statement window computation."""
+
+    def test_window_containing_today(self):
+        """Test the current window closes on the next billing cycle day."""
+        windows = statement_windows(15, 25, today=date(2025, 3, 10), count=2)
+
+        assert windows[0].period_start == date(2025, 2, 16)
+        assert windows[0].closing_date == date(2025, 3, 15)
+        assert windows[0].due_date == date(2025, 3, 25)
+        assert windows[1].period_start == date(2025, 3, 16)
+        assert windows[1].closing_date == date(2025, 4, 15)
+
+    def test_due_day_before_billing_day_falls_next_month(self):
+        """Test the due date moves to the following month."""
+        windows = statement_windows(25, 5, today=date(2025, 3, 26), count=1)
+
+        assert windows[0].closing_date == date(2025, 4, 25)
+        assert windows[0].due_date == date(2025, 5, 5)
+
+    def test_short_months_are_clamped(self):
+        """Test days 29-31 fall back to the last day of short months."""
+        windows = statement_windows(31, 30, today=date(2024, 2, 1), count=3)
+
+        assert windows[0].period_start == date(2024, 2, 1)
+        assert windows[0].closing_date == date(2024, 2, 29)
+        assert windows[0].due_date == date(2024, 3, 30)
+        assert windows[1].closing_date == date(2024, 3, 31)
+        assert windows[2].closing_date == date(2024, 4, 30)
+        assert windows[2].due_date == date(2024, 5, 30)
+
+    def test_schedules_for_many_cards(self):
+        """Test cards sharing the same days share the same windows."""
+        schedules = statement_schedules(
+            [(1, 10, 20), (2, 10, 20), (3, 31, 5)], today=date(2025, 1, 1)
+        )
+
+        assert schedules[1] == schedules[2]
+        assert schedules[3][0].closing_date == date(2025, 1, 31)
+        assert schedules[3][0].due_date == date(2025, 2, 5)
+
+
+class TestGetStatements:
+    """Test cases for statement endpoints."""
+
+    def _create_card(self, test_client: TestClient, headers, name="My Card"):
+        response = test_client.post(
+            "/account/",
+            json={
+                "name": name,
+                "credit_details": {
+                    "last_four_digits": "1234",
+                    "billing_cycle_day": 31,
+                    "due_day": 10,
+                },
+            },
+            headers=headers,
+        )
+        return int(response.headers["Location"].rsplit("/", 1)[1])
+
+    def test_statements_for_all_cards(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test listing statement windows for every card of the current user."""
+        self._create_card(test_client, authenticated_user["headers"])
+        test_client.post(
+            "/account/",
+            json={
+                "name": "My Checking Account",
+                "bank_detail": {
+                    "agency": "1234",
+                    "account_number": "567890123",
+                    "account_type": "Checking",
+                },
+            },
+            headers=authenticated_user["headers"],
+        )
+
+        response = test_client.get(
+            "/account/statements?count=2", headers=authenticated_user["headers"]
+        )
+
+        assert response.status_code == 200
+        response_data = response.json()
+        assert len(response_data) == 1
+        assert response_data[0]["billing_cycle_day"] == 31
+        assert len(response_data[0]["statements"]) == 2
+
+    def test_statements_for_one_card(self, test_client: TestClient, authenticated_user):
+        """Test statement windows for a single card."""
+        account_id = self._create_card(test_client, authenticated_user["headers"])
+
+        response = test_client.get(
+            f"/account/{account_id}/statements", headers=authenticated_user["headers"]
+        )
+
+        assert response.status_code == 200
+        assert response.json()["account_id"] == account_id
+        assert len(response.json()["statements"]) == 3
+
+    def test_statements_for_card_of_another_user(
+        self, test_client: TestClient, authenticated_user_factory
+    ):
+        """Test a card of another user is not found."""
+        owner = authenticated_user_factory("owner@example.com")
+        other = authenticated_user_factory("other@example.com")
+        account_id = self._create_card(test_client, owner["headers"])
+
+        response = test_client.get(
+            f"/account/{account_id}/statements", headers=other["headers"]
+        )
+
+        assert response.status_code == 404
@@ -0,0 +1,90 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.movement.account._account_summary import (
+    AccountSummary,
+    rebuild_account_summaries,
+)
+
+CREDIT_CARD = {
+    "name": "My Credit Card",
+    "credit_details": {
+        "last_four_digits": "1234",
+        "billing_cycle_day": 15,
+        "due_day": 5,
+    },
+}
+
+BANK_ACCOUNT = {
+    "name": "My Checking Account",
+    "bank_detail": {
+        "agency": "1234",
+        "account_number": "567890123",
+        "account_type": "Checking",
+    },
+}
+
+
+class TestAccountSummary:
+    """Test cases for account summary endpoint."""
+
+    def test_summary_without_accounts(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test summary of a user without accounts."""
+        response = test_client.get(
+            "/account/summary", headers=authenticated_user["headers"]
+        )
+
+        assert response.status_code == 200
+        response_data = response.json()
+        assert response_data["counts"] == {"Bank": 0, "CreditCard": 0, "Cash": 0}
+        assert response_data["total"] == 0
+        assert response_data["last_created_at"] is None
+
+    def test_summary_counts_accounts_per_type(
+        self, test_client: TestClient, authenticated_user_factory
+    ):
+        """Test summary counts only the current user's accounts per type."""
+        user = authenticated_user_factory("summary@example.com")
+        other = authenticated_user_factory("other@example.com")
+        for payload in (CREDIT_CARD, CREDIT_CARD, BANK_ACCOUNT):
+            test_client.post("/account/", json=payload, headers=user["headers"])
+        test_client.post("/account/", json=BANK_ACCOUNT, headers=other["headers"])
+
+        response = test_client.get("/account/summary", headers=user["headers"])
+
+        assert response.status_code == 200
+        response_data = response.json()
+        assert response_data["counts"] == {"Bank": 1, "CreditCard": 2, "Cash": 0}
+        assert response_data["total"] == 3
+        assert response_data["last_created_at"] is not None
+
+    def test_rebuild_matches_maintained_counters(
+        self,
+        test_client: TestClient,
+        test_db_session: Session,
+        authenticated_user,
+    ):
+        """Test rebuilding the counters gives the same result."""
+        for payload in (CREDIT_CARD, BANK_ACCOUNT):
+            test_client.post(
+                "/account/", json=payload, headers=authenticated_user["headers"]
+            )
+        before = test_client.get(
+            "/account/summary", headers=authenticated_user["headers"]
+        ).json()
+
+        test_db_session.query(AccountSummary).delete()
+        test_db_session.commit()
+        rebuild_account_summaries(test_db_session)
+
+        after = test_client.get(
+            "/account/summary", headers=authenticated_user["headers"]
+        ).json()
+        assert after == before
+
+    def test_summary_without_token(self, test_client: TestClient, clean_database):
+        """Test summary without authentication token."""
+        response = test_client.get("/account/summary")
+        assert response.status_code == 401
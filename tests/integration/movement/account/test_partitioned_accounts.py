@@ -0,0 +1,205 @@
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect, make_url, text
+from sqlalchemy.orm import Session
+
+from app.id.public.user_by_token import UserByToken
+from app.movement.account._account import (
+    ACCOUNT_PARTITIONS,
+    Account,
+    BankDetail,
+    CreditDetails,
+)
+from app.movement.account._account_create import AccountCreate
+from app.movement.account._get_account import _ACCOUNT_BY_ID
+from app.movement.account._get_statements import _card_query
+from app.movement.public.list_accounts import ACCOUNT_FIELDS, _account_list
+
+BANK_ACCOUNT = {
+    "name": "My Checking Account",
+    "bank_detail": {
+        "agency": "1234",
+        "account_number": "567890123",
+        "account_type": "Checking",
+    },
+}
+
+CREDIT_CARD = {
+    "name": "My Card",
+    "credit_details": {
+        "last_four_digits": "1234",
+        "billing_cycle_day": 15,
+        "due_day": 25,
+    },
+}
+
+partitioned_only = pytest.mark.skipif(
+    not ACCOUNT_PARTITIONS, reason="needs the models declared with ACCOUNT_PARTITIONS"
+)
+
+
+def _create(test_client: TestClient, payload: dict, headers: dict) -> int:
+    response = test_client.post("/account/", json=payload, headers=headers)
+    assert response.status_code == 201
+    return int(response.headers["Location"].rsplit("/", 1)[1])
+
+
+def _scanned_partitions(db: Session, statement) -> set[tuple[str, str]]:
+    """(table, remainder) of every partition the plan of `statement` reads."""
+    sql = statement.compile(
+        dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    )
+    plan = "\n".join(row[0] for row in db.execute(text(f"EXPLAIN {sql}")))
+    return set(re.findall(r" on (\w+)_p(\d+)\b", plan))
+
+
+class TestPartitionedRun:
+    """Runs the partitioned tests below in a process with ACCOUNT_PARTITIONS set."""
+
+    @pytest.mark.skipif(ACCOUNT_PARTITIONS > 0, reason="already partitioned")
+    def test_account_endpoints_on_partitioned_tables(
+        self, test_engine, test_database_url
+    ):
+        """Test the real account models work on hash partitioned tables."""
+        # Models read ACCOUNT_PARTITIONS on import, so they are declared in a
+        # fresh interpreter, on a scratch database of the same server
+        url = make_url(test_database_url)
+        database = f"{url.database}_partitioned"
+        admin = test_engine.execution_options(isolation_level="AUTOCOMMIT")
+        with admin.connect() as conn:
+            conn.execute(text(f"DROP DATABASE IF EXISTS {database}"))
+            conn.execute(text(f"CREATE DATABASE {database}"))
+        partitioned_url = url.set(database=database).render_as_string(
+            hide_password=False
+        )
+        try:
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "pytest",
+                    "-q",
+                    "-p",
+                    "no:cacheprovider",
+                    __file__,
+                ],
+                env={
+                    **os.environ,
+                    "ACCOUNT_PARTITIONS": "4",
+                    "DATABASE_URL": partitioned_url,
+                    "TEST_DATABASE_URL": partitioned_url,
+                },
+                capture_output=True,
+                text=True,
+            )
+        finally:
+            with admin.connect() as conn:
+                conn.execute(text(f"DROP DATABASE IF EXISTS {database}"))
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "4 passed" in result.stdout
+
+
+@partitioned_only
+class TestPartitionedAccounts:
+    """Test cases for the account tables partitioned by owner."""
+
+    def test_keys_include_the_owner(self, test_db_session: Session):
+        """Test tables are keyed on (id, owner_id) but accounts map by id alone."""
+        for model in (Account, BankDetail, CreditDetails):
+            assert {column.name for column in model.__table__.primary_key} == {
+                "id",
+                "owner_id",
+            }
+        for model in (BankDetail, CreditDetails):
+            (reference,) = model.__table__.foreign_key_constraints
+            assert [element.target_fullname for element in reference.elements] == [
+                "movement.accounts.id",
+                "movement.accounts.owner_id",
+            ]
+        assert inspect(Account).primary_key == (Account.__table__.c.id,)
+
+        partitions = test_db_session.execute(
+            text(
+                "SELECT inhparent::regclass::text, count(*) FROM pg_inherits "
+                "WHERE inhparent::regclass::text LIKE 'movement.%' "
+                "GROUP BY inhparent"
+            )
+        ).all()
+        assert dict(partitions) == {
+            "movement.accounts": ACCOUNT_PARTITIONS,
+            "movement.bank_details": ACCOUNT_PARTITIONS,
+            "movement.credit_details": ACCOUNT_PARTITIONS,
+        }
+
+    def test_orm_relationships_sync_the_owner(
+        self, test_client: TestClient, test_db_session: Session, authenticated_user
+    ):
+        """Test details saved through the ORM are linked and loaded by both keys."""
+        profile = test_client.get(
+            "/user/profile", headers=authenticated_user["headers"]
+        ).json()
+        account = Account(
+            payload=AccountCreate.model_validate(BANK_ACCOUNT),
+            created_by=authenticated_user["email"],
+            owner_id=profile["id"],
+        )
+        test_db_session.add(account)
+        test_db_session.flush()
+
+        assert account.bank_detail.account_id == account.id
+        assert account.bank_detail.owner_id == profile["id"]
+
+        test_db_session.expire_all()
+        loaded = test_db_session.get(Account, account.id)
+        assert loaded.bank_detail.agency == "1234"
+        assert loaded.credit_details is None
+
+    def test_account_endpoints(self, test_client: TestClient, authenticated_user):
+        """Test create, list, get, archive and statements on partitioned tables."""
+        headers = authenticated_user["headers"]
+        bank_id = _create(test_client, BANK_ACCOUNT, headers)
+        card_id = _create(test_client, CREDIT_CARD, headers)
+
+        accounts = test_client.get("/account/", headers=headers).json()
+        assert [account["id"] for account in accounts] == [bank_id, card_id]
+        assert accounts[0]["bank_detail"]["agency"] == "1234"
+        assert accounts[1]["credit_details"]["last_four_digits"] == "1234"
+
+        account = test_client.get(f"/account/{card_id}", headers=headers).json()
+        assert account["credit_details"]["due_day"] == 25
+
+        statements = test_client.get("/account/statements", headers=headers).json()
+        assert [card["account_id"] for card in statements] == [card_id]
+        response = test_client.get(f"/account/{card_id}/statements", headers=headers)
+        assert response.status_code == 200
+
+        response = test_client.post(f"/account/{bank_id}/archive", headers=headers)
+        assert response.status_code == 204
+        accounts = test_client.get("/account/", headers=headers).json()
+        assert [account["id"] for account in accounts] == [card_id]
+        archived = test_client.get("/account/archived", headers=headers).json()
+        assert [account["id"] for account in archived] == [bank_id]
+
+    def test_reads_scan_the_owners_partition(self, test_db_session: Session):
+        """Test list, get and statements read one partition of each table."""
+        owner = UserByToken(id=42, email="owner@example.com", name="Owner")
+        statement, _ = _account_list(frozenset(ACCOUNT_FIELDS))
+        statements = [
+            statement.statement.params(owner_id=owner.id),
+            _ACCOUNT_BY_ID.statement.params(account_id=1, owner_id=owner.id),
+            _card_query(test_db_session, owner).statement,
+        ]
+
+        for statement in statements:
+            scanned = _scanned_partitions(test_db_session, statement)
+            tables = {table for table, _ in scanned}
+            remainders = {remainder for _, remainder in scanned}
+            assert len(scanned) == len(tables)
+            assert len(remainders) == 1
+            assert "accounts" in tables
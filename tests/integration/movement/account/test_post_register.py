@@ -1,6 +1,7 @@
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.id.user._user import User
 from app.movement.account._account import Account
 
 
@@ -28,7 +29,7 @@ class TestAccountRegistration:
 
         assert response.status_code == 201
         assert "Location" in response.headers
-        assert "/accounts/" in response.headers["Location"]
+        assert "/account/" in response.headers["Location"]
 
         # Verify account was created in database
         db_account = (
@@ -39,6 +40,12 @@ class TestAccountRegistration:
         assert db_account is not None
         assert db_account.name == account_data["name"]
         assert db_account.created_by == authenticated_user["email"]
+        db_user = (
+            test_db_session.query(User)
+            .filter(User.email == authenticated_user["email"])
+            .first()
+        )
+        assert db_account.owner_id == db_user.id
         assert db_account.type.value == "CreditCard"
 
         # Verify credit details
@@ -74,7 +81,7 @@ class TestAccountRegistration:
 
         assert response.status_code == 201
         assert "Location" in response.headers
-        assert "/accounts/" in response.headers["Location"]
+        assert "/account/" in response.headers["Location"]
 
         # Verify account was created in database
         db_account = (
@@ -225,7 +232,7 @@ class TestAccountRegistration:
         response_data = response.json()
         assert (
             response_data["details"]
-            == "credit_details.billing_cycle_day: input should be less than or equal to 30"
+            == "credit_details.billing_cycle_day: input should be less than or equal to 31"
         )
 
     def test_invalid_account_type(
@@ -282,3 +289,95 @@ class TestAccountRegistration:
         assert (
             response_data["details"] == "name: string should have at most 32 characters"
         )
+
+    def test_retry_with_same_idempotency_key(
+        self, test_client: TestClient, test_db_session: Session, authenticated_user
+    ):
+        """Test a retried request with the same Idempotency-Key creates one account."""
+        account_data = {
+            "name": "Retried Card",
+            "credit_details": {
+                "last_four_digits": "1234",
+                "billing_cycle_day": 15,
+                "due_day": 5,
+            },
+        }
+        headers = {**authenticated_user["headers"], "Idempotency-Key": "account-1"}
+
+        response1 = test_client.post("/account/", json=account_data, headers=headers)
+        response2 = test_client.post("/account/", json=account_data, headers=headers)
+
+        assert response1.status_code == 201
+        assert response2.status_code == 201
+        assert response2.headers["Location"] == response1.headers["Location"]
+        assert response2.headers["Idempotent-Replayed"] == "true"
+        assert (
+            test_db_session.query(Account)
+            .filter(Account.name == account_data["name"])
+            .count()
+            == 1
+        )
+
+    def test_retry_with_refreshed_token_replays(
+        self, test_client: TestClient, test_db_session: Session, authenticated_user
+    ):
+        """Test a retry after refreshing the token still finds the first response."""
+        account_data = {
+            "name": "Refreshed Card",
+            "credit_details": {
+                "last_four_digits": "1234",
+                "billing_cycle_day": 15,
+                "due_day": 5,
+            },
+        }
+        first = test_client.post(
+            "/account/",
+            json=account_data,
+            headers={**authenticated_user["headers"], "Idempotency-Key": "account-3"},
+        )
+        token = test_client.post(
+            "/user/token",
+            data={"username": "test@example.com", "password": "secure_password123"},
+        ).json()["access_token"]
+
+        retry = test_client.post(
+            "/account/",
+            json=account_data,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Idempotency-Key": "account-3",
+            },
+        )
+
+        assert token != authenticated_user["token"]
+        assert retry.status_code == 201
+        assert retry.headers["Location"] == first.headers["Location"]
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert (
+            test_db_session.query(Account)
+            .filter(Account.name == account_data["name"])
+            .count()
+            == 1
+        )
+
+    def test_idempotency_key_reused_with_different_payload(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test reusing an Idempotency-Key for a different payload is rejected."""
+        headers = {**authenticated_user["headers"], "Idempotency-Key": "account-2"}
+        bank_account = {
+            "name": "My Checking Account",
+            "bank_detail": {
+                "agency": "1234",
+                "account_number": "567890123",
+                "account_type": "Checking",
+            },
+        }
+        test_client.post("/account/", json=bank_account, headers=headers)
+
+        response = test_client.post(
+            "/account/", json={**bank_account, "name": "Other Name"}, headers=headers
+        )
+
+        assert response.status_code == 400
+        assert "Idempotency-Key" in response.json()["details"]
@@ -0,0 +1,184 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, make_url, text
+
+MIGRATIONS = Path(__file__).parents[2] / "migrations"
+
+# The schema create_tables() made before migration 001
+BASELINE = """
+CREATE SCHEMA id;
+CREATE SCHEMA movement;
+CREATE TABLE id.users (
+    id SERIAL PRIMARY KEY,
+    email VARCHAR(24),
+    name VARCHAR(128),
+    hashed_password VARCHAR
+);
+CREATE INDEX ix_id_users_id ON id.users (id);
+CREATE UNIQUE INDEX ix_id_users_email ON id.users (email);
+CREATE TYPE accounttype AS ENUM ('BANK', 'CREDIT_CARD', 'CASH');
+CREATE TABLE movement.accounts (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(32) NOT NULL,
+    type accounttype NOT NULL,
+    created_by VARCHAR(128) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+);
+CREATE INDEX ix_movement_accounts_id ON movement.accounts (id);
+CREATE TABLE movement.bank_details (
+    id SERIAL PRIMARY KEY,
+    account_id INTEGER NOT NULL REFERENCES movement.accounts (id),
+    agency VARCHAR(10) NOT NULL,
+    account_number VARCHAR(20) NOT NULL,
+    account_type VARCHAR(20) NOT NULL
+);
+CREATE INDEX ix_movement_bank_details_id ON movement.bank_details (id);
+CREATE TABLE movement.credit_details (
+    id SERIAL PRIMARY KEY,
+    account_id INTEGER NOT NULL REFERENCES movement.accounts (id),
+    last_four_digits VARCHAR(4) NOT NULL,
+    billing_cycle_day INTEGER NOT NULL,
+    due_day INTEGER NOT NULL
+);
+CREATE INDEX ix_movement_credit_details_id ON movement.credit_details (id);
+"""
+
+ROWS = """
+INSERT INTO id.users (email, name) VALUES
+    ('ana@example.com', 'Ana'), ('bia@example.com', 'Bia');
+INSERT INTO movement.accounts (name, type, created_by) VALUES
+    ('Checking', 'BANK', 'ana@example.com'),
+    ('Card', 'CREDIT_CARD', 'ana@example.com'),
+    ('Savings', 'BANK', 'bia@example.com');
+INSERT INTO movement.bank_details (account_id, agency, account_number, account_type)
+VALUES (1, '1234', '567890123', 'Checking'), (3, '4321', '321098765', 'Savings');
+INSERT INTO movement.credit_details
+    (account_id, last_four_digits, billing_cycle_day, due_day)
+VALUES (2, '1234', 15, 25);
+"""
+
+
+def _apply(conn, name: str, partitions: int = 0):
+    """Run a migration file the way `psql -f` would."""
+    sql = (MIGRATIONS / name).read_text()
+    sql = sql.replace(":'partitions'", f"'{partitions}'")
+    # The driver's cursor, so format() placeholders are not taken as parameters
+    with conn.connection.cursor() as cursor:
+        if "BEGIN;" in sql:
+            # One transaction; DO blocks keep their inner semicolons
+            cursor.execute(sql)
+            return
+        # Outside a transaction, as CREATE INDEX CONCURRENTLY needs
+        lines = [line for line in sql.splitlines() if not line.startswith("--")]
+        for statement in "\n".join(lines).split(";"):
+            if statement.strip():
+                cursor.execute(statement)
+
+
+@pytest.fixture
+def baseline_engine(test_engine, test_database_url):
+    """A scratch database with the pre-migration schema and a few accounts."""
+    url = make_url(test_database_url)
+    database = f"{url.database}_migrations"
+    admin = test_engine.execution_options(isolation_level="AUTOCOMMIT")
+    with admin.connect() as conn:
+        conn.execute(text(f"DROP DATABASE IF EXISTS {database}"))
+        conn.execute(text(f"CREATE DATABASE {database}"))
+    engine = create_engine(url.set(database=database), isolation_level="AUTOCOMMIT")
+    with engine.connect() as conn:
+        conn.exec_driver_sql(BASELINE)
+        conn.exec_driver_sql(ROWS)
+
+    yield engine
+
+    engine.dispose()
+    with admin.connect() as conn:
+        conn.execute(text(f"DROP DATABASE IF EXISTS {database}"))
+
+
+class TestPartitionMigration:
+    """Test migration 005 on a populated database brought up by 001-004."""
+
+    @pytest.mark.parametrize("archiving_first", [False, True])
+    def test_partitions_populated_tables(self, baseline_engine, archiving_first):
+        """Test rows, archive state, keys and indexes survive partitioning."""
+        with baseline_engine.connect() as conn:
+            for name in (
+                "001_account_detail_indexes.sql",
+                "002_flat_accounts.sql",
+                "003_account_owner_id.sql",
+                "004_account_detail_owner_id.sql",
+            ):
+                _apply(conn, name)
+            if archiving_first:
+                _apply(conn, "006_account_archiving.sql")
+                conn.execute(
+                    text(
+                        "UPDATE movement.accounts SET archived_at = now() WHERE id = 3"
+                    )
+                )
+
+            _apply(conn, "005_partition_account_tables.sql", partitions=4)
+
+            partitions = conn.execute(
+                text(
+                    "SELECT inhparent::regclass::text, count(*) FROM pg_inherits "
+                    "WHERE inhparent::regclass::text LIKE 'movement.%' "
+                    "GROUP BY inhparent"
+                )
+            ).all()
+            accounts = conn.execute(
+                text(
+                    "SELECT id, owner_id, archived_at IS NOT NULL "
+                    "FROM movement.accounts ORDER BY id"
+                )
+            ).all()
+            details = conn.execute(
+                text(
+                    "SELECT account_id, owner_id FROM movement.bank_details "
+                    "UNION ALL "
+                    "SELECT account_id, owner_id FROM movement.credit_details "
+                    "ORDER BY account_id"
+                )
+            ).all()
+            indexes = conn.execute(
+                text(
+                    "SELECT tablename, indexname FROM pg_indexes "
+                    "WHERE schemaname = 'movement' AND tablename IN "
+                    "('accounts', 'bank_details', 'credit_details')"
+                )
+            ).all()
+            new_id = conn.execute(
+                text(
+                    "INSERT INTO movement.accounts (name, type, owner_id, created_by) "
+                    "VALUES ('Cash', 'CASH', 1, 'ana@example.com') RETURNING id"
+                )
+            ).scalar()
+            leftovers = conn.execute(
+                text(
+                    "SELECT count(*) FROM pg_class WHERE relname LIKE '%unpartitioned%'"
+                )
+            ).scalar()
+
+        assert dict(partitions) == {
+            "movement.accounts": 4,
+            "movement.bank_details": 4,
+            "movement.credit_details": 4,
+        }
+        assert accounts == [(1, 1, False), (2, 1, False), (3, 2, archiving_first)]
+        assert details == [(1, 1), (2, 1), (3, 2)]
+        assert set(indexes) == {
+            ("accounts", "accounts_pkey"),
+            ("accounts", "ix_movement_accounts_id"),
+            ("accounts", "ix_movement_accounts_active_owner_id_id"),
+            ("accounts", "ix_movement_accounts_archived_owner_id_id"),
+            ("bank_details", "bank_details_pkey"),
+            ("bank_details", "ix_movement_bank_details_id"),
+            ("bank_details", "ix_movement_bank_details_account_id"),
+            ("credit_details", "credit_details_pkey"),
+            ("credit_details", "ix_movement_credit_details_id"),
+            ("credit_details", "ix_movement_credit_details_account_id"),
+        }
+        assert new_id == 4
+        assert leftovers == 0
@@ -0,0 +1,41 @@
+import pytest
+
+from app.infra.database import warm_pool
+from app.warmup import WarmUp
+
+
+class TestWarmUp:
+    """Test cases for the startup warm-up."""
+
+    def test_not_ready_until_finished(self):
+        """Test the readiness check fails until every step ran."""
+        calls = []
+        warmup = WarmUp({"first": lambda: calls.append("first")})
+
+        with pytest.raises(RuntimeError):
+            warmup.check()
+        warmup.run()
+
+        warmup.check()
+        assert calls == ["first"]
+
+    def test_failing_step_does_not_stop_warm_up(self):
+        """Test a failing step is skipped and the warm-up still finishes."""
+        calls = []
+
+        def failing():
+            raise ConnectionError("database unavailable")
+
+        warmup = WarmUp({"failing": failing, "second": lambda: calls.append("second")})
+        warmup.run()
+
+        assert warmup.done
+        assert calls == ["second"]
+
+    def test_warm_pool_opens_connections(self, test_engine):
+        """Test the pool keeps the warmed connections open."""
+        test_engine.dispose()
+
+        warm_pool(test_engine, 3)
+
+        assert test_engine.pool.checkedin() == 3
@@ -0,0 +1,45 @@
+from fastapi.testclient import TestClient
+
+
+class TestGetUser:
+    """Test cases for getting the current user by id."""
+
+    def test_location_of_a_new_user(self, test_client: TestClient, clean_database):
+        """Test the Location returned on registration serves the user."""
+        created = test_client.post(
+            "/user/register",
+            json={
+                "email": "located@example.com",
+                "name": "Located User",
+                "password": "secure_password123",
+            },
+        )
+        token = test_client.post(
+            "/user/token",
+            data={"username": "located@example.com", "password": "secure_password123"},
+        ).json()["access_token"]
+
+        response = test_client.get(
+            created.headers["Location"],
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 200
+        user = response.json()
+        assert created.headers["Location"] == f"/user/{user['id']}"
+        assert user["email"] == "located@example.com"
+        assert user["name"] == "Located User"
+
+    def test_other_users_are_not_found(
+        self, test_client: TestClient, authenticated_user_factory
+    ):
+        """Test ids other than the current user's return 404."""
+        first = authenticated_user_factory("first@example.com")
+        second = authenticated_user_factory("second@example.com")
+        first_id = test_client.get("/user/profile", headers=first["headers"]).json()[
+            "id"
+        ]
+
+        response = test_client.get(f"/user/{first_id}", headers=second["headers"])
+
+        assert response.status_code == 404
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.id.user._revocation import RevokedToken, TokenCutoff, TokenRevocations
+
+
+def _login(test_client: TestClient, user) -> dict:
+    response = test_client.post(
+        "/user/token",
+        data={"username": user["email"], "password": "secure_password123"},
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+class TestLogout:
+    """Test cases for token revocation endpoints."""
+
+    def test_logout_revokes_only_the_current_token(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test a logged out token is rejected while other sessions keep working."""
+        other_session = _login(test_client, authenticated_user)
+
+        response = test_client.post(
+            "/user/logout", headers=authenticated_user["headers"]
+        )
+
+        assert response.status_code == 204
+        assert (
+            test_client.get(
+                "/user/profile", headers=authenticated_user["headers"]
+            ).status_code
+            == 401
+        )
+        assert (
+            test_client.get("/user/profile", headers=other_session).status_code == 200
+        )
+
+    def test_logout_all_revokes_every_session(
+        self, test_client: TestClient, authenticated_user
+    ):
+        """Test revoke-all rejects every token issued before it."""
+        other_session = _login(test_client, authenticated_user)
+
+        response = test_client.post("/user/logout-all", headers=other_session)
+
+        assert response.status_code == 204
+        assert (
+            test_client.get("/user/profile", headers=other_session).status_code == 401
+        )
+        assert (
+            test_client.get(
+                "/user/profile", headers=authenticated_user["headers"]
+            ).status_code
+            == 401
+        )
+        new_session = _login(test_client, authenticated_user)
+        assert test_client.get("/user/profile", headers=new_session).status_code == 200
+
+    def test_logout_without_token(self, test_client: TestClient, clean_database):
+        """Test logout requires authentication."""
+        response = test_client.post("/user/logout")
+
+        assert response.status_code == 401
+
+
+class TestTokenRevocations:
+    """Test cases for the in-memory revocation set."""
+
+    def test_sync_loads_revocations_from_other_workers(
+        self, test_db_session: Session, clean_database
+    ):
+        """Test revocations written elsewhere are picked up by a sync."""
+        now = datetime.now(timezone.utc)
+        test_db_session.add(
+            RevokedToken(jti="a" * 32, user_id=1, expires_at=now + timedelta(minutes=1))
+        )
+        test_db_session.add(
+            TokenCutoff(
+                user_id=2, issued_before=now, expires_at=now + timedelta(minutes=1)
+            )
+        )
+        test_db_session.commit()
+        revocations = TokenRevocations()
+
+        revocations.sync(test_db_session)
+
+        assert revocations.is_revoked("a" * 32, 1, now.timestamp())
+        assert revocations.is_revoked("b" * 32, 2, now.timestamp() - 1)
+        assert not revocations.is_revoked("b" * 32, 2, now.timestamp() + 1)
+        assert not revocations.is_revoked("b" * 32, 3, now.timestamp())
+
+    def test_expired_rows_are_deleted_on_the_prune_interval(
+        self, test_db_session: Session, clean_database
+    ):
+        """Test syncs only delete expired rows once the prune interval passed."""
+        expired = datetime.now(timezone.utc) - timedelta(minutes=1)
+        test_db_session.add(RevokedToken(jti="c" * 32, user_id=1, expires_at=expired))
+        test_db_session.commit()
+        revocations = TokenRevocations(prune_interval=3600)
+
+        revocations.sync(test_db_session)
+        assert test_db_session.query(RevokedToken).count() == 1
+
+        revocations.prune_interval = 0
+        revocations.sync(test_db_session)
+        assert test_db_session.query(RevokedToken).count() == 0
+
+    def test_expired_revocations_are_pruned(self):
+        """Test revocations of expired tokens are forgotten."""
+        revocations = TokenRevocations()
+        revocations.add_token("expired", expires_at=0)
+        revocations.add_cutoff(1, issued_before=0, expires_at=0)
+
+        revocations.prune()
+
+        assert len(revocations) == 0
@@ -98,3 +98,25 @@ class TestUserRegistration:
         response_data = response.json()
         assert response_data["error"] == "Validation failed"
         assert "email" in response_data["details"]
+
+    def test_retry_with_same_idempotency_key(
+        self, test_client: TestClient, test_db_session: Session, clean_database
+    ):
+        """Test a retried registration with the same Idempotency-Key is replayed."""
+        user_data = {
+            "email": "retry@example.com",
+            "name": "Retry User",
+            "password": "secure_password123",
+        }
+        headers = {"Idempotency-Key": "register-retry@example.com"}
+
+        response1 = test_client.post("/user/register", json=user_data, headers=headers)
+        response2 = test_client.post("/user/register", json=user_data, headers=headers)
+
+        assert response1.status_code == 201
+        assert response2.status_code == 201
+        assert response2.headers["Location"] == response1.headers["Location"]
+        assert (
+            test_db_session.query(User).filter(User.email == user_data["email"]).count()
+            == 1
+        )
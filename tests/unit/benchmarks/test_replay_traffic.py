@@ -0,0 +1,187 @@
+import asyncio
+import itertools
+import time
+
+import httpx
+
+from benchmarks.replay_traffic import PASSWORD, Replay, _summarize
+
+
+def _record(**fields) -> dict:
+    return {
+        "ts": 0.0,
+        "method": "GET",
+        "path": "/account/7",
+        "route": "/account/{account_id}",
+        "query": None,
+        "caller": "c1",
+        "idempotent": False,
+        "body_format": None,
+        "body": None,
+        "status": 200,
+        **fields,
+    }
+
+
+def _caller(token: str = "first", logged_in_at: float | None = None) -> dict:
+    return {
+        "email": "c0@replay.test",
+        "headers": {"Authorization": f"Bearer {token}"},
+        "logged_in_at": time.monotonic() if logged_in_at is None else logged_in_at,
+        "lock": asyncio.Lock(),
+        "user_id": 42,
+        "accounts": itertools.cycle([10, 11]),
+    }
+
+
+def _server(tokens: list[str], valid: set[str]):
+    """Issue `tokens` on login; accept only `valid` ones on other routes."""
+    issued = iter(tokens)
+    seen = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/user/token":
+            return httpx.Response(200, json={"access_token": next(issued)})
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        seen.append(token)
+        return httpx.Response(200 if token in valid else 401)
+
+    return httpx.MockTransport(handle), seen
+
+
+class TestReplayRequests:
+    """Test cases for mapping captured requests to the replay's users."""
+
+    def test_paths_use_the_callers_accounts(self):
+        """Test templated paths get the caller's seeded accounts in turn."""
+        replay = Replay(httpx.AsyncClient(), [])
+        replay.callers["c1"] = _caller()
+
+        first = replay._request(_record())
+        second = replay._request(_record(idempotent=True, query={"fields": "id"}))
+        anonymous = replay._request(_record(caller=None, path="/account/7"))
+
+        assert first["url"] == "/account/10"
+        assert first["headers"] == {"Authorization": "Bearer first"}
+        assert second["url"] == "/account/11"
+        assert second["params"] == {"fields": "id"}
+        assert "Idempotency-Key" in second["headers"]
+        assert anonymous == {
+            "method": "GET",
+            "url": "/account/7",
+            "params": None,
+            "headers": {},
+        }
+
+    def test_registrations_and_logins_are_remapped(self):
+        """Test signups get fresh emails and logins the replay's users."""
+        replay = Replay(httpx.AsyncClient(), [])
+        replay.logins["u1@capture.test"] = "l0@replay.test"
+        register = _record(
+            method="POST",
+            route="/user/register",
+            path="/user/register",
+            caller=None,
+            body_format="json",
+            body={"email": "u1@capture.test", "password": "***"},
+            status=201,
+        )
+        login = _record(
+            method="POST",
+            route="/user/token",
+            path="/user/token",
+            caller=None,
+            body_format="form",
+            body={"username": "u1@capture.test", "password": "***"},
+        )
+
+        first = replay._request(register)
+        second = replay._request(register)
+        succeeded = replay._request(login)
+        failed = replay._request({**login, "status": 401})
+
+        assert first["json"]["email"] != second["json"]["email"]
+        assert first["json"]["password"] == PASSWORD
+        assert succeeded["data"] == {
+            "username": "l0@replay.test",
+            "password": PASSWORD,
+        }
+        assert failed["data"]["password"] != PASSWORD
+
+
+class TestReplayTokens:
+    """Test cases for keeping replay users logged in."""
+
+    async def test_rejected_tokens_are_refreshed_and_retried(self):
+        """Test a 401 logs the caller in again and resends the request."""
+        transport, seen = _server(["second"], valid={"second"})
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            replay = Replay(client, [_record()])
+            replay.callers["c1"] = _caller("first")
+
+            (result,) = await replay.run_all(speed=0, concurrency=1)
+
+        assert seen == ["first", "second"]
+        assert result["status"] == 200
+        assert replay.callers["c1"]["headers"]["Authorization"] == "Bearer second"
+
+    async def test_tokens_are_refreshed_before_they_expire(self):
+        """Test callers log in again once their token is due."""
+        transport, seen = _server(["second"], valid={"first", "second"})
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            replay = Replay(client, [_record(), _record()], token_refresh=60)
+            replay.callers["c1"] = _caller("first", time.monotonic() - 61)
+
+            results = await replay.run_all(speed=0, concurrency=1)
+
+        assert seen == ["second", "second"]
+        assert [result["status"] for result in results] == [200, 200]
+
+    async def test_captured_401s_are_not_retried(self):
+        """Test requests rejected in the capture are replayed as rejected."""
+        transport, seen = _server([], valid=set())
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            replay = Replay(client, [_record(status=401)])
+            replay.callers["c1"] = _caller("first")
+
+            (result,) = await replay.run_all(speed=0, concurrency=1)
+
+        assert seen == ["first"]
+        assert result["status"] == 401
+
+
+class TestReplaySummary:
+    """Test cases for the per-route summary."""
+
+    def test_errors_mismatches_and_percentiles(self):
+        """Test 5xx and failed sends are errors, other status classes mismatches."""
+        results = [
+            {"route": "GET /a", "status": 200, "captured_status": 200, "ms": ms}
+            for ms in range(1, 99)
+        ]
+        results += [
+            {"route": "GET /a", "status": 404, "captured_status": 200, "ms": 99},
+            {"route": "GET /a", "status": 503, "captured_status": 200, "ms": 100},
+            {"route": "POST /b", "status": None, "captured_status": 201, "ms": 5},
+            {"route": "POST /b", "status": 201, "captured_status": None, "ms": 7},
+        ]
+
+        summary = _summarize(results)
+
+        assert list(summary) == ["GET /a", "POST /b"]
+        assert summary["GET /a"] == {
+            "count": 100,
+            "errors": 1,
+            "mismatches": 2,
+            "p50_ms": 50.5,
+            "p95_ms": 96,
+            "p99_ms": 100,
+        }
+        assert summary["POST /b"]["errors"] == 1
+        assert summary["POST /b"]["mismatches"] == 2
@@ -0,0 +1,113 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+
+from app.infra.admission import AdmissionMiddleware, AdmissionQueue, classify
+from app.infra.metrics import metrics
+
+
+def _slow_app(limit: int, max_queue: int, interval: float = 1.0):
+    queue = AdmissionQueue(
+        "read", limit, max_queue=max_queue, target=0.05, interval=interval
+    )
+    app = FastAPI()
+    app.add_middleware(AdmissionMiddleware, queues={"read": queue})
+
+    @app.get("/items")
+    async def list_items():
+        await asyncio.sleep(0.2)
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    return app, queue
+
+
+async def _gather(app, paths):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(*[client.get(path) for path in paths])
+
+
+class TestClassify:
+    """Test cases for route classes."""
+
+    def test_route_classes(self):
+        """Test requests are classified by path and method."""
+        assert classify("GET", "/health/ready") == "cheap"
+        assert classify("GET", "/metrics") == "cheap"
+        assert classify("POST", "/user/token") == "auth"
+        assert classify("POST", "/user/register/") == "auth"
+        assert classify("GET", "/account/") == "read"
+        assert classify("POST", "/account/") == "write"
+
+
+class TestAdmissionMiddleware:
+    """Test cases for admission control and load shedding."""
+
+    async def test_requests_beyond_limit_and_queue_are_shed(self):
+        """Test excess requests get 503 with Retry-After."""
+        app, _ = _slow_app(limit=1, max_queue=0)
+        shed_before = metrics.value(
+            "admission_shed_total", route_class="read", reason="queue_full"
+        )
+
+        responses = await _gather(app, ["/items"] * 3)
+
+        statuses = sorted(response.status_code for response in responses)
+        assert statuses == [200, 503, 503]
+        shed = next(response for response in responses if response.status_code == 503)
+        assert shed.headers["Retry-After"] == "1"
+        assert shed.json()["error"] == "Service overloaded"
+        assert (
+            metrics.value(
+                "admission_shed_total", route_class="read", reason="queue_full"
+            )
+            == shed_before + 2
+        )
+
+    async def test_queued_requests_wait_for_a_slot(self):
+        """Test requests within the queue bound are served in turn."""
+        app, queue = _slow_app(limit=1, max_queue=2)
+
+        responses = await _gather(app, ["/items"] * 3)
+
+        assert all(response.status_code == 200 for response in responses)
+        assert queue.in_flight == 0
+        assert queue.queued == 0
+
+    async def test_queued_requests_time_out(self):
+        """Test a request waiting longer than the interval is shed."""
+        app, queue = _slow_app(limit=1, max_queue=2, interval=0.05)
+
+        responses = await _gather(app, ["/items"] * 2)
+
+        assert sorted(response.status_code for response in responses) == [200, 503]
+        assert queue.in_flight == 0
+
+    async def test_cheap_endpoints_are_never_shed(self):
+        """Test health checks are served while the limited class is saturated."""
+        app, _ = _slow_app(limit=1, max_queue=0)
+
+        responses = await _gather(app, ["/items", "/health", "/health", "/health"])
+
+        assert all(response.status_code == 200 for response in responses)
+
+
+class TestAdmissionQueue:
+    """Test cases for CoDel-style overload detection."""
+
+    def test_overloaded_after_sustained_delay(self):
+        """Test the class is overloaded only after an interval above target."""
+        queue = AdmissionQueue("test", 1, max_queue=1, target=0.01, interval=0.0)
+
+        queue._observe(0.02)
+        assert not queue.overloaded
+        queue._observe(0.02)
+        assert queue.overloaded
+
+        queue._observe(0.0)
+        assert not queue.overloaded
@@ -0,0 +1,121 @@
+import json
+import tracemalloc
+
+import pytest
+from fastapi import Depends
+from fastapi.testclient import TestClient
+
+from app.infra import allocation_profile
+from app.infra.allocation_profile import (
+    AllocationProfileMiddleware,
+    AllocationProfiler,
+    require_debug_token,
+)
+
+LEAKED: list = []
+
+
+def _app(middleware_app, profiler: AllocationProfiler):
+    app = middleware_app(AllocationProfileMiddleware, profiler=profiler)
+
+    @app.get("/leak/{item_id}")
+    def leak(item_id: int):
+        LEAKED.append(bytearray(256 * 1024))
+        return {"id": item_id}
+
+    @app.get("/report", dependencies=[Depends(require_debug_token)])
+    def report():
+        return {"routes": {}}
+
+    return app
+
+
+class TestAllocationProfile:
+    """Test cases for attributing allocations to routes."""
+
+    def test_retained_allocations_are_attributed_to_route_and_site(
+        self, middleware_app
+    ):
+        """Test a route that keeps memory shows up with the line allocating it."""
+        profiler = AllocationProfiler(sample=1, dump_path="")
+        profiler.start()
+        try:
+            client = TestClient(_app(middleware_app, profiler))
+            for item_id in range(3):
+                client.get(f"/leak/{item_id}")
+            client.get("/small")
+            report = profiler.report(top=5)
+        finally:
+            tracemalloc.stop()
+            LEAKED.clear()
+
+        leak = report["routes"]["GET /leak/{item_id}"]
+        assert leak["requests"] == 3
+        assert leak["sampled"] == 3
+        assert leak["retained_bytes_per_request"] >= 256 * 1024
+        assert leak["top_sites"][0]["site"].startswith(__file__)
+        assert leak["top_sites"][0]["size_bytes"] >= 3 * 256 * 1024
+        assert list(report["routes"])[0] == "GET /leak/{item_id}"
+        assert report["routes"]["GET /small"]["requests"] == 1
+        assert report["traced_bytes"] > 0
+
+    async def test_unsampled_requests_are_counted_and_dumped_on_stop(
+        self, middleware_app, tmp_path
+    ):
+        """Test unsampled requests skip snapshots and stop writes a report."""
+        profiler = AllocationProfiler(
+            sample=0, dump_path=str(tmp_path / "allocations-{pid}.json")
+        )
+        profiler.start()
+        try:
+            TestClient(_app(middleware_app, profiler)).get("/leak/1")
+        finally:
+            await profiler.stop()
+            LEAKED.clear()
+
+        assert "{pid}" not in profiler.dump_path
+        with open(profiler.dump_path) as file:
+            leak = json.load(file)["routes"]["GET /leak/{item_id}"]
+        assert leak["requests"] == 1
+        assert leak["sampled"] == 0
+        assert leak["top_sites"] == []
+        assert not tracemalloc.is_tracing()
+
+    def test_snapshot_slot_is_released_when_the_snapshot_fails(self, middleware_app):
+        """Test a failing first snapshot does not stop later requests sampling."""
+        profiler = AllocationProfiler(sample=1, dump_path="")
+
+        def fail():
+            raise MemoryError
+
+        profiler.snapshot = fail
+        profiler.start()
+        try:
+            client = TestClient(_app(middleware_app, profiler))
+            with pytest.raises(MemoryError):
+                client.get("/small")
+
+            assert profiler.snapshot_slot.acquire(blocking=False)
+            profiler.snapshot_slot.release()
+        finally:
+            tracemalloc.stop()
+
+    def test_report_requires_the_debug_token(self, middleware_app, monkeypatch):
+        """Test the report is only served with the configured token."""
+        profiler = AllocationProfiler(sample=0, dump_path="")
+        client = TestClient(_app(middleware_app, profiler))
+
+        monkeypatch.setattr(allocation_profile, "ALLOCATION_PROFILE_TOKEN", "")
+        unset = client.get("/report", headers={"X-Debug-Token": ""})
+        monkeypatch.setattr(allocation_profile, "ALLOCATION_PROFILE_TOKEN", "s3cret")
+        missing = client.get("/report")
+        wrong = client.get("/report", headers={"X-Debug-Token": "guess"})
+        allowed = client.get("/report", headers={"X-Debug-Token": "s3cret"})
+
+        assert [unset.status_code, missing.status_code, wrong.status_code] == [
+            403,
+            403,
+            403,
+        ]
+        assert allowed.status_code == 200
+        assert "routes" in allowed.json()
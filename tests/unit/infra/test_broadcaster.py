@@ -0,0 +1,89 @@
+import asyncio
+
+from app.infra.broadcaster import Broadcaster, Event
+
+
+def _event(event_id: int, topic: int = 1) -> Event:
+    return Event(id=event_id, topic=topic, type="account_created", data={"n": event_id})
+
+
+class TestBroadcaster:
+    """Test cases for the in-process event broadcaster."""
+
+    async def test_events_reach_subscribers_of_the_topic(self):
+        """Test subscribers only receive events of their topic."""
+        broadcaster = Broadcaster(buffer_size=10, max_pending=10)
+        mine, _ = broadcaster.subscribe(1)
+        other, _ = broadcaster.subscribe(2)
+
+        broadcaster._dispatch(_event(1, topic=1))
+
+        assert [event.id for event in await mine.next_events(0.1)] == [1]
+        assert await other.next_events(0.01) == []
+
+    async def test_duplicate_events_are_delivered_once(self):
+        """Test an event published locally and via NOTIFY is delivered once."""
+        broadcaster = Broadcaster(buffer_size=10, max_pending=10)
+        subscription, _ = broadcaster.subscribe(1)
+
+        broadcaster._dispatch(_event(1))
+        broadcaster._dispatch(_event(1))
+
+        assert len(await subscription.next_events(0.1)) == 1
+
+    async def test_publish_from_another_thread(self):
+        """Test events published off the loop are delivered on it."""
+        broadcaster = Broadcaster(buffer_size=10, max_pending=10)
+        broadcaster.start()
+        subscription, _ = broadcaster.subscribe(1)
+
+        await asyncio.to_thread(broadcaster.publish, _event(1))
+
+        assert [event.id for event in await subscription.next_events(1)] == [1]
+
+    async def test_resume_replays_missed_events(self):
+        """Test Last-Event-ID replays newer buffered events of the topic."""
+        broadcaster = Broadcaster(buffer_size=10, max_pending=10)
+        broadcaster._set_complete_after(0)
+        for event_id, topic in [(1, 1), (2, 2), (3, 1)]:
+            broadcaster._dispatch(_event(event_id, topic))
+
+        subscription, complete = broadcaster.subscribe(1, last_event_id=1)
+
+        assert complete
+        assert [event.id for event in await subscription.next_events(0.1)] == [3]
+
+    async def test_resume_past_the_buffer_is_incomplete(self):
+        """Test resuming from an evicted or unknown id asks for a reload."""
+        broadcaster = Broadcaster(buffer_size=2, max_pending=10)
+        _, complete = broadcaster.subscribe(1, last_event_id=1)
+        assert not complete
+
+        broadcaster._set_complete_after(0)
+        for event_id in [1, 2, 3, 4]:
+            broadcaster._dispatch(_event(event_id))
+
+        _, complete = broadcaster.subscribe(1, last_event_id=1)
+        assert not complete
+        _, complete = broadcaster.subscribe(1, last_event_id=2)
+        assert complete
+
+    async def test_slow_subscriber_overflows(self):
+        """Test a subscriber falling too far behind is marked overflowed."""
+        broadcaster = Broadcaster(buffer_size=10, max_pending=2)
+        subscription, _ = broadcaster.subscribe(1)
+
+        for event_id in [1, 2, 3]:
+            broadcaster._dispatch(_event(event_id))
+
+        assert subscription.overflowed
+        assert [event.id for event in await subscription.next_events(0.1)] == [1, 2]
+
+    async def test_unsubscribe(self):
+        """Test unsubscribed connections are no longer tracked."""
+        broadcaster = Broadcaster(buffer_size=10, max_pending=10)
+        subscription, _ = broadcaster.subscribe(1)
+
+        broadcaster.unsubscribe(subscription)
+
+        assert broadcaster.subscriber_count == 0
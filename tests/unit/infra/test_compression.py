@@ -0,0 +1,120 @@
+import gzip
+
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from app.infra.compression import CompressionMiddleware, negotiate
+from app.infra.metrics import metrics
+from app.infra.response_cache import ResponseCache
+
+
+def _app(middleware_app):
+    app = middleware_app(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/precompressed")
+    def precompressed():
+        return Response(
+            gzip.compress(b'{"cached": true}'),
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    @app.get("/varied")
+    def varied():
+        return Response(
+            b'{"cached": true}',
+            media_type="application/json",
+            headers={"Vary": "Accept-Encoding"},
+        )
+
+    return app
+
+
+class TestCompression:
+    """Test cases for negotiated response compression."""
+
+    def test_large_responses_are_compressed(self, middleware_app):
+        """Test a large JSON body is gzipped when the client accepts it."""
+        client = TestClient(_app(middleware_app))
+
+        response = client.get("/items", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(response.content)
+        assert len(response.json()) == 200
+
+    def test_small_or_unaccepted_responses_are_not_compressed(self, middleware_app):
+        """Test bodies under the threshold or without Accept-Encoding stay as is."""
+        client = TestClient(_app(middleware_app))
+
+        small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        identity = client.get("/items", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in small.headers
+        assert "content-encoding" not in identity.headers
+        assert len(identity.json()) == 200
+
+    def test_streams_and_encoded_bodies_pass_through(self, middleware_app):
+        """Test event streams and pre-compressed bodies are not compressed again."""
+        client = TestClient(_app(middleware_app))
+
+        events = client.get("/events", headers={"Accept-Encoding": "gzip"})
+        cached = client.get("/precompressed", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in events.headers
+        assert events.text == "data: x\n\n" * 200
+        assert cached.json() == {"cached": True}
+
+    def test_vary_is_not_repeated(self, middleware_app):
+        """Test a response already varying on Accept-Encoding keeps one entry."""
+        client = TestClient(_app(middleware_app))
+
+        response = client.get("/varied", headers={"Accept-Encoding": "identity"})
+
+        assert response.headers.get_list("vary") == ["Accept-Encoding"]
+
+    def test_negotiation_follows_q_values(self):
+        """Test the accepted encoding with the highest q-value is chosen."""
+        assert negotiate("gzip, deflate") == "gzip"
+        assert negotiate("gzip;q=0, deflate") is None
+        assert negotiate("*") is not None
+        assert negotiate("") is None
+
+
+class TestResponseCache:
+    """Test cases for cached serialized bodies."""
+
+    def test_entries_are_valid_for_one_version(self):
+        """Test an entry is only returned for the version it was built from."""
+        cache = ResponseCache("test_versions", max_bytes=1024 * 1024)
+        cache.put("owner", 1, b"[]")
+
+        assert cache.get("owner", 1).body == b"[]"
+        assert cache.get("owner", 2) is None
+        assert metrics.value("response_cache_hits_total", cache="test_versions") == 1
+
+    def test_compressed_body_is_reused(self):
+        """Test the compressed variant is built once per entry and encoding."""
+        cache = ResponseCache("test_encoded", max_bytes=1024 * 1024)
+        body = b"[" + b'{"name": "Item"},' * 200 + b"{}]"
+        entry = cache.put("owner", 1, body)
+
+        first = cache.response("owner", entry, "gzip")
+        second = cache.response("owner", entry, "gzip")
+
+        assert first.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(first.body) == body
+        assert second.body is first.body
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """Test the cache stays within its byte budget."""
+        cache = ResponseCache("test_evicted", max_bytes=10)
+        cache.put("first", 1, b"12345")
+        cache.put("second", 1, b"12345")
+        cache.get("first", 1)
+
+        cache.put("third", 1, b"12345")
+
+        assert cache.get("first", 1) is not None
+        assert cache.get("second", 1) is None
@@ -0,0 +1,85 @@
+import asyncio
+
+import httpx
+
+from app.infra.idempotency import IdempotencyMiddleware
+
+
+def _app(middleware_app, **options):
+    app = middleware_app(IdempotencyMiddleware, paths={"/orders"}, **options)
+    app.state.calls = 0
+    app.state.started = asyncio.Event()
+    app.state.release = asyncio.Event()
+
+    @app.post("/orders", status_code=201)
+    async def create_order(payload: dict):
+        app.state.calls += 1
+        app.state.started.set()
+        await app.state.release.wait()
+        return {"order": app.state.calls, **payload}
+
+    return app
+
+
+def _client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+class TestIdempotency:
+    """Test cases for replaying POSTs by Idempotency-Key."""
+
+    async def test_concurrent_duplicate_waits_for_the_original(self, middleware_app):
+        """Test a duplicate sent while the original runs gets its response."""
+        app = _app(middleware_app)
+        headers = {"Idempotency-Key": "order-1"}
+
+        async with _client(app) as client:
+            original = asyncio.create_task(
+                client.post("/orders", json={"item": "a"}, headers=headers)
+            )
+            await app.state.started.wait()
+            duplicate = asyncio.create_task(
+                client.post("/orders", json={"item": "a"}, headers=headers)
+            )
+            await asyncio.sleep(0.05)
+            assert not duplicate.done()
+
+            app.state.release.set()
+            first, second = await asyncio.gather(original, duplicate)
+
+        assert app.state.calls == 1
+        assert first.status_code == second.status_code == 201
+        assert second.json() == first.json() == {"order": 1, "item": "a"}
+        assert second.headers["Idempotent-Replayed"] == "true"
+
+    async def test_keys_are_scoped_by_caller(self, middleware_app):
+        """Test the same key from the same caller with another token replays."""
+        app = _app(
+            middleware_app,
+            caller=lambda request: request.headers["Authorization"].split(":")[0],
+        )
+        app.state.release.set()
+
+        async with _client(app) as client:
+            first = await client.post(
+                "/orders",
+                json={"item": "a"},
+                headers={"Idempotency-Key": "k", "Authorization": "user1:token-a"},
+            )
+            refreshed = await client.post(
+                "/orders",
+                json={"item": "a"},
+                headers={"Idempotency-Key": "k", "Authorization": "user1:token-b"},
+            )
+            other_user = await client.post(
+                "/orders",
+                json={"item": "a"},
+                headers={"Idempotency-Key": "k", "Authorization": "user2:token-c"},
+            )
+
+        assert refreshed.json() == first.json()
+        assert refreshed.headers["Idempotent-Replayed"] == "true"
+        assert other_user.json()["order"] == 2
+        assert app.state.calls == 2
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+
+from app.infra.metrics import metrics
+from app.infra.query_budget import QueryBudgetMiddleware, _current_budget
+
+
+class FakeConnection:
+    def __init__(self):
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+class TestQueryBudget:
+    """Test cases for per-request database time budgets."""
+
+    def test_budget_by_route_class_and_override(self):
+        """Test budgets follow the route class, overrides and disabled classes."""
+        middleware = QueryBudgetMiddleware(
+            None,
+            budgets={"read": 100, "write": 0},
+            overrides={"/account/statements": 5000},
+            lock_timeout_ms=50,
+        )
+
+        read = middleware.budget_for("GET", "/account/")
+        override = middleware.budget_for("GET", "/account/statements")
+
+        assert read.route_class == "read"
+        assert 0 < read.remaining_ms() <= 100
+        assert override.remaining_ms() > 1000
+        assert middleware.budget_for("POST", "/account/") is None
+        assert middleware.budget_for("GET", "/health") is None
+
+    async def test_disconnect_cancels_running_queries(self):
+        """Test queries of a request are cancelled when its client goes away."""
+        connection = FakeConnection()
+        budgets = []
+
+        async def app(scope, receive, send):
+            budget = _current_budget.get()
+            budget.attach(connection)
+            budgets.append(budget)
+            await receive()
+            await asyncio.to_thread(connection.cancelled.wait, 2)
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if messages:
+                return messages.pop(0)
+            await asyncio.sleep(0.05)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            pass
+
+        before = metrics.value("db_queries_cancelled_total", route_class="read")
+        middleware = QueryBudgetMiddleware(app, budgets={"read": 5000})
+        scope = {"type": "http", "method": "GET", "path": "/account/", "headers": []}
+
+        await middleware(scope, receive, send)
+
+        assert connection.cancelled.is_set()
+        assert budgets[0].cancelled
+        assert (
+            metrics.value("db_queries_cancelled_total", route_class="read")
+            == before + 1
+        )
+        assert budgets[0].cancel() == 0
@@ -0,0 +1,50 @@
+import asyncio
+
+import httpx
+from fastapi.responses import JSONResponse
+
+from app.infra.single_flight import SingleFlightMiddleware
+
+
+def _app(middleware_app):
+    app = middleware_app(SingleFlightMiddleware, paths={"/flaky"})
+    app.state.calls = 0
+    app.state.started = asyncio.Event()
+    app.state.release = asyncio.Event()
+
+    @app.get("/flaky")
+    async def flaky():
+        app.state.calls += 1
+        if app.state.calls == 1:
+            # The leader fails, e.g. its queries were cancelled on disconnect
+            app.state.started.set()
+            await app.state.release.wait()
+            return JSONResponse(status_code=503, content={"error": "Service busy"})
+        return {"calls": app.state.calls}
+
+    return app
+
+
+class TestSingleFlightFailures:
+    """Test cases for followers of a failed single-flight leader."""
+
+    async def test_followers_rerun_after_a_failed_leader(self, middleware_app):
+        """Test a 5xx from the leader is not copied to the waiting requests."""
+        app = _app(middleware_app)
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            leader = asyncio.create_task(client.get("/flaky"))
+            await app.state.started.wait()
+            followers = [asyncio.create_task(client.get("/flaky")) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            app.state.release.set()
+
+            leader_response = await leader
+            responses = await asyncio.gather(*followers)
+
+        assert leader_response.status_code == 503
+        assert [response.status_code for response in responses] == [200, 200, 200]
+        # One of the followers ran it again and the others followed it
+        assert app.state.calls == 2
+        assert {response.json()["calls"] for response in responses} == {2}
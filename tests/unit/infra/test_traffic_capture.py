@@ -0,0 +1,131 @@
+import hashlib
+import json
+
+from fastapi.testclient import TestClient
+
+from app.infra.traffic_capture import (
+    REDACTED,
+    TrafficCapture,
+    TrafficCaptureMiddleware,
+    pseudonym,
+)
+
+
+def _app(middleware_app, path):
+    capture = TrafficCapture(str(path))
+    return middleware_app(TrafficCaptureMiddleware, capture=capture), capture
+
+
+def _records(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestTrafficCapture:
+    """Test cases for recording sanitized traffic."""
+
+    def test_bodies_are_recorded_without_secrets(self, middleware_app, tmp_path):
+        """Test passwords are redacted and emails pseudonymized."""
+        path = tmp_path / "traffic.jsonl"
+        app, capture = _app(middleware_app, path)
+        capture.start()
+        client = TestClient(app)
+
+        client.post(
+            "/user/register",
+            json={
+                "email": "john@example.com",
+                "password": "hunter22",
+                "bank_detail": {"account_number": "12-34"},
+            },
+        )
+        client.post(
+            "/user/token",
+            data={"username": "john@example.com", "password": "hunter22"},
+        )
+        capture.stop()
+
+        register, login = _records(path)
+        assert register["body"] == {
+            "email": pseudonym("john@example.com"),
+            "password": REDACTED,
+            "bank_detail": {"account_number": "00-00"},
+        }
+        assert register["body_format"] == "json"
+        assert login["body"]["username"] == pseudonym("john@example.com")
+        assert login["body"]["password"] == REDACTED
+        assert login["body_format"] == "form"
+        assert "hunter22" not in path.read_text()
+        assert "secret-token" not in path.read_text()
+
+    def test_registration_pii_is_not_recorded(self, middleware_app, tmp_path):
+        """Test no name, email or unkeyed email hash from a signup is written."""
+        path = tmp_path / "traffic.jsonl"
+        app, capture = _app(middleware_app, path)
+        capture.start()
+        client = TestClient(app)
+
+        client.post(
+            "/user/register",
+            json={
+                "email": "Jane.Doe@example.com",
+                "name": "Jane Doe",
+                "password": "hunter22",
+            },
+        )
+        capture.stop()
+
+        (register,) = _records(path)
+        assert register["body"] == {
+            "email": pseudonym("Jane.Doe@example.com"),
+            "name": REDACTED,
+            "password": REDACTED,
+        }
+        text = path.read_text()
+        unkeyed = hashlib.sha256(b"Jane.Doe@example.com").hexdigest()
+        for value in ("Jane", "Doe", "example.com", "hunter22", unkeyed[:10]):
+            assert value not in text
+
+    def test_route_status_sizes_and_caller_are_recorded(self, middleware_app, tmp_path):
+        """Test requests are recorded by route template with their outcome."""
+        path = tmp_path / "traffic.jsonl"
+        app, capture = _app(middleware_app, path)
+        capture.start()
+        client = TestClient(app)
+
+        client.get("/account/7?fields=id", headers={"Authorization": "Bearer a"})
+        client.get("/account/8", headers={"Authorization": "Bearer a"})
+        client.get("/missing")
+        capture.stop()
+
+        first, second, missing = _records(path)
+        assert first["route"] == "/account/{account_id}"
+        assert first["path"] == "/account/7"
+        assert first["query"] == {"fields": "id"}
+        assert first["status"] == 200
+        assert first["response_bytes"] == len(b'{"id":7}')
+        assert first["duration_ms"] >= 0
+        assert first["caller"] == second["caller"] != "Bearer a"
+        assert missing["route"] is None
+        assert missing["status"] == 404
+
+    def test_callers_are_recorded_by_the_given_identity(self, middleware_app, tmp_path):
+        """Test refreshed tokens of one user are recorded as one caller."""
+        path = tmp_path / "traffic.jsonl"
+        capture = TrafficCapture(str(path))
+        app = middleware_app(
+            TrafficCaptureMiddleware,
+            capture=capture,
+            caller=lambda request: request.headers.get("Authorization", "")[:9],
+        )
+        capture.start()
+        client = TestClient(app)
+
+        client.get("/account/7", headers={"Authorization": "Bearer u1-first"})
+        client.get("/account/7", headers={"Authorization": "Bearer u1-second"})
+        client.get("/account/7", headers={"Authorization": "Bearer u2-first"})
+        client.get("/account/7")
+        capture.stop()
+
+        first, refreshed, other, anonymous = _records(path)
+        assert first["caller"] == refreshed["caller"] != other["caller"]
+        assert anonymous["caller"] is None
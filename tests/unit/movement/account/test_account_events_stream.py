@@ -0,0 +1,99 @@
+import asyncio
+
+from app.id.public.user_by_token import UserByToken
+from app.infra.broadcaster import Broadcaster, Event
+from app.movement.account import _account_events
+from app.movement.account._account_events import get_account_events
+
+USER = UserByToken(id=7, email="owner@example.com", name="Owner")
+RETRY = "retry: 3000\n\n"
+RESET = "event: reset\ndata: {}\n\n"
+
+
+def _broadcaster(monkeypatch, buffer_size=10, max_pending=10) -> Broadcaster:
+    broadcaster = Broadcaster(buffer_size, max_pending)
+    broadcaster.start()
+    monkeypatch.setattr(_account_events, "account_events", broadcaster)
+    monkeypatch.setattr(_account_events, "ACCOUNT_EVENTS_HEARTBEAT_SECONDS", 0.01)
+    return broadcaster
+
+
+def _event(event_id: int, owner_id: int = USER.id) -> Event:
+    return Event(event_id, owner_id, "account_created", {"account_id": event_id})
+
+
+async def _publish(broadcaster: Broadcaster, *events: Event):
+    for event in events:
+        broadcaster.publish(event)
+    # Dispatched on the loop
+    await asyncio.sleep(0)
+
+
+async def _stream(last_event_id: int | None = None):
+    response = await get_account_events(last_event_id=last_event_id, current_user=USER)
+    assert response.media_type == "text/event-stream"
+    return response.body_iterator
+
+
+async def _take(body, count: int) -> list[str]:
+    return [await anext(body) for _ in range(count)]
+
+
+class TestAccountEventStream:
+    """Test cases for the account events stream."""
+
+    async def test_idle_stream_sends_heartbeats(self, monkeypatch):
+        """Test an idle connection gets a comment line every heartbeat."""
+        broadcaster = _broadcaster(monkeypatch)
+        body = await _stream()
+
+        assert await _take(body, 3) == [RETRY, ": heartbeat\n\n", ": heartbeat\n\n"]
+
+        await body.aclose()
+        assert broadcaster.subscriber_count == 0
+
+    async def test_resume_from_last_event_id(self, monkeypatch):
+        """Test a reconnect replays the user's events after Last-Event-ID."""
+        broadcaster = _broadcaster(monkeypatch)
+        broadcaster.mark_complete_after(0)
+        await _publish(broadcaster, _event(1), _event(2), _event(3, owner_id=8))
+        await _publish(broadcaster, _event(4))
+        body = await _stream(last_event_id=1)
+
+        assert await _take(body, 4) == [
+            RETRY,
+            _event(2).encode(),
+            _event(4).encode(),
+            ": heartbeat\n\n",
+        ]
+        await body.aclose()
+
+    async def test_resume_past_the_buffer_resets(self, monkeypatch):
+        """Test a reconnect that missed events is told to reload."""
+        _broadcaster(monkeypatch)
+        body = await _stream(last_event_id=5)
+
+        assert await _take(body, 2) == [RETRY, RESET]
+        await body.aclose()
+
+    async def test_overflow_closes_then_resets(self, monkeypatch):
+        """Test a slow connection is closed and resumes with a reset if it fell off."""
+        broadcaster = _broadcaster(monkeypatch, buffer_size=3, max_pending=2)
+        broadcaster.mark_complete_after(0)
+        await asyncio.sleep(0)
+        body = await _stream()
+        assert await _take(body, 1) == [RETRY]
+
+        await _publish(broadcaster, *[_event(event_id) for event_id in range(1, 7)])
+
+        # The pending events are flushed, then the stream ends
+        assert [chunk async for chunk in body] == [
+            _event(1).encode(),
+            _event(2).encode(),
+        ]
+        assert broadcaster.subscriber_count == 0
+
+        # Event 3 was evicted from the replay buffer before the client came back
+        body = await _stream(last_event_id=2)
+        assert await _take(body, 3) == [RETRY, RESET, _event(4).encode()]
+        await body.aclose()
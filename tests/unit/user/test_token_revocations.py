@@ -0,0 +1,61 @@
+import pytest
+
+from app.id.user import _revocation
+from app.id.user._revocation import TokenRevocations
+from app.infra.metrics import metrics
+
+
+class _Session:
+    """Session whose revocation queries return nothing, or fail."""
+
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+
+    def scalars(self, statement):
+        if self.error:
+            raise self.error
+        return []
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class TestRevocationReadiness:
+    """Test cases for reporting unsynced revocations as not ready."""
+
+    def test_not_ready_until_the_first_sync(self, monkeypatch):
+        """Test the check fails before a sync and while syncs fail."""
+        revocations = TokenRevocations()
+        monkeypatch.setattr(
+            _revocation, "SessionLocal", lambda: _Session(OSError("refused"))
+        )
+        failures = metrics.value("token_revocation_sync_failures_total")
+
+        with pytest.raises(RuntimeError):
+            revocations.check()
+        revocations._sync_once()
+        with pytest.raises(RuntimeError):
+            revocations.check()
+        assert metrics.value("token_revocation_sync_failures_total") == failures + 1
+
+        monkeypatch.setattr(_revocation, "SessionLocal", lambda: _Session())
+        revocations._sync_once()
+        revocations.check()
+
+    def test_not_ready_once_syncs_are_stale(self):
+        """Test the check fails when the last sync is older than allowed."""
+        revocations = TokenRevocations(max_staleness=0.5)
+        revocations.sync(_Session())
+        revocations.check()
+
+        revocations._synced_at -= 1
+
+        assert revocations.sync_age() >= 1
+        with pytest.raises(RuntimeError, match="stale"):
+            revocations.check()